@@ -0,0 +1,62 @@
+"""Benchmark: product export rate and peak memory against table size.
+
+Grows the product table and streams a full CSV export of it twice: once
+timed, for the rows per second, and once under tracemalloc, for the peak
+memory. The peak should stay flat as the table grows, since rows come
+through a server-side cursor a chunk at a time. Not collected by the test
+suite; run with
+
+    pytest benchmarks/bench_export.py -s
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from e_commerce.products.models import Product
+from e_commerce.products.services.exports import CatalogExports
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+SIZES = (20_000, 100_000, 200_000)
+
+
+@pytest.fixture
+def seller(db):
+    return Seller.objects.create(user=User.objects.create_user(username="seller"))
+
+
+class Discard:
+    def write(self, chunk):
+        return len(chunk)
+
+
+def test_product_export(seller):
+    print()  # noqa: T201
+    rows = 0
+    for size in SIZES:
+        Product.objects.bulk_create(
+            (
+                Product(
+                    name=f"SKU {i}",
+                    description=f"Exported product {i}",
+                    price=i % 500,
+                    seller=seller,
+                )
+                for i in range(rows, size)
+            ),
+            batch_size=5000,
+        )
+        rows = size
+        started = time.perf_counter()
+        written = CatalogExports.products().write("csv", Discard())
+        seconds = time.perf_counter() - started
+        tracemalloc.start()
+        CatalogExports.products().write("csv", Discard())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(  # noqa: T201
+            f"  {rows:>7} rows ({written / 2**20:.1f} MiB): "
+            f"{rows / seconds:,.0f} rows/s, peak {peak / 2**10:,.0f} KiB",
+        )
@@ -0,0 +1,87 @@
+"""Benchmark: rendering and parsing a 100-product page as JSON.
+
+Compares DRF's JSONRenderer/JSONParser with the orjson-backed
+OrjsonRenderer/OrjsonParser on real ProductSerializer output. Not collected
+by the test suite; run with
+
+    pytest benchmarks/bench_json_renderer.py -s
+"""
+
+import timeit
+from io import BytesIO
+
+import pytest
+from django.core.files.base import ContentFile
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from e_commerce.products.api.serializers import ProductSerializer
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.utils.parsers import OrjsonParser
+from e_commerce.utils.renderers import OrjsonRenderer
+
+PRODUCTS = 100
+NUMBER = 200
+
+
+@pytest.fixture(autouse=True)
+def _media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture
+def page(db):
+    seller = Seller.objects.create(user=User.objects.create_user(username="bench"))
+    categories = [Category.objects.create(name=f"Category {i}") for i in range(3)]
+    for i in range(PRODUCTS):
+        product = Product.objects.create(
+            name=f"Product {i}",
+            description="A reasonably long product description. " * 5,
+            price=f"{i}.99",
+            seller=seller,
+        )
+        product.categories.set(categories[: 1 + i % 3])
+        for j in range(2):
+            ProductImage.objects.create(
+                product=product,
+                image=ContentFile(f"{i}-{j}".encode(), name="photo.jpg"),
+            )
+    request = APIRequestFactory().get("/api/products/")
+    return ProductSerializer(
+        Product.objects.prefetch_related("images", "categories"),
+        many=True,
+        context={"request": request},
+    ).data
+
+
+def report(label, baseline, candidate):
+    print(  # noqa: T201
+        f"\n{label}: stdlib {baseline * 1e6 / NUMBER:.0f} us, "
+        f"orjson {candidate * 1e6 / NUMBER:.0f} us "
+        f"({baseline / candidate:.1f}x)",
+    )
+
+
+def test_render_product_page(page):
+    assert OrjsonRenderer().render(page) == JSONRenderer().render(page)
+    baseline = timeit.timeit(lambda: JSONRenderer().render(page), number=NUMBER)
+    candidate = timeit.timeit(lambda: OrjsonRenderer().render(page), number=NUMBER)
+    report(f"render {PRODUCTS} products", baseline, candidate)
+
+
+def test_parse_product_page(page):
+    body = JSONRenderer().render(page)
+    baseline = timeit.timeit(
+        lambda: JSONParser().parse(BytesIO(body)),
+        number=NUMBER,
+    )
+    candidate = timeit.timeit(
+        lambda: OrjsonParser().parse(BytesIO(body)),
+        number=NUMBER,
+    )
+    report(f"parse {len(body) // 1024} KiB", baseline, candidate)
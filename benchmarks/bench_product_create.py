@@ -0,0 +1,69 @@
+"""Benchmark: POST /api/products/ with six full-size photos.
+
+Compares sequential image handling (one upload worker) with the thread pool
+used by ProductImageUploads. Not collected by the test suite; run with
+
+    pytest benchmarks/bench_product_create.py -s
+"""
+
+import statistics
+import time
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+ROUNDS = 5
+IMAGE_SIZE = (2400, 1800)
+
+
+@pytest.fixture(autouse=True)
+def _media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture(scope="module")
+def photo():
+    noise = Image.effect_noise(IMAGE_SIZE, 64).convert("RGB")
+    buffer = BytesIO()
+    noise.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client(db):
+    seller = Seller.objects.create(user=User.objects.create_user(username="bench"))
+    client = APIClient()
+    client.force_authenticate(user=seller.user)
+    return client
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_create_with_six_images(client, photo, settings, workers):
+    settings.PRODUCT_IMAGE_UPLOAD_WORKERS = workers
+    timings = []
+    for _ in range(ROUNDS):
+        images = [
+            SimpleUploadedFile(f"photo{i}.jpg", photo, content_type="image/jpeg")
+            for i in range(6)
+        ]
+        started = time.perf_counter()
+        response = client.post(
+            reverse("api:product-list"),
+            {"name": "Bench", "description": "d", "price": "1.00", "images": images},
+            format="multipart",
+        )
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 201  # noqa: PLR2004
+
+    median_ms = statistics.median(timings) * 1000
+    print(  # noqa: T201
+        f"\n{workers} upload worker(s): median {median_ms:.0f} ms over {ROUNDS} "
+        f"rounds ({len(photo) // 1024} KiB JPEG x 6)",
+    )
@@ -0,0 +1,69 @@
+"""Benchmark: product import rate and peak memory against file size.
+
+Writes CSV files of increasing size to disk and imports each twice with
+ProductImporter: once timed, for the rows per second, and once under
+tracemalloc, for the peak memory. The peak should stay flat as the file
+grows. Not collected
+by the test suite; run with
+
+    pytest benchmarks/bench_product_import.py -s
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from e_commerce.products.models import Category
+from e_commerce.products.services.imports import ProductImporter
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+SIZES = (5_000, 20_000, 50_000)
+CATEGORIES = 50
+
+
+@pytest.fixture(autouse=True)
+def _media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture
+def seller(db):
+    Category.objects.bulk_create(
+        Category(name=f"Category {i}") for i in range(CATEGORIES)
+    )
+    return Seller.objects.create(user=User.objects.create_user(username="seller"))
+
+
+def write_csv(path, rows):
+    with path.open("w") as out:
+        out.write("name,description,price,available_quantity,categories\n")
+        for i in range(rows):
+            categories = f"Category {i % CATEGORIES}|Category {(i + 1) % CATEGORIES}"
+            out.write(f"SKU {i},Imported product {i},{i % 500}.99,5,{categories}\n")
+
+
+def run(seller, path):
+    importer = ProductImporter(seller)
+    with path.open("rb") as stream:
+        importer.run(stream, "csv", lambda entry: None)
+    return importer.imported
+
+
+def test_product_import(seller, tmp_path):
+    print()  # noqa: T201
+    for rows in SIZES:
+        path = tmp_path / f"{rows}.csv"
+        write_csv(path, rows)
+        started = time.perf_counter()
+        assert run(seller, path) == rows
+        seconds = time.perf_counter() - started
+        tracemalloc.start()
+        run(seller, path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(  # noqa: T201
+            f"  {rows:>6} rows ({path.stat().st_size / 2**20:.1f} MiB): "
+            f"{rows / seconds:,.0f} rows/s, peak {peak / 2**10:,.0f} KiB",
+        )
@@ -0,0 +1,109 @@
+"""Benchmark: memory and time to build one page of the product list.
+
+Compares ProductSerializer over model instances (the list endpoint before
+it moved to .values() rows), ProductReader rows and ProductCardReader rows
+(?view=card) on products with long descriptions. Peak memory is measured
+with tracemalloc around fetching and serializing the page. Not collected by
+the test suite; run with
+
+    pytest benchmarks/bench_product_list.py -s
+"""
+
+import timeit
+import tracemalloc
+
+import pytest
+from django.db.models import Prefetch
+from rest_framework.test import APIRequestFactory
+
+from e_commerce.products.api.readers import ProductCardReader
+from e_commerce.products.api.readers import ProductReader
+from e_commerce.products.api.serializers import ProductSerializer
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+PRODUCTS = 100
+PAGE_SIZES = (10, 100)
+DESCRIPTION = "A long product description with care instructions. " * 400
+NUMBER = 20
+
+
+@pytest.fixture(autouse=True)
+def _media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture
+def catalog(db):
+    seller = Seller.objects.create(user=User.objects.create_user(username="bench"))
+    categories = [Category.objects.create(name=f"Category {i}") for i in range(3)]
+    for i in range(PRODUCTS):
+        product = Product.objects.create(
+            name=f"Product {i}",
+            description=DESCRIPTION,
+            price=f"{i}.99",
+            seller=seller,
+        )
+        product.categories.set(categories[: 1 + i % 3])
+        ProductImage.objects.bulk_create(
+            ProductImage(
+                product=product,
+                image=f"product_images/{i}-{j}.jpg",
+                renditions={
+                    "webp": {
+                        str(width): f"product_images/renditions/{i}/{width}w.webp"
+                        for width in (160, 320, 640)
+                    },
+                },
+            )
+            for j in range(3)
+        )
+
+
+def serializer_page(request, size):
+    queryset = Product.objects.select_related("seller__user").prefetch_related(
+        Prefetch("images", queryset=ProductImage.objects.order_by("id")),
+        "categories",
+    )
+    return ProductSerializer(
+        queryset.order_by("id")[:size],
+        many=True,
+        context={"request": request},
+    ).data
+
+
+def reader_page(reader_class):
+    def page(request, size):
+        reader = reader_class(request)
+        return reader.read(reader.rows(Product.objects.order_by("id"))[:size])
+
+    return page
+
+
+def measure(build, request, size):
+    build(request, size)  # warm up connections and caches
+    tracemalloc.start()
+    build(request, size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = timeit.timeit(lambda: build(request, size), number=NUMBER) / NUMBER
+    return peak, seconds
+
+
+def test_product_list_page(catalog):
+    request = APIRequestFactory().get("/api/products/")
+    modes = {
+        "serializer": serializer_page,
+        "rows": reader_page(ProductReader),
+        "cards": reader_page(ProductCardReader),
+    }
+    for size in PAGE_SIZES:
+        print(f"\npage of {size} products")  # noqa: T201
+        for name, build in modes.items():
+            peak, seconds = measure(build, request, size)
+            print(  # noqa: T201
+                f"  {name:<10} peak {peak / 1024:8.1f} KiB  {seconds * 1e3:7.2f} ms",
+            )
@@ -0,0 +1,85 @@
+"""Benchmark: UUIDv4 vs UUIDv7 primary keys under sustained inserts.
+
+Inserts ROWS rows in batches into two scratch tables shaped like
+orders_order's key (uuid primary key plus a payload), one keyed with
+uuid.uuid4 and one with utils.ids.uuid7. Reports the insert rate, the WAL
+written and the primary key index size and leaf density (pgstattuple, if
+the extension can be created). Not collected by the test suite; run with
+
+    pytest benchmarks/bench_uuid_keys.py -s
+"""
+
+import time
+import uuid
+
+import pytest
+from django.db import connection
+
+from e_commerce.utils.ids import uuid7
+
+ROWS = 200_000
+BATCH = 1_000
+PAYLOAD = "x" * 100
+
+
+@pytest.fixture
+def cursor(db):
+    with connection.cursor() as cursor:
+        yield cursor
+
+
+def wal_lsn(cursor):
+    cursor.execute("SELECT pg_current_wal_insert_lsn()")
+    return cursor.fetchone()[0]
+
+
+def leaf_density(cursor, index):
+    try:
+        cursor.execute("SAVEPOINT pgstattuple")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pgstattuple")
+        cursor.execute("SELECT avg_leaf_density FROM pgstatindex(%s)", [index])
+        density = cursor.fetchone()[0]
+        cursor.execute("RELEASE SAVEPOINT pgstattuple")
+    except Exception:  # noqa: BLE001
+        cursor.execute("ROLLBACK TO SAVEPOINT pgstattuple")
+        return None
+    return density
+
+
+def run(cursor, name, make_id):
+    table = f"bench_{name}"
+    cursor.execute(f"CREATE TABLE {table} (id uuid PRIMARY KEY, payload text)")
+    values = ", ".join(["(%s, %s)"] * BATCH)
+    start_lsn = wal_lsn(cursor)
+    started = time.perf_counter()
+    for _ in range(ROWS // BATCH):
+        params = []
+        for _ in range(BATCH):
+            params += [make_id(), PAYLOAD]
+        cursor.execute(f"INSERT INTO {table} (id, payload) VALUES {values}", params)  # noqa: S608
+    seconds = time.perf_counter() - started
+    cursor.execute(
+        "SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s), pg_relation_size(%s)",
+        [start_lsn, f"{table}_pkey"],
+    )
+    wal, index_size = cursor.fetchone()
+    return {
+        "rows/s": ROWS / seconds,
+        "WAL MiB": wal / 2**20,
+        "index MiB": index_size / 2**20,
+        "leaf density %": leaf_density(cursor, f"{table}_pkey"),
+    }
+
+
+def test_uuid_keys(cursor):
+    results = {
+        "uuid4": run(cursor, "uuid4", uuid.uuid4),
+        "uuid7": run(cursor, "uuid7", uuid7),
+    }
+    print(f"\n{ROWS} rows in batches of {BATCH}")  # noqa: T201
+    for name, metrics in results.items():
+        line = "  ".join(
+            f"{metric} {value:,.1f}" if value is not None else f"{metric} n/a"
+            for metric, value in metrics.items()
+        )
+        print(f"  {name}: {line}")  # noqa: T201
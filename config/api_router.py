@@ -12,6 +12,7 @@ from e_commerce.users.api.views import (
 
 from e_commerce.products.api.views import (
     ProductViewSet,
+    ProductImportViewSet,
     CategoryViewSet,
 )  # , ProductImageViewSet
 
@@ -34,6 +35,7 @@ seller_router = nested_router_class(router, "sellers")
 seller_router.register("addresses", AddressViewSet, basename="seller-addresses")
 
 router.register("products", ProductViewSet)
+router.register("product-imports", ProductImportViewSet, basename="product-import")
 
 router.register("categories", CategoryViewSet)
 
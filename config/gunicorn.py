@@ -0,0 +1,8 @@
+"""Gunicorn settings for the production image, see compose/production/django/start"""
+
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    # Drop the exited worker's live gauges from the /metrics aggregate.
+    multiprocess.mark_process_dead(worker.pid)
@@ -139,6 +139,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "e_commerce.utils.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -172,6 +173,16 @@ STATICFILES_FINDERS = [
 MEDIA_ROOT = str(APPS_DIR / "media")
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "/media/"
+# https://docs.djangoproject.com/en/dev/ref/settings/#storages
+# Uploads are deduplicated by content hash, see e_commerce.utils.storages.
+STORAGES = {
+    "default": {
+        "BACKEND": "e_commerce.utils.storages.ContentAddressedStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
 
 # TEMPLATES
 # ------------------------------------------------------------------------------
@@ -297,6 +308,18 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
+    # orjson-backed drop-ins for JSONRenderer/JSONParser with identical output;
+    # list rest_framework.renderers.JSONRenderer / parsers.JSONParser instead
+    # to go back to the stdlib json module.
+    "DEFAULT_RENDERER_CLASSES": [
+        "e_commerce.utils.renderers.OrjsonRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "e_commerce.utils.parsers.OrjsonParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -329,6 +352,60 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # vite frontend URL
 ]
 
+# Seconds a resolved Customer/Seller profile stays in the cache
+PROFILE_CACHE_TIMEOUT = env.int("PROFILE_CACHE_TIMEOUT", default=300)
+
+# Days of hourly seller sales rollups kept by compact_sales_rollups
+SALES_ROLLUP_HOURLY_RETENTION_DAYS = env.int(
+    "SALES_ROLLUP_HOURLY_RETENTION_DAYS",
+    default=35,
+)
+
+# Days after which archive_orders moves finished orders into the archive
+ORDER_ARCHIVE_AFTER_DAYS = env.int("ORDER_ARCHIVE_AFTER_DAYS", default=365)
+
+# Share of requests (0 to 1) measured by RequestMetricsMiddleware: query
+# count and time, cache hits, Stripe time and latency, logged per request
+REQUEST_METRICS_SAMPLE_RATE = env.float("REQUEST_METRICS_SAMPLE_RATE", default=0.0)
+# Send the measurements of sampled requests as a Server-Timing header
+REQUEST_METRICS_SERVER_TIMING = env.bool("REQUEST_METRICS_SERVER_TIMING", default=True)
+# Measure every request into the Prometheus histograms served at /metrics.
+# Set PROMETHEUS_MULTIPROC_DIR in the environment to aggregate workers.
+PROMETHEUS_METRICS_ENABLED = env.bool("PROMETHEUS_METRICS_ENABLED", default=False)
+# Bearer token /metrics requires; it is not served without one
+PROMETHEUS_METRICS_TOKEN = env("PROMETHEUS_METRICS_TOKEN", default="")
+
+# Product image renditions generated by generate_image_renditions; formats
+# the installed Pillow cannot encode are skipped.
+PRODUCT_IMAGE_RENDITION_WIDTHS = env.list(
+    "PRODUCT_IMAGE_RENDITION_WIDTHS",
+    cast=int,
+    default=[160, 320, 640, 1024],
+)
+PRODUCT_IMAGE_RENDITION_FORMATS = env.list(
+    "PRODUCT_IMAGE_RENDITION_FORMATS",
+    default=["avif", "webp"],
+)
+PRODUCT_IMAGE_RENDITION_QUALITY = env.int("PRODUCT_IMAGE_RENDITION_QUALITY", default=75)
+# Seconds after which an image claimed by a worker that died is rendered again
+PRODUCT_IMAGE_RENDITION_CLAIM_TIMEOUT = env.int(
+    "PRODUCT_IMAGE_RENDITION_CLAIM_TIMEOUT",
+    default=600,
+)
+# Threads used to decode and store product image uploads
+PRODUCT_IMAGE_UPLOAD_WORKERS = env.int("PRODUCT_IMAGE_UPLOAD_WORKERS", default=4)
+# Largest accepted product image upload, in bytes
+PRODUCT_IMAGE_MAX_UPLOAD_SIZE = env.int(
+    "PRODUCT_IMAGE_MAX_UPLOAD_SIZE",
+    default=10 * 1024 * 1024,
+)
+# Largest accepted width/height of an uploaded product image, in pixels
+PRODUCT_IMAGE_MAX_DIMENSION = env.int("PRODUCT_IMAGE_MAX_DIMENSION", default=8000)
+# Seconds after which an import claimed by a worker that died is taken over
+PRODUCT_IMPORT_CLAIM_TIMEOUT = env.int("PRODUCT_IMPORT_CLAIM_TIMEOUT", default=600)
+# Most products one /api/products/bulk_update/ request may change
+PRODUCT_BULK_UPDATE_MAX_ROWS = env.int("PRODUCT_BULK_UPDATE_MAX_ROWS", default=5000)
+
 # Stripe API Keys
 STRIPE_PUBLISHABLE_KEY = env("STRIPE_PUBLISHABLE_KEY", default="")
 STRIPE_SECRET_KEY = env("STRIPE_SECRET_KEY", default="")
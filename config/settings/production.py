@@ -1,4 +1,6 @@
 # ruff: noqa: E501
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *  # noqa: F403
 from .base import DATABASES
 from .base import INSTALLED_APPS
@@ -67,7 +69,7 @@ SECURE_CONTENT_TYPE_NOSNIFF = env.bool(
 # ------------------------
 STORAGES = {
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "e_commerce.utils.storages.ContentAddressedStorage",
     },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
@@ -162,3 +164,9 @@ SPECTACULAR_SETTINGS["SERVERS"] = [
 ]
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Prometheus
+# Required, so a deployment can never serve /metrics without a token.
+PROMETHEUS_METRICS_TOKEN = env("PROMETHEUS_METRICS_TOKEN")
+if not PROMETHEUS_METRICS_TOKEN:
+    msg = "Set PROMETHEUS_METRICS_TOKEN to a non-empty value."
+    raise ImproperlyConfigured(msg)
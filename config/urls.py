@@ -11,6 +11,7 @@ from drf_spectacular.views import SpectacularSwaggerView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from e_commerce.orders.api.views import StripeWebhookView
+from e_commerce.utils.prometheus import metrics_view
 from django.http import HttpResponse
 
 urlpatterns = [
@@ -58,6 +59,8 @@ urlpatterns += [
     path("api/payments/", include("orders.api.urls")),
     # Stripe webhook
     path("api/stripe/webhook/", StripeWebhookView.as_view(), name="stripe-webhook"),
+    # Prometheus scrape target
+    path("metrics", metrics_view, name="metrics"),
     path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
     path(
         "api/docs/",
@@ -8,12 +8,14 @@ from rest_framework.permissions import BasePermission
 
 from e_commerce.products.models import Product
 from e_commerce.cart.models import Cart, CartItem
+from e_commerce.users.profiles import get_customer
+from e_commerce.utils.prometheus import CART_UPDATES
 from .serializers import CartSerializer
 
 
 class IsCustomer(BasePermission):
     def has_permission(self, request, view):
-        return hasattr(request.user, "customer")
+        return get_customer(request) is not None
 
 
 class CartViewSet(GenericViewSet):
@@ -57,6 +59,7 @@ class CartViewSet(GenericViewSet):
             cart_item.quantity += quantity
             cart_item.save()
 
+        CART_UPDATES.labels("add").inc()
         return Response({"detail": "Product added to cart"}, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["patch"], permission_classes=[IsCustomer])
@@ -84,6 +87,7 @@ class CartViewSet(GenericViewSet):
 
         if int(quantity) <= 0:
             cart_item.delete()
+            CART_UPDATES.labels("remove").inc()
             return Response(
                 {"detail": "Item removed from cart."},
                 status=status.HTTP_200_OK,
@@ -91,6 +95,7 @@ class CartViewSet(GenericViewSet):
 
         cart_item.quantity = int(quantity)
         cart_item.save()
+        CART_UPDATES.labels("update").inc()
         return Response({"detail": "Quantity updated."}, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["delete"], permission_classes=[IsCustomer])
@@ -116,6 +121,7 @@ class CartViewSet(GenericViewSet):
             )
 
         cart_item.delete()
+        CART_UPDATES.labels("remove").inc()
         return Response(
             {"detail": "Item removed from cart."},
             status=status.HTTP_200_OK,
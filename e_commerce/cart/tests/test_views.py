@@ -6,7 +6,6 @@ from e_commerce.cart.api.views import CartViewSet
 from e_commerce.products.models import Category
 from e_commerce.products.models import Product
 from e_commerce.users.models import Customer
-from e_commerce.users.models import Seller
 from e_commerce.users.models import User
 
 
@@ -29,11 +28,6 @@ def customer(user):
     return Customer.objects.create(user=user)
 
 
-@pytest.fixture
-def seller(user):
-    return Seller.objects.create(user=user, shop_name="Shop", shop_description="Desc")
-
-
 @pytest.fixture
 def category(db):
     return Category.objects.create(name="Electronics")
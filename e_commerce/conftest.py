@@ -1,5 +1,7 @@
 import pytest
+from django.core.cache import cache
 
+from e_commerce.users.models import Seller
 from e_commerce.users.models import User
 from e_commerce.users.tests.factories import UserFactory
 
@@ -9,6 +11,19 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # Profiles, catalog versions and product lists are cached across requests.
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()
+
+
+@pytest.fixture
+def seller(user) -> Seller:
+    return Seller.objects.create(user=user, shop_name="Shop", shop_description="Desc")
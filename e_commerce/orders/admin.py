@@ -1,41 +1,63 @@
 from django.contrib import admin
 
+from e_commerce.utils.admin import LargeTableAdmin
+from e_commerce.utils.admin import RelatedIdFilter
+
 from .models import Order
 from .models import OrderItem
 from .models import Payment
 from .models import SellerPayout
 
+# Changelists are ordered newest first by (created_at, id), served by an
+# index on each table; ids alone would not do, as legacy uuid4 Order ids
+# sort among the time-ordered uuid7 ones. Searches are an exact order
+# number, found through its unique index; customers and sellers are picked
+# with the id filters.
+
 
 @admin.register(Order)
-class OrderAdmin(admin.ModelAdmin):
+class OrderAdmin(LargeTableAdmin):
     """Admin panel for Orders."""
 
-    list_display = ("id", "customer", "created_at", "status")
-    list_filter = ("status", "created_at")
-    search_fields = ("customer__user__username", "customer__user__email")
-    ordering = ("-created_at",)
+    list_display = ("id", "order_number", "customer", "created_at", "status")
+    list_select_related = ("customer__user",)
+    list_filter = ("status", "created_at", ("customer", RelatedIdFilter))
+    search_fields = ("order_number__exact",)
+    raw_id_fields = ("customer", "shipping_address")
+    ordering = ("-created_at", "-id")
 
 
 @admin.register(OrderItem)
-class OrderItemAdmin(admin.ModelAdmin):
+class OrderItemAdmin(LargeTableAdmin):
     """Admin panel for OrderItems."""
 
     list_display = ("id", "order", "product", "quantity")
-    list_filter = ("order", "product")
-    search_fields = ("order__customer__user__username", "product__name")
+    list_select_related = ("order__customer__user", "product")
+    list_filter = (
+        "seller_status",
+        ("order", RelatedIdFilter),
+        ("product", RelatedIdFilter),
+        ("seller", RelatedIdFilter),
+    )
+    search_fields = ("order__order_number__exact",)
+    raw_id_fields = ("order", "product", "seller")
+    ordering = ("-created_at", "-id")
 
 
 @admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class PaymentAdmin(LargeTableAdmin):
     """Admin panel for Payments."""
 
     list_display = ("id", "order", "status", "created_at")
+    list_select_related = ("order__customer__user",)
     list_filter = ("status",)
-    search_fields = ("order__customer__user__username",)
+    search_fields = ("order__order_number__exact",)
+    raw_id_fields = ("order",)
+    ordering = ("-created_at", "-id")
 
 
 @admin.register(SellerPayout)
-class SellerPayoutAdmin(admin.ModelAdmin):
+class SellerPayoutAdmin(LargeTableAdmin):
     """Admin panel for SellerPayouts."""
 
     list_display = (
@@ -47,5 +69,12 @@ class SellerPayoutAdmin(admin.ModelAdmin):
         "created_at",
         "processed_at",
     )
-    list_filter = ("status", "created_at")
-    search_fields = ("seller__user__username", "order_item__order__order_number")
+    list_select_related = (
+        "seller__user",
+        "order_item__product",
+        "order_item__order",
+    )
+    list_filter = ("status", "created_at", ("seller", RelatedIdFilter))
+    search_fields = ("order_item__order__order_number__exact",)
+    raw_id_fields = ("seller", "order_item")
+    ordering = ("-created_at", "-id")
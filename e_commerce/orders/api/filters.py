@@ -0,0 +1,23 @@
+import django_filters
+
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+
+
+class OrderItemFilter(django_filters.FilterSet):
+    status = django_filters.ChoiceFilter(
+        field_name="seller_status",
+        choices=Order.ORDER_STATUS_CHOICES,
+    )
+    created_after = django_filters.IsoDateTimeFilter(
+        field_name="created_at",
+        lookup_expr="gte",
+    )
+    created_before = django_filters.IsoDateTimeFilter(
+        field_name="created_at",
+        lookup_expr="lt",
+    )
+
+    class Meta:
+        model = OrderItem
+        fields = ["status", "created_after", "created_before"]
@@ -1,3 +1,6 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -6,27 +9,93 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from e_commerce.cart.models import Cart
+from e_commerce.orders.models import ArchivedOrder
 from e_commerce.orders.models import Order
 from e_commerce.orders.models import OrderItem
+from e_commerce.orders.services.archive import OrderArchive
+from e_commerce.users.profiles import get_customer
+from e_commerce.utils.prometheus import ORDERS_CREATED
 
+from .pagination import NewestFirstCursorPagination
+from .readers import OrderReader
 from .serializers import OrderSerializer
 
 
 class OrderViewSet(viewsets.ModelViewSet):
-    """CRUD for Orders"""
+    """
+    CRUD for Orders. Orders moved to the archive by archive_orders are
+    listed by the archived action and still served by retrieve and
+    by_number, read only.
+    """
 
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstCursorPagination
 
     def get_queryset(self):
-        if not hasattr(self.request.user, "customer"):
+        customer = get_customer(self.request)
+        if customer is None:
             return Order.objects.none()
-        return Order.objects.filter(customer=self.request.user.customer)
+        queryset = Order.objects.filter(customer=customer)
+        if self.action in ("retrieve", "by_number"):
+            queryset = OrderSerializer.setup_eager_loading(queryset)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        # Plain rows instead of OrderSerializer; same output.
+        page = self.paginate_queryset(
+            OrderReader.rows(self.filter_queryset(self.get_queryset())),
+        )
+        return self.get_paginated_response(OrderReader().read(page))
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            return self.archived_response(id=kwargs["pk"])
+
+    def archived_response(self, **lookup):
+        """The archived order matching lookup, or 404"""
+        try:
+            document = OrderArchive.document(get_customer(self.request), **lookup)
+        except (DjangoValidationError, ValueError):
+            document = None
+        if document is None:
+            raise Http404
+        return Response(document)
+
+    @action(detail=False, methods=["get"])
+    def archived(self, request):
+        """The customer's archived orders, newest first."""
+        customer = get_customer(request)
+        queryset = ArchivedOrder.objects.filter(customer=customer)
+        if customer is None:
+            queryset = queryset.none()
+        page = self.paginate_queryset(
+            queryset.values("id", "created_at", "document"),
+        )
+        return self.get_paginated_response([row["document"] for row in page])
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"number/(?P<order_number>[\w-]+)",
+    )
+    def by_number(self, request, order_number=None):
+        """Look up one of the customer's orders by its order number."""
+        order = self.get_queryset().filter(order_number=order_number).first()
+        if order is None:
+            return self.archived_response(order_number=order_number)
+        return Response(self.get_serializer(order).data)
 
     def perform_create(self, serializer):
         user = self.request.user
         cart = get_object_or_404(Cart, customer=user.customer)
-        cart_items = cart.items.all()
+        # Items are created in product order, so row locks taken per product
+        # are acquired in the same order by every checkout and cannot deadlock.
+        cart_items = cart.items.select_related("product__seller").order_by(
+            "product_id",
+        )
 
         if not cart_items.exists():
             msg = "Cart is empty."
@@ -72,6 +141,7 @@ class OrderViewSet(viewsets.ModelViewSet):
 
         # clear cart
         cart_items.delete()
+        transaction.on_commit(ORDERS_CREATED.inc)
 
     @action(detail=True, methods=["post"], url_path="checkout")
     def checkout(self, request, pk=None):
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class NewestFirstCursorPagination(CursorPagination):
+    """
+    Keyset pagination for order histories and feeds, so deep pages cost the
+    same as the first one. Ties on created_at are broken by id.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
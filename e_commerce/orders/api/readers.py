@@ -0,0 +1,165 @@
+from collections import defaultdict
+
+from e_commerce.orders.models import OrderItem
+from e_commerce.utils.rows import decimal_string
+from e_commerce.utils.rows import iso_datetime
+from e_commerce.utils.rows import row_reader
+
+ADDRESS_FIELDS = ("id", "street", "city", "state", "country", "postal_code")
+PAYMENT_FIELDS = (
+    "stripe_payment_intent_id",
+    "amount",
+    "currency",
+    "status",
+    "stripe_metadata",
+    "created_at",
+    "updated_at",
+)
+
+
+def _line_fields():
+    """OrderLineSerializer fields, read from OrderItem columns"""
+    money = decimal_string(2)
+    moment = iso_datetime()
+    return [
+        ("id", "id", None),
+        ("product", "product_id", None),
+        ("product_name", "product__name", None),
+        ("seller", "seller_id", None),
+        ("seller_name", "seller__user__username", None),
+        ("quantity", "quantity", None),
+        ("price_at_time", "price_at_time", money),
+        # OrderItem.total_price, which the serializer returns unformatted.
+        ("total_price", "total_price", None),
+        ("seller_status", "seller_status", None),
+        ("stripe_transfer_id", "stripe_transfer_id", None),
+        ("seller_payout_amount", "seller_payout_amount", money),
+        ("created_at", "created_at", moment),
+        ("updated_at", "updated_at", moment),
+    ]
+
+
+LINE_COLUMNS = tuple(
+    column for _, column, _ in _line_fields() if column != "total_price"
+)
+
+
+def _with_total_price(row):
+    row["total_price"] = row["price_at_time"] * row["quantity"]
+    return row
+
+
+class OrderItemReader:
+    """
+    Read side of OrderItemSerializer over ``.values()`` rows, for the seller
+    order feed. The shipping address comes from the same query.
+    """
+
+    columns = LINE_COLUMNS + tuple(
+        f"order__shipping_address__{field}" for field in ADDRESS_FIELDS
+    )
+
+    def __init__(self):
+        self.item = row_reader(_line_fields())
+        self.address = row_reader(
+            (field, f"order__shipping_address__{field}", None)
+            for field in ADDRESS_FIELDS
+        )
+
+    @classmethod
+    def rows(cls, queryset):
+        return queryset.values(*cls.columns)
+
+    def read(self, rows):
+        data = []
+        for row in rows:
+            item = self.item(_with_total_price(row))
+            item["shipping_address"] = self.address(row)
+            data.append(item)
+        return data
+
+
+class OrderReader:
+    """
+    Read side of OrderSerializer over ``.values()`` rows, for order lists.
+    Customer, shipping address and payment are joined into the page query
+    and the items of the whole page are read with one more query.
+    """
+
+    columns = (
+        "id",
+        "order_number",
+        "customer_id",
+        "customer__user__username",
+        "total_amount",
+        "platform_commission",
+        "status",
+        "payment_status",
+        "shipping_address_id",
+        "shipping_cost",
+        "created_at",
+        "updated_at",
+        *(f"shipping_address__{field}" for field in ADDRESS_FIELDS),
+        "payment__id",
+        *(f"payment__{field}" for field in PAYMENT_FIELDS),
+    )
+
+    def __init__(self):
+        money = decimal_string(2)
+        moment = iso_datetime()
+        self.order = row_reader(
+            [
+                ("id", "id", str),
+                ("order_number", "order_number", None),
+                ("customer", "customer_id", None),
+                ("customer_name", "customer__user__username", None),
+                ("total_amount", "total_amount", money),
+                ("platform_commission", "platform_commission", money),
+                ("status", "status", None),
+                ("payment_status", "payment_status", None),
+                ("shipping_address", "shipping_address_id", None),
+                ("shipping_cost", "shipping_cost", money),
+                ("created_at", "created_at", moment),
+                ("updated_at", "updated_at", moment),
+            ],
+        )
+        self.address = row_reader(
+            (field, f"shipping_address__{field}", None) for field in ADDRESS_FIELDS
+        )
+        self.payment = row_reader(
+            [
+                ("stripe_payment_intent_id", "payment__stripe_payment_intent_id", None),
+                ("amount", "payment__amount", money),
+                ("currency", "payment__currency", None),
+                ("status", "payment__status", None),
+                ("stripe_metadata", "payment__stripe_metadata", None),
+                ("created_at", "payment__created_at", moment),
+                ("updated_at", "payment__updated_at", moment),
+            ],
+        )
+        self.line = row_reader(_line_fields())
+
+    @classmethod
+    def rows(cls, queryset):
+        return queryset.values(*cls.columns)
+
+    def read(self, rows):
+        rows = list(rows)
+        lines = defaultdict(list)
+        for row in (
+            OrderItem.objects.filter(order_id__in=[row["id"] for row in rows])
+            .order_by("id")
+            .values("order_id", *LINE_COLUMNS)
+        ):
+            lines[row["order_id"]].append(self.line(_with_total_price(row)))
+
+        data = []
+        for row in rows:
+            order = self.order(row)
+            address = self.address(row)
+            order["items"] = [
+                {**line, "shipping_address": address} for line in lines[row["id"]]
+            ]
+            order["payment"] = None if row["payment__id"] is None else self.payment(row)
+            data.append(order)
+        return data
@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from e_commerce.orders.models import Order
@@ -10,7 +11,11 @@ class OrderItemSerializer(serializers.ModelSerializer):
     total_price = serializers.SerializerMethodField(read_only=True)
     product_name = serializers.CharField(source="product.name", read_only=True)
     seller_name = serializers.CharField(source="seller.user.username", read_only=True)
-    shipping_address = serializers.SerializerMethodField(read_only=True)
+    # Declared once for the whole list instead of a serializer per row.
+    shipping_address = AddressSerializer(
+        source="order.shipping_address",
+        read_only=True,
+    )
 
     class Meta:
         model = OrderItem
@@ -43,11 +48,21 @@ class OrderItemSerializer(serializers.ModelSerializer):
     def get_total_price(self, obj):
         return obj.total_price
 
-    def get_shipping_address(self, obj):
-        order = getattr(obj, "order", None)
-        if order and order.shipping_address:
-            return AddressSerializer(order.shipping_address).data
-        return None
+
+class OrderLineSerializer(OrderItemSerializer):
+    """
+    OrderItem nested inside an order. The shipping address is the order's,
+    so OrderSerializer serializes it once and adds it to every line.
+    """
+
+    shipping_address = None
+
+    class Meta(OrderItemSerializer.Meta):
+        fields = [
+            field
+            for field in OrderItemSerializer.Meta.fields
+            if field != "shipping_address"
+        ]
 
 
 class PaymentSerializer(serializers.ModelSerializer):
@@ -71,9 +86,12 @@ class PaymentSerializer(serializers.ModelSerializer):
 
 
 class OrderSerializer(serializers.ModelSerializer):
-    items = OrderItemSerializer(many=True, read_only=True)
+    items = OrderLineSerializer(many=True, read_only=True)
     payment = PaymentSerializer(read_only=True)
-    customer_name = serializers.CharField(source="customer.username", read_only=True)
+    customer_name = serializers.CharField(
+        source="customer.user.username",
+        read_only=True,
+    )
     shipping_address = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
@@ -107,6 +125,37 @@ class OrderSerializer(serializers.ModelSerializer):
             "payment",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load everything the serializer reads in a fixed number of queries."""
+        return queryset.select_related(
+            "customer__user",
+            "shipping_address",
+            "payment",
+        ).prefetch_related(
+            Prefetch(
+                "items",
+                queryset=OrderItem.objects.select_related("product", "seller__user"),
+            ),
+        )
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        shipping_address = AddressSerializer(instance.shipping_address).data
+        for item in data["items"]:
+            item["shipping_address"] = shipping_address
+        return data
+
+
+class SalesPointSerializer(serializers.Serializer):
+    """One bucket of a seller analytics time series"""
+
+    bucket = serializers.DateTimeField()
+    units = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    earnings = serializers.DecimalField(max_digits=14, decimal_places=2)
+    payouts = serializers.DecimalField(max_digits=14, decimal_places=2)
+
 
 class OrderCreateSerializer(serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, write_only=True)
@@ -1,3 +1,5 @@
+import time
+
 from django.db import transaction
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
@@ -14,6 +16,8 @@ from e_commerce.orders.models import Order
 from e_commerce.orders.models import Payment
 from e_commerce.orders.models import SellerPayout
 from e_commerce.orders.services.stripe_service import StripeService
+from e_commerce.utils.prometheus import SELLER_PAYOUTS
+from e_commerce.utils.prometheus import STRIPE_WEBHOOK_LAG
 
 
 @api_view(["POST"])
@@ -229,6 +233,9 @@ class StripeWebhookView(View):
             elif event["type"] == "charge.dispute.created":
                 self.handle_chargeback(event["data"]["object"])
 
+            STRIPE_WEBHOOK_LAG.labels(event["type"]).observe(
+                max(time.time() - event["created"], 0),
+            )
             return HttpResponse(status=200)
 
         except Exception as e:  # noqa: BLE001
@@ -319,6 +326,7 @@ class StripeWebhookView(View):
                     stripe_transfer_id=transfer.id,
                     status="succeeded",
                 )
+                SELLER_PAYOUTS.labels("succeeded").inc()
             except Exception as e:  # noqa: BLE001
                 print(f"Failed to process payout for item {item.id}: {e!s}")  # noqa: T201
                 SellerPayout.objects.create(
@@ -328,3 +336,4 @@ class StripeWebhookView(View):
                     stripe_transfer_id="",
                     status="failed",
                 )
+                SELLER_PAYOUTS.labels("failed").inc()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class OrdersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "e_commerce.orders"
+
+    def ready(self):
+        import e_commerce.orders.signals  # noqa: F401
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from e_commerce.orders.services.archive import OrderArchive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move delivered, cancelled and refunded orders older than the archive "
+        "horizon into the monthly partitions of the order archive."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.ORDER_ARCHIVE_AFTER_DAYS,
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the orders that would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than_days"] < 1:
+            msg = "--older-than-days must be at least 1."
+            raise CommandError(msg)
+        before = timezone.now() - timedelta(days=options["older_than_days"])
+        if options["dry_run"]:
+            count = OrderArchive.archivable(before).count()
+            self.stdout.write(f"{count} orders would be archived.")
+            return
+        count = OrderArchive.archive(before, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {count} orders."))
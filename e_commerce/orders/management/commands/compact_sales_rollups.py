@@ -0,0 +1,66 @@
+from datetime import UTC
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from e_commerce.orders.services.rollups import SalesRollups
+from e_commerce.orders.services.rollups import bucket_start
+
+
+class Command(BaseCommand):
+    help = (
+        "Nightly seller sales rollup maintenance: prune expired hourly rows and "
+        "re-derive recent daily rows. --backfill-from rebuilds older history."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hourly-retention-days",
+            type=int,
+            default=settings.SALES_ROLLUP_HOURLY_RETENTION_DAYS,
+        )
+        parser.add_argument(
+            "--rebuild-days",
+            type=int,
+            default=2,
+            help="Number of past days to re-derive besides today.",
+        )
+        parser.add_argument(
+            "--backfill-from",
+            help="Rebuild daily rollups from this date (YYYY-MM-DD) and hourly "
+            "rollups for the retention window.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        if options["backfill_from"]:
+            since = parse_date(options["backfill_from"])
+            if since is None:
+                msg = "--backfill-from must be a YYYY-MM-DD date."
+                raise CommandError(msg)
+            until = bucket_start(now, "day") + timedelta(days=1)
+            start = datetime.combine(since, time.min, tzinfo=UTC)
+            days = SalesRollups.rebuild("day", start, until)
+            hours = SalesRollups.rebuild(
+                "hour",
+                now - timedelta(days=options["hourly_retention_days"]),
+                until,
+            )
+            self.stdout.write(f"Backfilled {days} daily and {hours} hourly rows.")
+
+        pruned, rebuilt = SalesRollups.compact(
+            now,
+            hourly_retention_days=options["hourly_retention_days"],
+            rebuild_days=options["rebuild_days"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pruned {pruned} hourly rows, rebuilt {rebuilt} daily rows.",
+            ),
+        )
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from e_commerce.orders.services.deltas import SalesDeltas
+
+
+class Command(BaseCommand):
+    help = (
+        "Background worker that applies queued order and payout changes to "
+        "the seller earnings ledger and sales rollups. Runs until stopped "
+        "unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1,
+            help="Seconds to sleep when there is nothing to apply.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        drained = 0
+        while True:
+            count = SalesDeltas.drain(batch_size=options["batch_size"])
+            drained += count
+            if count:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+        self.stdout.write(self.style.SUCCESS(f"Applied {drained} deltas."))
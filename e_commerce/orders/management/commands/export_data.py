@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.services.exports import OrderExports
+from e_commerce.products.models import Product
+from e_commerce.products.services.exports import CatalogExports
+from e_commerce.users.models import Seller
+from e_commerce.utils.exports import CONTENT_TYPES
+from e_commerce.utils.exports import EXPORT_CHUNK_SIZE
+
+EXPORTS = {
+    "products": (CatalogExports.products, Product),
+    "order-items": (OrderExports.order_items, OrderItem),
+    "payouts": (OrderExports.payouts, SellerPayout),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a full export of products, order items or seller payouts as "
+        "CSV or NDJSON, reading the table through a server-side cursor."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("export", choices=list(EXPORTS))
+        parser.add_argument("--format", choices=list(CONTENT_TYPES), default="csv")
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="File to write the export to. Defaults to stdout.",
+        )
+        parser.add_argument("--seller", help="Only export rows of this seller.")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        make_export, model = EXPORTS[options["export"]]
+        queryset = model.objects.all()
+        if options["seller"]:
+            seller = Seller.objects.filter(user__username=options["seller"]).first()
+            if seller is None:
+                msg = f"No seller named {options['seller']}."
+                raise CommandError(msg)
+            queryset = queryset.filter(seller=seller)
+        export = make_export(queryset)
+        export.chunk_size = options["chunk_size"]
+
+        if options["output"] == "-":
+            export.write(options["format"], sys.stdout.buffer)
+            return
+        path = Path(options["output"])
+        with path.open("wb") as out:
+            written = export.write(options["format"], out)
+        self.stderr.write(
+            self.style.SUCCESS(f"Wrote {written / 2**20:.1f} MiB to {path}."),
+        )
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from e_commerce.orders.services.earnings import EarningsLedger
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill or rebuild the seller earnings ledger from SellerPayout and "
+        "OrderItem rows, including archived orders."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seller",
+            action="append",
+            type=int,
+            dest="seller_ids",
+            help="Only rebuild this seller id (repeatable). Defaults to all.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rows = EarningsLedger.rebuild(
+            seller_ids=options["seller_ids"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} ledger rows."))
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.11 on 2026-10-19 17:54
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking writes on the order items table.
+    atomic = False
+
+    dependencies = [
+        ('orders', '0001_initial'),
+        ('products', '0002_product_available_quantity'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='orderitem',
+            index=models.Index(fields=['seller', 'created_at'], name='orderitem_seller_created_idx'),
+        ),
+    ]
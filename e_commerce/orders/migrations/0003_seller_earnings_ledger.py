@@ -0,0 +1,38 @@
+# Generated by Django 5.0.11 on 2026-10-19 17:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_orderitem_seller_created_idx'),
+        ('products', '0002_product_available_quantity'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerEarnings',
+            fields=[
+                ('seller', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='earnings', serialize=False, to='users.seller')),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SellerProductEarnings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seller_earnings', to='products.product')),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_earnings', to='users.seller')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='sellerproductearnings',
+            constraint=models.UniqueConstraint(fields=('seller', 'product'), name='unique_seller_product_earnings'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.11 on 2026-10-19 17:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_seller_earnings_ledger'),
+        ('products', '0002_product_available_quantity'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerSalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket', models.DateTimeField()),
+                ('units', models.BigIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('earnings', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('payouts', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sales_rollups', to='products.product')),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_rollups', to='users.seller')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='sellersalesrollup',
+            constraint=models.UniqueConstraint(fields=('seller', 'granularity', 'bucket', 'product'), name='unique_seller_sales_rollup', nulls_distinct=False),
+        ),
+    ]
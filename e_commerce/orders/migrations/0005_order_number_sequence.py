@@ -0,0 +1,37 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_seller_sales_rollup'),
+    ]
+
+    operations = [
+        # Order numbers come from a sequence instead of random characters:
+        # collision free, ascending (appends to the right of the unique index)
+        # and allocated inside the INSERT, see Order.order_number.
+        migrations.RunSQL(
+            """
+            CREATE SEQUENCE orders_order_number_seq;
+            CREATE FUNCTION next_order_number() RETURNS varchar
+            LANGUAGE sql VOLATILE AS $$
+                SELECT 'ORD-'
+                    || to_char(statement_timestamp() AT TIME ZONE 'UTC', 'YYYYMMDD')
+                    || '-' || lpad(n::text, greatest(6, length(n::text)), '0')
+                FROM nextval('orders_order_number_seq') AS n
+            $$;
+            """,
+            """
+            DROP FUNCTION next_order_number();
+            DROP SEQUENCE orders_order_number_seq;
+            """,
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='order_number',
+            field=models.CharField(db_default=models.Func(function='next_order_number', output_field=models.CharField()), editable=False, max_length=100, unique=True),
+        ),
+    ]
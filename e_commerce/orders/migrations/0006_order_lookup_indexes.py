@@ -0,0 +1,25 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:29
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking writes on the orders table.
+    atomic = False
+
+    dependencies = [
+        ('orders', '0005_order_number_sequence'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['stripe_payment_intent_id'], name='order_payment_intent_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['customer', '-created_at', '-id'], name='order_customer_created_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:32
+
+import e_commerce.utils.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0006_order_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='id',
+            field=models.UUIDField(default=e_commerce.utils.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:36
+
+import django.core.serializers.json
+import django.db.models.deletion
+import rest_framework.utils.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_order_uuid7_pk'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        # Range partitioned by created_at; the monthly partitions are created
+        # by archive_orders as it needs them (services.archive). Postgres
+        # requires the partition key in the primary key.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    """
+                    CREATE TABLE orders_archivedorder (
+                        id uuid NOT NULL,
+                        order_number varchar(100) NOT NULL,
+                        customer_id bigint NOT NULL
+                            REFERENCES users_customer (id) DEFERRABLE INITIALLY DEFERRED,
+                        created_at timestamptz NOT NULL,
+                        archived_at timestamptz NOT NULL,
+                        document jsonb NOT NULL,
+                        payouts jsonb NOT NULL,
+                        PRIMARY KEY (id, created_at)
+                    ) PARTITION BY RANGE (created_at);
+                    CREATE INDEX archivedorder_customer_idx
+                        ON orders_archivedorder (customer_id, created_at DESC, id DESC);
+                    CREATE INDEX archivedorder_number_idx
+                        ON orders_archivedorder (order_number);
+                    """,
+                    "DROP TABLE orders_archivedorder;",
+                ),
+            ],
+            state_operations=[
+                migrations.CreateModel(
+                    name='ArchivedOrder',
+                    fields=[
+                        ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                        ('order_number', models.CharField(editable=False, max_length=100)),
+                        ('created_at', models.DateTimeField()),
+                        ('archived_at', models.DateTimeField()),
+                        ('document', models.JSONField(encoder=rest_framework.utils.encoders.JSONEncoder)),
+                        ('payouts', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                        ('customer', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders', to='users.customer')),
+                    ],
+                    options={
+                        'ordering': ['-created_at'],
+                        'indexes': [
+                            models.Index(fields=['customer', '-created_at', '-id'], name='archivedorder_customer_idx'),
+                            models.Index(fields=['order_number'], name='archivedorder_number_idx'),
+                        ],
+                    },
+                ),
+            ],
+        ),
+        # Relational views of the archived documents for the earnings ledger
+        # and sales rollup rebuilds.
+        migrations.RunSQL(
+            """
+            CREATE VIEW orders_archivedorderline AS
+            SELECT (line ->> 'id')::bigint AS id,
+                   archived.id AS order_id,
+                   archived.created_at AS order_created_at,
+                   (line ->> 'product')::bigint AS product_id,
+                   (line ->> 'seller')::bigint AS seller_id,
+                   (line ->> 'quantity')::integer AS quantity,
+                   (line ->> 'price_at_time')::numeric(10, 2) AS price_at_time,
+                   (line ->> 'seller_payout_amount')::numeric(10, 2) AS seller_payout_amount,
+                   (line ->> 'created_at')::timestamptz AS created_at
+            FROM orders_archivedorder AS archived
+            CROSS JOIN LATERAL jsonb_array_elements(archived.document -> 'items') AS line;
+            CREATE VIEW orders_archivedpayout AS
+            SELECT (payout ->> 'id')::bigint AS id,
+                   archived.id AS order_id,
+                   archived.created_at AS order_created_at,
+                   (payout ->> 'seller_id')::bigint AS seller_id,
+                   (payout ->> 'amount')::numeric(10, 2) AS amount,
+                   payout ->> 'status' AS status,
+                   (payout ->> 'created_at')::timestamptz AS created_at
+            FROM orders_archivedorder AS archived
+            CROSS JOIN LATERAL jsonb_array_elements(archived.payouts) AS payout;
+            """,
+            """
+            DROP VIEW orders_archivedpayout;
+            DROP VIEW orders_archivedorderline;
+            """,
+        ),
+        migrations.CreateModel(
+            name='ArchivedOrderLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_created_at', models.DateTimeField()),
+                ('quantity', models.PositiveIntegerField()),
+                ('price_at_time', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('seller_payout_amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'orders_archivedorderline',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedPayout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_created_at', models.DateTimeField()),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('status', models.CharField(max_length=20)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'orders_archivedpayout',
+                'managed': False,
+            },
+        ),
+    ]
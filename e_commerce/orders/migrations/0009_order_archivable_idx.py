@@ -0,0 +1,20 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:37
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking writes on the orders table.
+    atomic = False
+
+    dependencies = [
+        ('orders', '0008_archived_orders'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status__in', ('delivered', 'cancelled', 'refunded'))), fields=['created_at'], name='order_archivable_idx'),
+        ),
+    ]
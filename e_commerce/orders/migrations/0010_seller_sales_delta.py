@@ -0,0 +1,30 @@
+# Generated by Django 5.0.11 on 2026-10-19 19:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0009_order_archivable_idx'),
+        ('products', '0007_productimage_renditions_claimed_at'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerSalesDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('occurred_at', models.DateTimeField()),
+                ('earnings', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('payouts', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('product', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='products.product')),
+                ('seller', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='users.seller')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['seller', 'product'], name='salesdelta_seller_product_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.11 on 2026-10-19 19:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0010_seller_sales_delta'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sellersalesdelta',
+            name='revenue',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='sellersalesdelta',
+            name='units',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.11 on 2026-10-19 19:51
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking writes on the order tables.
+    atomic = False
+
+    dependencies = [
+        ('orders', '0011_sales_delta_rollup_amounts'),
+        ('products', '0007_productimage_renditions_claimed_at'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['-created_at', '-id'], name='order_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='orderitem',
+            index=models.Index(fields=['-created_at', '-id'], name='orderitem_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='payment',
+            index=models.Index(fields=['-created_at', '-id'], name='payment_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='sellerpayout',
+            index=models.Index(fields=['-created_at', '-id'], name='sellerpayout_created_idx'),
+        ),
+    ]
@@ -8,16 +8,38 @@ from django.db.models import (  # noqa: I001
     CharField,
     UUIDField,
     JSONField,
+    Index,
+    UniqueConstraint,
+    BigIntegerField,
+    Func,
+    Q,
     CASCADE,
     PROTECT,
+    DO_NOTHING,
 )
-from django.utils import timezone
-import uuid
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.utils.encoders import JSONEncoder
 from e_commerce.products.models import Product
 from e_commerce.users.models import Customer, Seller, Address
+from e_commerce.utils.ids import uuid7
+
+# Order statuses after which an order no longer changes; archive_orders
+# only moves orders in one of them.
+FINISHED_STATUSES = ("delivered", "cancelled", "refunded")
 
 
 class Order(Model):
+    """
+    A customer's checkout of their cart, with one OrderItem per product.
+
+    Order numbers are the UTC date of the order plus the next value of a
+    single Postgres sequence, which does not restart each day: they ascend
+    within a day and across days, but a day's first order is not 000001. A
+    per-day counter row would have to stay locked from the INSERT to the
+    end of the request transaction, so concurrent checkouts would wait for
+    each other; nextval() never blocks.
+    """
+
     ORDER_STATUS_CHOICES = [
         ("pending", "Pending"),
         ("processing", "Processing"),
@@ -36,13 +58,22 @@ class Order(Model):
         ("refunded", "Refunded"),
     ]
 
-    id = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered so new orders append to the primary key index.
+    id = UUIDField(primary_key=True, default=uuid7, editable=False)
     customer = ForeignKey(
         Customer,
         on_delete=CASCADE,
         related_name="orders",
     )
-    order_number = CharField(max_length=100, unique=True)
+    # ORD-YYYYMMDD-000042: the UTC date plus a global Postgres sequence (not
+    # reset daily, see above), filled in by the INSERT itself
+    # (next_order_number(), migration 0005) and read back with RETURNING.
+    order_number = CharField(
+        max_length=100,
+        unique=True,
+        editable=False,
+        db_default=Func(function="next_order_number", output_field=CharField()),
+    )
 
     # Stripe Integration Fields
     stripe_payment_intent_id = CharField(max_length=200)
@@ -76,15 +107,27 @@ class Order(Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Stripe webhooks and confirm_payment find orders by intent id.
+            Index(fields=["stripe_payment_intent_id"], name="order_payment_intent_idx"),
+            # Customer order history, in NewestFirstCursorPagination order.
+            Index(
+                fields=["customer", "-created_at", "-id"],
+                name="order_customer_created_idx",
+            ),
+            # archive_orders picks finished orders oldest first.
+            Index(
+                fields=["created_at"],
+                condition=Q(status__in=FINISHED_STATUSES),
+                name="order_archivable_idx",
+            ),
+            # Admin changelist, newest first.
+            Index(fields=["-created_at", "-id"], name="order_created_idx"),
+        ]
 
     def __str__(self):
         return f"Order {self.order_number} - {self.customer.user.username}"
 
-    def save(self, *args, **kwargs):
-        if not self.order_number:
-            self.order_number = f"ORD-{timezone.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"  # noqa: E501
-        super().save(*args, **kwargs)
-
     def create_address_snapshot(self):
         return {
             "shipping": {
@@ -150,6 +193,12 @@ class OrderItem(Model):
 
     class Meta:
         unique_together = ["order", "product"]
+        indexes = [
+            # Seller order feed: filter by seller, newest first.
+            Index(fields=["seller", "created_at"], name="orderitem_seller_created_idx"),
+            # Admin changelist, newest first.
+            Index(fields=["-created_at", "-id"], name="orderitem_created_idx"),
+        ]
 
     def __str__(self):
         return (
@@ -183,6 +232,12 @@ class Payment(Model):
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Admin changelist, newest first.
+            Index(fields=["-created_at", "-id"], name="payment_created_idx"),
+        ]
+
     def __str__(self):
         return f"Payment {self.stripe_payment_intent_id} - {self.amount}"
 
@@ -206,5 +261,238 @@ class SellerPayout(Model):
     created_at = DateTimeField(auto_now_add=True)
     processed_at = DateTimeField(null=True)
 
+    class Meta:
+        indexes = [
+            # Admin changelist, newest first.
+            Index(fields=["-created_at", "-id"], name="sellerpayout_created_idx"),
+        ]
+
     def __str__(self):
         return f"Payout to {self.seller.user.username} - ${self.amount}"
+
+
+class SellerEarnings(Model):
+    """
+    Running total of SellerPayout amounts per seller, maintained by
+    e_commerce.orders.services.earnings so reads do not aggregate payouts.
+    """
+
+    seller = OneToOneField(
+        Seller,
+        on_delete=CASCADE,
+        primary_key=True,
+        related_name="earnings",
+    )
+    total = DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Earnings of {self.seller_id} - ${self.total}"
+
+
+class SellerProductEarnings(Model):
+    """Running total of OrderItem seller payout amounts per seller and product"""
+
+    seller = ForeignKey(
+        Seller,
+        on_delete=CASCADE,
+        related_name="product_earnings",
+    )
+    product = ForeignKey(
+        Product,
+        on_delete=CASCADE,
+        related_name="seller_earnings",
+    )
+    total = DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["seller", "product"],
+                name="unique_seller_product_earnings",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Earnings of {self.seller_id} on {self.product_id} - ${self.total}"
+
+
+class SellerSalesDelta(Model):
+    """
+    Outbox of changes to the seller earnings ledger and sales rollups: one
+    row per OrderItem or SellerPayout change, written by the orders signals
+    with a plain INSERT so checkouts never wait on each other's ledger or
+    rollup rows. The drain_sales_deltas worker folds batches of them into
+    both and deletes them. Rows of payouts have no product.
+    """
+
+    seller = ForeignKey(
+        Seller,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    product = ForeignKey(
+        Product,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    # created_at of the changed order item or payout.
+    occurred_at = DateTimeField()
+    units = BigIntegerField(default=0)
+    revenue = DecimalField(max_digits=14, decimal_places=2, default=0)
+    earnings = DecimalField(max_digits=14, decimal_places=2, default=0)
+    payouts = DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        indexes = [
+            # Pending amounts added to ledger reads.
+            Index(fields=["seller", "product"], name="salesdelta_seller_product_idx"),
+        ]
+
+    def __str__(self):
+        return f"Sales delta {self.pk} of {self.seller_id}"
+
+
+class SellerSalesRollup(Model):
+    """
+    Hourly and daily sales aggregates per seller and product, maintained by
+    e_commerce.orders.services.rollups. Rows without a product hold the
+    seller's payouts, which are not tied to a product.
+    """
+
+    GRANULARITY_CHOICES = [
+        ("hour", "Hour"),
+        ("day", "Day"),
+    ]
+
+    seller = ForeignKey(
+        Seller,
+        on_delete=CASCADE,
+        related_name="sales_rollups",
+    )
+    product = ForeignKey(
+        Product,
+        on_delete=CASCADE,
+        null=True,
+        related_name="sales_rollups",
+    )
+    granularity = CharField(max_length=4, choices=GRANULARITY_CHOICES)
+    bucket = DateTimeField()
+
+    units = BigIntegerField(default=0)
+    revenue = DecimalField(max_digits=14, decimal_places=2, default=0)
+    earnings = DecimalField(max_digits=14, decimal_places=2, default=0)
+    payouts = DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # Leading (seller, granularity, bucket) also serves range reads.
+            UniqueConstraint(
+                fields=["seller", "granularity", "bucket", "product"],
+                name="unique_seller_sales_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"Sales of {self.seller_id} for {self.granularity} {self.bucket}"
+
+
+class ArchivedOrder(Model):
+    """
+    Order moved out of the hot order tables by archive_orders, kept as the
+    OrderSerializer document it had when it was archived plus its seller
+    payouts. The table is range partitioned by created_at into one
+    partition per month (migration 0008, services.archive), so its primary
+    key in the database is (id, created_at).
+    """
+
+    id = UUIDField(primary_key=True, editable=False)
+    order_number = CharField(max_length=100, editable=False)
+    customer = ForeignKey(
+        Customer,
+        on_delete=CASCADE,
+        # Served by archivedorder_customer_created_idx.
+        db_index=False,
+        related_name="archived_orders",
+    )
+    created_at = DateTimeField()
+    archived_at = DateTimeField()
+    # Encoded like API responses, so it is served back byte for byte.
+    document = JSONField(encoder=JSONEncoder)
+    payouts = JSONField(encoder=DjangoJSONEncoder, default=list)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            Index(
+                fields=["customer", "-created_at", "-id"],
+                name="archivedorder_customer_idx",
+            ),
+            Index(fields=["order_number"], name="archivedorder_number_idx"),
+        ]
+
+    def __str__(self):
+        return f"Archived order {self.order_number}"
+
+
+class ArchivedOrderLine(Model):
+    """
+    Items of archived orders, one row per line of ArchivedOrder.document
+    (database view, migration 0008). Read by the earnings ledger and sales
+    rollup rebuilds alongside OrderItem.
+    """
+
+    order = ForeignKey(ArchivedOrder, on_delete=DO_NOTHING, related_name="+")
+    order_created_at = DateTimeField()
+    product = ForeignKey(
+        Product,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    seller = ForeignKey(
+        Seller,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    quantity = PositiveIntegerField()
+    price_at_time = DecimalField(max_digits=10, decimal_places=2)
+    seller_payout_amount = DecimalField(max_digits=10, decimal_places=2)
+    created_at = DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = "orders_archivedorderline"
+
+    def __str__(self):
+        return f"Archived line {self.pk} of {self.order_id}"
+
+
+class ArchivedPayout(Model):
+    """Seller payouts of archived orders (database view, migration 0008)"""
+
+    order = ForeignKey(ArchivedOrder, on_delete=DO_NOTHING, related_name="+")
+    order_created_at = DateTimeField()
+    seller = ForeignKey(
+        Seller,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    amount = DecimalField(max_digits=10, decimal_places=2)
+    status = CharField(max_length=20)
+    created_at = DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = "orders_archivedpayout"
+
+    def __str__(self):
+        return f"Archived payout {self.pk} of {self.order_id}"
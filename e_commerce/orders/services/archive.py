@@ -0,0 +1,143 @@
+from collections import defaultdict
+from datetime import UTC
+from datetime import datetime
+
+from django.db import connection
+from django.db import transaction
+from django.utils import timezone
+
+from e_commerce.orders.api.readers import OrderReader
+from e_commerce.orders.models import FINISHED_STATUSES
+from e_commerce.orders.models import ArchivedOrder
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import Payment
+from e_commerce.orders.models import SellerPayout
+
+PAYOUT_FIELDS = (
+    "id",
+    "seller_id",
+    "order_item_id",
+    "amount",
+    "stripe_transfer_id",
+    "status",
+    "created_at",
+    "processed_at",
+)
+
+
+def month_start(moment):
+    """First instant of the UTC month that moment falls into"""
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def next_month(start):
+    if start.month == 12:  # noqa: PLR2004
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+class OrderArchive:
+    """
+    Moves finished orders out of the hot order tables (Order, OrderItem,
+    Payment, SellerPayout) into ArchivedOrder, one monthly partition per
+    calendar month of order creation.
+
+    The hot rows are deleted with plain DELETEs that bypass the orders
+    signals, so the earnings ledger and sales rollups keep counting archived
+    orders; their rebuilds read them back from ArchivedOrderLine and
+    ArchivedPayout.
+    """
+
+    @staticmethod
+    def archivable(before):
+        return Order.objects.filter(
+            status__in=FINISHED_STATUSES,
+            created_at__lt=before,
+        )
+
+    @staticmethod
+    def ensure_partition(month):
+        """Create the partition holding orders created in month, if missing"""
+        start = month_start(month)
+        end = next_month(start)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS orders_archivedorder_{start:%Y%m} "
+                "PARTITION OF orders_archivedorder "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')",
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def archive_batch(before, batch_size):
+        """
+        Archive up to batch_size of the oldest finished orders created
+        before the given moment. Orders locked by another transaction are
+        skipped. Returns the number of orders archived.
+        """
+        ids = list(
+            OrderArchive.archivable(before)
+            .order_by("created_at", "id")
+            .select_for_update(skip_locked=True)
+            .values_list("id", flat=True)[:batch_size],
+        )
+        if not ids:
+            return 0
+
+        rows = list(OrderReader.rows(Order.objects.filter(id__in=ids)))
+        documents = OrderReader().read(rows)
+        payouts = defaultdict(list)
+        for payout in (
+            SellerPayout.objects.filter(order_item__order_id__in=ids)
+            .order_by("id")
+            .values("order_item__order_id", *PAYOUT_FIELDS)
+        ):
+            payouts[payout.pop("order_item__order_id")].append(payout)
+
+        for month in {month_start(row["created_at"]) for row in rows}:
+            OrderArchive.ensure_partition(month)
+        archived_at = timezone.now()
+        ArchivedOrder.objects.bulk_create(
+            ArchivedOrder(
+                id=row["id"],
+                order_number=row["order_number"],
+                customer_id=row["customer_id"],
+                created_at=row["created_at"],
+                archived_at=archived_at,
+                document=document,
+                payouts=payouts[row["id"]],
+            )
+            for row, document in zip(rows, documents, strict=True)
+        )
+
+        # Children first; _raw_delete skips the collector and its signals.
+        using = connection.alias
+        for queryset in (
+            SellerPayout.objects.filter(order_item__order_id__in=ids),
+            Payment.objects.filter(order_id__in=ids),
+            OrderItem.objects.filter(order_id__in=ids),
+            Order.objects.filter(id__in=ids),
+        ):
+            queryset._raw_delete(using)  # noqa: SLF001
+        return len(ids)
+
+    @staticmethod
+    def archive(before, batch_size=500):
+        """Archive all finished orders created before the given moment"""
+        total = 0
+        while archived := OrderArchive.archive_batch(before, batch_size):
+            total += archived
+        return total
+
+    @staticmethod
+    def document(customer, **lookup):
+        """Stored document of one of the customer's archived orders, or None"""
+        if customer is None:
+            return None
+        return (
+            ArchivedOrder.objects.filter(customer=customer, **lookup)
+            .values_list("document", flat=True)
+            .first()
+        )
@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+
+def increment(model, deltas, *, create, **keys):
+    """
+    Add deltas to the numeric columns of the row identified by keys with a
+    single UPDATE ... SET col = col + delta. If no row matches and create is
+    set, insert one holding the deltas. Removals pass create=False so they
+    never resurrect rows that are being deleted alongside their owner.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    changes = {field: F(field) + delta for field, delta in deltas.items()}
+    changes["updated_at"] = timezone.now()
+    with transaction.atomic():
+        updated = model.objects.filter(**keys).update(**changes)
+        if updated or not create:
+            return
+        _, created = model.objects.get_or_create(defaults=deltas, **keys)
+        if not created:
+            # Lost a race with a concurrent insert; apply on top of it.
+            model.objects.filter(**keys).update(**changes)
@@ -0,0 +1,60 @@
+from django.db import transaction
+
+from e_commerce.orders.models import SellerSalesDelta
+from e_commerce.orders.services.earnings import EarningsLedger
+from e_commerce.orders.services.rollups import SalesRollups
+
+
+class SalesDeltas:
+    """
+    The SellerSalesDelta outbox between order changes and the derived seller
+    tables. Requests only append rows; the drain_sales_deltas worker applies
+    them, so ledger and rollup rows are locked by the worker rather than by
+    checkouts.
+    """
+
+    @staticmethod
+    def record(before, after, amounts):
+        """
+        Append the change from snapshot before to snapshot after (see
+        orders.signals), either of which may be None. amounts maps delta
+        fields to functions reading their value from a snapshot.
+        """
+        SellerSalesDelta.objects.bulk_create(
+            SellerSalesDelta(
+                seller_id=snapshot["seller_id"],
+                product_id=snapshot.get("product_id"),
+                occurred_at=snapshot["created_at"],
+                **{field: sign * value(snapshot) for field, value in amounts.items()},
+            )
+            for snapshot, sign in ((before, -1), (after, 1))
+            if snapshot
+        )
+
+    @staticmethod
+    def drain(batch_size=1000, *, skip_locked=True):
+        """
+        Apply and delete one batch of deltas, oldest first. With skip_locked
+        several workers can drain concurrently; rebuilds pass False to wait
+        for batches other workers are applying. Returns the number drained.
+        """
+        with transaction.atomic():
+            pending = SellerSalesDelta.objects.select_for_update(
+                skip_locked=skip_locked,
+            )
+            deltas = list(pending.order_by("id")[:batch_size])
+            if deltas:
+                EarningsLedger.apply(deltas)
+                SalesRollups.apply(deltas)
+                SellerSalesDelta.objects.filter(
+                    pk__in=[delta.pk for delta in deltas],
+                ).delete()
+        return len(deltas)
+
+    @staticmethod
+    def drain_all(batch_size=1000):
+        """Drain until no deltas are left, waiting for locked ones"""
+        drained = 0
+        while count := SalesDeltas.drain(batch_size, skip_locked=False):
+            drained += count
+        return drained
@@ -0,0 +1,187 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models import Sum
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+
+from e_commerce.orders.models import ArchivedOrderLine
+from e_commerce.orders.models import ArchivedPayout
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerEarnings
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.models import SellerProductEarnings
+from e_commerce.orders.models import SellerSalesDelta
+from e_commerce.orders.services.counters import increment
+from e_commerce.products.models import Product
+from e_commerce.users.models import Seller
+
+
+class EarningsLedger:
+    """
+    Incrementally maintained seller earnings.
+
+    SellerEarnings.total mirrors SUM(SellerPayout.amount) per seller and
+    SellerProductEarnings.total mirrors SUM(OrderItem.seller_payout_amount)
+    per seller and product, including archived orders. The orders signals
+    queue every change as a SellerSalesDelta, which the drain_sales_deltas
+    worker passes to apply(); reads add the deltas not applied yet.
+    rebuild() recomputes both from scratch.
+    """
+
+    @staticmethod
+    def apply(deltas):
+        """
+        Fold SellerSalesDelta rows into the ledger, one UPDATE per ledger row.
+        Rows are updated in key order, so concurrent drains cannot deadlock;
+        deltas of sellers or products deleted since are dropped.
+        """
+        seller_totals = defaultdict(Decimal)
+        product_totals = defaultdict(Decimal)
+        for delta in deltas:
+            seller_totals[delta.seller_id] += delta.payouts
+            if delta.product_id is not None:
+                product_totals[delta.seller_id, delta.product_id] += delta.earnings
+        sellers = set(
+            Seller.objects.filter(pk__in=seller_totals).values_list("pk", flat=True),
+        )
+        products = set(
+            Product.objects.filter(
+                pk__in={product_id for _, product_id in product_totals},
+            ).values_list("pk", flat=True),
+        )
+        for seller_id in sorted(sellers):
+            increment(
+                SellerEarnings,
+                {"total": seller_totals[seller_id]},
+                create=True,
+                seller_id=seller_id,
+            )
+        for seller_id, product_id in sorted(product_totals):
+            if seller_id in sellers and product_id in products:
+                increment(
+                    SellerProductEarnings,
+                    {"total": product_totals[seller_id, product_id]},
+                    create=True,
+                    seller_id=seller_id,
+                    product_id=product_id,
+                )
+
+    @staticmethod
+    def seller_total(seller) -> Decimal:
+        """Total payouts of a seller, including pending deltas, in one query"""
+        return EarningsLedger._total(
+            SellerEarnings.objects.filter(seller=OuterRef("pk")),
+            SellerSalesDelta.objects.filter(seller=OuterRef("pk")),
+            "payouts",
+            seller,
+        )
+
+    @staticmethod
+    def product_total(seller, product_id) -> Decimal:
+        """Total seller payout amount of one product, in one query"""
+        return EarningsLedger._total(
+            SellerProductEarnings.objects.filter(
+                seller=OuterRef("pk"),
+                product_id=product_id,
+            ),
+            SellerSalesDelta.objects.filter(
+                seller=OuterRef("pk"),
+                product_id=product_id,
+            ),
+            "earnings",
+            seller,
+        )
+
+    @staticmethod
+    def _total(ledger, deltas, field, seller):
+        """The ledger row's total plus the pending deltas' sum of field"""
+        pending = (
+            deltas.order_by()
+            .values("seller")
+            .annotate(pending=Sum(field))
+            .values("pending")
+        )
+        zero = Value(Decimal(0))
+        return (
+            Seller.objects.filter(pk=seller.pk)
+            .values_list(
+                Coalesce(Subquery(ledger.values("total")), zero)
+                + Coalesce(Subquery(pending), zero),
+                flat=True,
+            )
+            .first()
+        ) or Decimal(0)
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(seller_ids=None, batch_size=1000):
+        """
+        Recompute the ledger from SellerPayout and OrderItem rows, and their
+        archived counterparts, for all sellers or only the given ones.
+        Pending deltas are drained first, as the source rows already include
+        them. Returns the number of rows written.
+        """
+        from e_commerce.orders.services.deltas import SalesDeltas
+
+        SalesDeltas.drain_all(batch_size)
+        sellers = Seller.objects.all()
+        payouts = [
+            SellerPayout.objects.all(),
+            ArchivedPayout.objects.filter(seller__in=sellers),
+        ]
+        items = [
+            OrderItem.objects.all(),
+            ArchivedOrderLine.objects.filter(
+                seller__in=sellers,
+                product__in=Product.objects.all(),
+            ),
+        ]
+        seller_ledger = SellerEarnings.objects.all()
+        product_ledger = SellerProductEarnings.objects.all()
+        if seller_ids is not None:
+            payouts = [rows.filter(seller_id__in=seller_ids) for rows in payouts]
+            items = [rows.filter(seller_id__in=seller_ids) for rows in items]
+            seller_ledger = seller_ledger.filter(seller_id__in=seller_ids)
+            product_ledger = product_ledger.filter(seller_id__in=seller_ids)
+
+        seller_ledger.delete()
+        product_ledger.delete()
+
+        seller_totals = defaultdict(Decimal)
+        for rows in payouts:
+            for row in (
+                rows.order_by().values("seller_id").annotate(total=Sum("amount"))
+            ).iterator():
+                seller_totals[row["seller_id"]] += row["total"]
+        product_totals = defaultdict(Decimal)
+        for rows in items:
+            for row in (
+                rows.order_by()
+                .values("seller_id", "product_id")
+                .annotate(total=Sum("seller_payout_amount"))
+            ).iterator():
+                product_totals[row["seller_id"], row["product_id"]] += row["total"]
+
+        seller_rows = SellerEarnings.objects.bulk_create(
+            (
+                SellerEarnings(seller_id=seller_id, total=total)
+                for seller_id, total in seller_totals.items()
+            ),
+            batch_size=batch_size,
+        )
+        product_rows = SellerProductEarnings.objects.bulk_create(
+            (
+                SellerProductEarnings(
+                    seller_id=seller_id,
+                    product_id=product_id,
+                    total=total,
+                )
+                for (seller_id, product_id), total in product_totals.items()
+            ),
+            batch_size=batch_size,
+        )
+        return len(seller_rows) + len(product_rows)
@@ -0,0 +1,54 @@
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerPayout
+from e_commerce.utils.exports import Export
+from e_commerce.utils.rows import decimal_string
+from e_commerce.utils.rows import iso_datetime
+
+
+class OrderExports:
+    """
+    Full exports of the hot order tables, for sellers and finance. Orders
+    moved to the order archive are not included.
+    """
+
+    @staticmethod
+    def order_items(queryset=None):
+        if queryset is None:
+            queryset = OrderItem.objects.all()
+        return Export(
+            "order-items",
+            queryset.order_by("id"),
+            [
+                ("id", "id", None),
+                ("order", "order_id", None),
+                ("order_number", "order__order_number", None),
+                ("product", "product_id", None),
+                ("product_name", "product__name", None),
+                ("seller", "seller__user__username", None),
+                ("quantity", "quantity", None),
+                ("price_at_time", "price_at_time", decimal_string(2)),
+                ("seller_payout_amount", "seller_payout_amount", decimal_string(2)),
+                ("seller_status", "seller_status", None),
+                ("created_at", "created_at", iso_datetime()),
+            ],
+        )
+
+    @staticmethod
+    def payouts(queryset=None):
+        if queryset is None:
+            queryset = SellerPayout.objects.all()
+        return Export(
+            "payouts",
+            queryset.order_by("id"),
+            [
+                ("id", "id", None),
+                ("seller", "seller__user__username", None),
+                ("order_item", "order_item_id", None),
+                ("order_number", "order_item__order__order_number", None),
+                ("amount", "amount", decimal_string(2)),
+                ("status", "status", None),
+                ("stripe_transfer_id", "stripe_transfer_id", None),
+                ("created_at", "created_at", iso_datetime()),
+                ("processed_at", "processed_at", iso_datetime()),
+            ],
+        )
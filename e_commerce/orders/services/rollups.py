@@ -0,0 +1,221 @@
+from collections import defaultdict
+from datetime import UTC
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import DecimalField
+from django.db.models import ExpressionWrapper
+from django.db.models import F
+from django.db.models import Sum
+from django.db.models.functions import Trunc
+
+from e_commerce.orders.models import ArchivedOrderLine
+from e_commerce.orders.models import ArchivedPayout
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.models import SellerSalesRollup
+from e_commerce.orders.services.counters import increment
+from e_commerce.products.models import Product
+from e_commerce.users.models import Seller
+
+GRANULARITIES = ("hour", "day")
+ROLLUP_FIELDS = ("units", "revenue", "earnings", "payouts")
+
+
+def bucket_start(moment, granularity):
+    """Start of the UTC hour or day that moment falls into"""
+    moment = moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+
+class SalesRollups:
+    """
+    Hourly/daily SellerSalesRollup rows, kept current from OrderItem and
+    SellerPayout changes queued by orders.signals and applied by the
+    drain_sales_deltas worker, so series() lags behind by the queued
+    deltas. Hourly rows are only kept for a retention window; compact()
+    prunes them and re-derives recent days.
+    """
+
+    @staticmethod
+    def apply(deltas):
+        """
+        Fold SellerSalesDelta rows into the hourly and daily rollups, one
+        UPDATE per rollup row. Rows are updated in key order, so concurrent
+        drains cannot deadlock; deltas of sellers or products deleted since
+        are dropped.
+        """
+        totals = defaultdict(lambda: dict.fromkeys(ROLLUP_FIELDS, 0))
+        for delta in deltas:
+            for granularity in GRANULARITIES:
+                key = (
+                    delta.seller_id,
+                    delta.product_id or 0,
+                    granularity,
+                    bucket_start(delta.occurred_at, granularity),
+                )
+                for field in ROLLUP_FIELDS:
+                    totals[key][field] += getattr(delta, field)
+        sellers = set(
+            Seller.objects.filter(
+                pk__in={seller_id for seller_id, *_ in totals},
+            ).values_list("pk", flat=True),
+        )
+        products = set(
+            Product.objects.filter(
+                pk__in={product_id for _, product_id, *_ in totals},
+            ).values_list("pk", flat=True),
+        )
+        for seller_id, product_id, granularity, bucket in sorted(totals):
+            if seller_id not in sellers or (product_id and product_id not in products):
+                continue
+            increment(
+                SellerSalesRollup,
+                totals[seller_id, product_id, granularity, bucket],
+                create=True,
+                seller_id=seller_id,
+                product_id=product_id or None,
+                granularity=granularity,
+                bucket=bucket,
+            )
+
+    @staticmethod
+    def series(seller, granularity, start, end, product_id=None):
+        """Per-bucket totals for buckets in [start, end), oldest first"""
+        rollups = SellerSalesRollup.objects.filter(
+            seller=seller,
+            granularity=granularity,
+            bucket__gte=bucket_start(start, granularity),
+            bucket__lt=end,
+        )
+        if product_id is not None:
+            rollups = rollups.filter(product_id=product_id)
+        return (
+            rollups.values("bucket")
+            .annotate(
+                units=Sum("units"),
+                revenue=Sum("revenue"),
+                earnings=Sum("earnings"),
+                payouts=Sum("payouts"),
+            )
+            .order_by("bucket")
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(granularity, start, end, seller_ids=None):
+        """
+        Re-derive the rollup rows of buckets in [start, end) from OrderItem
+        and SellerPayout, and the lines and payouts of archived orders.
+        Pending deltas are drained first, as the source rows already include
+        them. Returns the number of rows written.
+        """
+        from e_commerce.orders.services.deltas import SalesDeltas
+
+        SalesDeltas.drain_all()
+        start = bucket_start(start, granularity)
+        rollups = SellerSalesRollup.objects.filter(
+            granularity=granularity,
+            bucket__gte=start,
+            bucket__lt=end,
+        )
+        sellers = Seller.objects.all()
+        # Orders are created before their lines and payouts, which limits
+        # the archive partitions read.
+        archived = {
+            "order_created_at__lt": end,
+            "created_at__gte": start,
+            "created_at__lt": end,
+            "seller__in": sellers,
+        }
+        items = [
+            OrderItem.objects.filter(created_at__gte=start, created_at__lt=end),
+            ArchivedOrderLine.objects.filter(
+                product__in=Product.objects.all(),
+                **archived,
+            ),
+        ]
+        payouts = [
+            SellerPayout.objects.filter(created_at__gte=start, created_at__lt=end),
+            ArchivedPayout.objects.filter(**archived),
+        ]
+        if seller_ids is not None:
+            rollups = rollups.filter(seller_id__in=seller_ids)
+            items = [rows.filter(seller_id__in=seller_ids) for rows in items]
+            payouts = [rows.filter(seller_id__in=seller_ids) for rows in payouts]
+        rollups.delete()
+
+        bucket = Trunc("created_at", granularity, tzinfo=UTC)
+        totals = defaultdict(lambda: {"units": 0, "revenue": 0, "earnings": 0})
+        for rows in items:
+            for row in (
+                rows.annotate(rollup_bucket=bucket)
+                .values("seller_id", "product_id", "rollup_bucket")
+                .annotate(
+                    units=Sum("quantity"),
+                    revenue=Sum(
+                        ExpressionWrapper(
+                            F("price_at_time") * F("quantity"),
+                            output_field=DecimalField(max_digits=14, decimal_places=2),
+                        ),
+                    ),
+                    earnings=Sum("seller_payout_amount"),
+                )
+                .order_by()
+                .iterator()
+            ):
+                key = row["seller_id"], row["product_id"], row["rollup_bucket"]
+                for field, total in totals[key].items():
+                    totals[key][field] = total + row[field]
+        payout_totals = defaultdict(int)
+        for rows in payouts:
+            for row in (
+                rows.annotate(rollup_bucket=bucket)
+                .values("seller_id", "rollup_bucket")
+                .annotate(payouts=Sum("amount"))
+                .order_by()
+                .iterator()
+            ):
+                payout_totals[row["seller_id"], row["rollup_bucket"]] += row["payouts"]
+
+        rows = [
+            SellerSalesRollup(
+                seller_id=seller_id,
+                product_id=product_id,
+                granularity=granularity,
+                bucket=rollup_bucket,
+                **fields,
+            )
+            for (seller_id, product_id, rollup_bucket), fields in totals.items()
+        ]
+        rows += [
+            SellerSalesRollup(
+                seller_id=seller_id,
+                granularity=granularity,
+                bucket=rollup_bucket,
+                payouts=total,
+            )
+            for (seller_id, rollup_bucket), total in payout_totals.items()
+        ]
+        return len(SellerSalesRollup.objects.bulk_create(rows, batch_size=1000))
+
+    @staticmethod
+    def compact(now, hourly_retention_days, rebuild_days):
+        """
+        Nightly maintenance: drop hourly rows older than the retention window
+        and re-derive the last rebuild_days daily buckets from source rows to
+        correct any drift from bulk updates that bypass signals.
+        """
+        pruned, _ = SellerSalesRollup.objects.filter(
+            granularity="hour",
+            bucket__lt=bucket_start(now - timedelta(days=hourly_retention_days), "day"),
+        ).delete()
+        today = bucket_start(now, "day")
+        rebuilt = SalesRollups.rebuild(
+            "day",
+            today - timedelta(days=rebuild_days),
+            today + timedelta(days=1),
+        )
+        return pruned, rebuilt
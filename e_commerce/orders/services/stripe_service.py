@@ -5,6 +5,7 @@ import stripe
 from django.conf import settings
 
 from e_commerce.orders.models import OrderItem
+from e_commerce.utils.prometheus import PAYMENT_INTENTS
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
@@ -38,6 +39,7 @@ class StripeService:
             order.stripe_payment_intent_id = intent.id
             order.stripe_payment_intent_client_secret = intent.client_secret
             order.save()
+            PAYMENT_INTENTS.labels("created").inc()
 
             return {  # noqa: TRY300
                 "client_secret": intent.client_secret,
@@ -45,6 +47,7 @@ class StripeService:
             }
 
         except stripe.error.StripeError as e:
+            PAYMENT_INTENTS.labels("failed").inc()
             msg = f"Stripe error: {e!s}"
             raise Exception(msg)  # noqa: B904, TRY002
 
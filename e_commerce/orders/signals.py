@@ -0,0 +1,76 @@
+"""
+Feed OrderItem and SellerPayout changes into the derived seller tables.
+
+Each change is passed on as a (before, after) pair of snapshots of the
+tracked columns; before is None for inserts and after is None for deletes.
+"""
+
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.services.deltas import SalesDeltas
+
+TRACKED_FIELDS = {
+    SellerPayout: ("seller_id", "amount", "created_at"),
+    OrderItem: (
+        "seller_id",
+        "product_id",
+        "quantity",
+        "price_at_time",
+        "seller_payout_amount",
+        "created_at",
+    ),
+}
+
+# SellerSalesDelta fields and how to read them from a snapshot.
+PAYOUT_AMOUNTS = {"payouts": lambda snapshot: snapshot["amount"]}
+ORDER_ITEM_AMOUNTS = {
+    "units": lambda snapshot: snapshot["quantity"],
+    "revenue": lambda snapshot: snapshot["price_at_time"] * snapshot["quantity"],
+    "earnings": lambda snapshot: snapshot["seller_payout_amount"],
+}
+
+
+def snapshot(instance):
+    return {field: getattr(instance, field) for field in TRACKED_FIELDS[type(instance)]}
+
+
+def changed(sender, before, after):
+    if before == after:
+        return
+    amounts = PAYOUT_AMOUNTS if sender is SellerPayout else ORDER_ITEM_AMOUNTS
+    SalesDeltas.record(before, after, amounts)
+
+
+@receiver(pre_save, sender=SellerPayout)
+@receiver(pre_save, sender=OrderItem)
+def remember_stored_values(sender, instance, update_fields=None, **kwargs):
+    """Keep the stored tracked values of a row that is about to be updated"""
+    if instance._state.adding:  # noqa: SLF001
+        return
+    fields = TRACKED_FIELDS[sender]
+    if update_fields is not None:
+        names = {field.removesuffix("_id") for field in fields}
+        if not names & {field.removesuffix("_id") for field in update_fields}:
+            return
+    instance._tracked_before = (  # noqa: SLF001
+        sender.objects.filter(pk=instance.pk).values(*fields).first()
+    )
+
+
+@receiver(post_save, sender=SellerPayout)
+@receiver(post_save, sender=OrderItem)
+def record_save(sender, instance, created, **kwargs):
+    if not created and "_tracked_before" not in instance.__dict__:
+        return
+    changed(sender, instance.__dict__.pop("_tracked_before", None), snapshot(instance))
+
+
+@receiver(post_delete, sender=SellerPayout)
+@receiver(post_delete, sender=OrderItem)
+def record_delete(sender, instance, **kwargs):
+    changed(sender, snapshot(instance), None)
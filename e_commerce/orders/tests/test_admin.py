@@ -0,0 +1,115 @@
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import Payment
+from e_commerce.orders.models import SellerPayout
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+CHANGELISTS = (
+    "admin:orders_order_changelist",
+    "admin:orders_orderitem_changelist",
+    "admin:orders_payment_changelist",
+    "admin:orders_sellerpayout_changelist",
+)
+
+
+@pytest.fixture
+def add_orders(db):
+    counter = iter(range(1000))
+
+    def add_orders(count):
+        orders = []
+        for _ in range(count):
+            n = next(counter)
+            seller = Seller.objects.create(
+                user=User.objects.create_user(username=f"seller{n}"),
+            )
+            user = User.objects.create_user(username=f"buyer{n}")
+            order = Order.objects.create(
+                customer=Customer.objects.create(user=user),
+                total_amount=10,
+                platform_commission=0,
+                shipping_address=Address.objects.create(
+                    user=user,
+                    street="1 Rd",
+                    city="Town",
+                    country="Land",
+                    postal_code="1",
+                ),
+            )
+            item = OrderItem.objects.create(
+                order=order,
+                product=Product.objects.create(
+                    name=f"Product {n}",
+                    description="d",
+                    price=10,
+                    seller=seller,
+                ),
+                seller=seller,
+                price_at_time=10,
+                seller_payout_amount=Decimal(9),
+            )
+            Payment.objects.create(
+                order=order,
+                stripe_payment_intent_id=f"pi_{n}",
+                amount=10,
+            )
+            SellerPayout.objects.create(
+                seller=seller,
+                order_item=item,
+                amount=9,
+                stripe_transfer_id="tr",
+            )
+            orders.append(order)
+        return orders
+
+    return add_orders
+
+
+def changelist_queries(client, url_name, **params):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse(url_name), params)
+    assert response.status_code == HTTPStatus.OK
+    return len(queries)
+
+
+class TestOrderAdmins:
+    @pytest.mark.parametrize("url_name", CHANGELISTS)
+    def test_queries_do_not_grow_with_rows(self, admin_client, add_orders, url_name):
+        add_orders(2)
+        few = changelist_queries(admin_client, url_name)
+        add_orders(10)
+        assert changelist_queries(admin_client, url_name) == few
+
+    def test_id_filter_and_order_number_search(self, admin_client, add_orders):
+        first, second = add_orders(2)
+        url = reverse("admin:orders_orderitem_changelist")
+
+        response = admin_client.get(url, {"order__exact": str(first.pk)})
+        assert response.context["cl"].result_count == 1
+        assert response.context["cl"].result_list[0].order_id == first.pk
+
+        response = admin_client.get(url, {"q": second.order_number})
+        assert [item.order_id for item in response.context["cl"].result_list] == [
+            second.pk,
+        ]
+
+        response = admin_client.get(url, {"order__exact": ""})
+        assert response.context["cl"].result_count == 2  # noqa: PLR2004
+        assert b'name="order__exact"' in response.content
+
+    def test_newest_first(self, admin_client, add_orders):
+        orders = add_orders(3)
+        response = admin_client.get(reverse("admin:orders_order_changelist"))
+        assert list(response.context["cl"].result_list) == orders[::-1]
@@ -0,0 +1,255 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from e_commerce.orders.models import ArchivedOrder
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import Payment
+from e_commerce.orders.models import SellerEarnings
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.models import SellerProductEarnings
+from e_commerce.orders.models import SellerSalesRollup
+from e_commerce.orders.services.archive import month_start
+from e_commerce.orders.services.deltas import SalesDeltas
+from e_commerce.orders.services.earnings import EarningsLedger
+from e_commerce.orders.services.rollups import SalesRollups
+from e_commerce.orders.services.rollups import bucket_start
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import User
+
+AGE = timedelta(days=400)
+
+
+@pytest.fixture
+def customer(db):
+    return Customer.objects.create(user=User.objects.create_user(username="buyer"))
+
+
+@pytest.fixture
+def make_order(customer, seller):
+    address = Address.objects.create(
+        user=customer.user,
+        street="1 Buyer Rd",
+        city="Buyville",
+        country="Testland",
+        postal_code="54321",
+    )
+    products = [
+        Product.objects.create(name=name, description="d", price=10, seller=seller)
+        for name in ("Lamp", "Desk")
+    ]
+
+    def make_order(status, age):
+        order = Order.objects.create(
+            customer=customer,
+            total_amount=50,
+            platform_commission=0,
+            shipping_address=address,
+            status=status,
+        )
+        for quantity, product in enumerate(products, start=1):
+            item = OrderItem.objects.create(
+                order=order,
+                product=product,
+                seller=seller,
+                price_at_time=10,
+                quantity=quantity,
+                seller_payout_amount=Decimal(9 * quantity),
+            )
+            SellerPayout.objects.create(
+                seller=seller,
+                order_item=item,
+                amount=item.seller_payout_amount,
+                stripe_transfer_id="tr_1",
+                status="succeeded",
+            )
+        Payment.objects.create(
+            order=order,
+            stripe_payment_intent_id=f"pi_{order.pk}",
+            amount=50,
+        )
+        # Backdated without signals, as if the order had aged.
+        moment = timezone.now() - age
+        Order.objects.filter(pk=order.pk).update(created_at=moment)
+        OrderItem.objects.filter(order=order).update(created_at=moment)
+        SellerPayout.objects.filter(order_item__order=order).update(created_at=moment)
+        return Order.objects.get(pk=order.pk)
+
+    return make_order
+
+
+@pytest.fixture
+def client(customer):
+    client = APIClient()
+    client.force_authenticate(user=customer.user)
+    return client
+
+
+def normalised(data):
+    return {**data, "items": sorted(data["items"], key=lambda item: item["id"])}
+
+
+def day_rollups(bucket):
+    return sorted(
+        SellerSalesRollup.objects.filter(granularity="day", bucket=bucket)
+        .values_list("seller_id", "product_id", "units", "revenue", "payouts")
+        .order_by(),
+        key=str,
+    )
+
+
+def ledger():
+    return (
+        sorted(SellerEarnings.objects.values_list("seller_id", "total")),
+        sorted(
+            SellerProductEarnings.objects.values_list(
+                "seller_id",
+                "product_id",
+                "total",
+            ),
+        ),
+    )
+
+
+class TestArchiveOrders:
+    def test_moves_old_finished_orders(self, make_order):
+        old = make_order("delivered", AGE)
+        pending = make_order("pending", AGE)
+        recent = make_order("delivered", timedelta(days=3))
+
+        call_command("archive_orders")
+
+        assert set(Order.objects.values_list("id", flat=True)) == {
+            pending.id,
+            recent.id,
+        }
+        assert not OrderItem.objects.filter(order_id=old.id).exists()
+        assert not Payment.objects.filter(order_id=old.id).exists()
+        assert not SellerPayout.objects.filter(order_item__order_id=old.id).exists()
+        archived = ArchivedOrder.objects.get()
+        assert archived.id == old.id
+        assert archived.order_number == old.order_number
+        assert archived.created_at == old.created_at
+        assert len(archived.document["items"]) == 2  # noqa: PLR2004
+        assert sorted(payout["amount"] for payout in archived.payouts) == [
+            "18.00",
+            "9.00",
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = 'orders_archivedorder'::regclass",
+            )
+            partitions = [row[0] for row in cursor.fetchall()]
+        assert partitions == [
+            f"orders_archivedorder_{month_start(old.created_at):%Y%m}",
+        ]
+
+    def test_dry_run(self, make_order):
+        make_order("refunded", AGE)
+
+        call_command("archive_orders", "--dry-run")
+
+        assert Order.objects.count() == 1
+        assert not ArchivedOrder.objects.exists()
+
+    def test_batches(self, make_order):
+        for _ in range(3):
+            make_order("cancelled", AGE)
+
+        call_command("archive_orders", "--batch-size", "2")
+
+        assert not Order.objects.exists()
+        assert ArchivedOrder.objects.count() == 3  # noqa: PLR2004
+
+
+class TestArchivedOrderReads:
+    def test_retrieve_and_lookup_by_number(self, make_order, client):
+        order = make_order("delivered", AGE)
+        detail = reverse("api:order-detail", kwargs={"pk": order.pk})
+        by_number = reverse(
+            "api:order-by-number",
+            kwargs={"order_number": order.order_number},
+        )
+        expected = normalised(client.get(detail).json())
+
+        call_command("archive_orders")
+
+        assert not Order.objects.exists()
+        for url in (detail, by_number):
+            response = client.get(url)
+            assert response.status_code == 200  # noqa: PLR2004
+            assert normalised(response.json()) == expected
+
+    def test_archived_list(self, make_order, client):
+        older = make_order("delivered", AGE + timedelta(days=40))
+        newer = make_order("refunded", AGE)
+        hot = make_order("delivered", timedelta(days=1))
+
+        call_command("archive_orders")
+
+        response = client.get(reverse("api:order-archived"))
+        assert response.status_code == 200  # noqa: PLR2004
+        assert [row["id"] for row in response.json()["results"]] == [
+            str(newer.id),
+            str(older.id),
+        ]
+        listed = client.get(reverse("api:order-list")).json()["results"]
+        assert [row["id"] for row in listed] == [str(hot.id)]
+
+    def test_other_customers_get_404(self, make_order):
+        order = make_order("delivered", AGE)
+        call_command("archive_orders")
+        other = APIClient()
+        other.force_authenticate(
+            user=Customer.objects.create(
+                user=User.objects.create_user(username="other"),
+            ).user,
+        )
+
+        for url in (
+            reverse("api:order-detail", kwargs={"pk": order.pk}),
+            reverse("api:order-detail", kwargs={"pk": "not-a-uuid"}),
+            reverse(
+                "api:order-by-number",
+                kwargs={"order_number": order.order_number},
+            ),
+        ):
+            assert other.get(url).status_code == 404  # noqa: PLR2004
+        assert other.get(reverse("api:order-archived")).json()["results"] == []
+
+
+class TestArchivedOrderTotals:
+    def test_ledger_is_kept_and_rebuilt(self, make_order):
+        make_order("delivered", AGE)
+        make_order("delivered", timedelta(days=1))
+        SalesDeltas.drain_all()
+        before = ledger()
+
+        call_command("archive_orders")
+        assert ledger() == before
+
+        EarningsLedger.rebuild()
+        assert ledger() == before
+
+    def test_rollup_rebuild_counts_archived_orders(self, make_order):
+        order = make_order("delivered", AGE)
+        start = bucket_start(order.created_at, "day")
+        window = ("day", start, start + timedelta(days=1))
+        SalesRollups.rebuild(*window)
+        rows = day_rollups(start)
+        assert len(rows) == 3  # noqa: PLR2004
+
+        call_command("archive_orders")
+        SalesRollups.rebuild(*window)
+
+        assert day_rollups(start) == rows
@@ -0,0 +1,188 @@
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Sum
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerEarnings
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.models import SellerProductEarnings
+from e_commerce.orders.models import SellerSalesDelta
+from e_commerce.orders.services.deltas import SalesDeltas
+from e_commerce.orders.services.earnings import EarningsLedger
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import User
+
+
+@pytest.fixture
+def product(seller):
+    return Product.objects.create(
+        name="Product",
+        description="desc",
+        price=10,
+        seller=seller,
+    )
+
+
+@pytest.fixture
+def order(db):
+    user = User.objects.create_user(username="buyer")
+    return Order.objects.create(
+        customer=Customer.objects.create(user=user),
+        total_amount=30,
+        platform_commission=0,
+        shipping_address=Address.objects.create(
+            user=user,
+            street="1 Buyer Rd",
+            city="Buyville",
+            country="Testland",
+            postal_code="54321",
+        ),
+    )
+
+
+@pytest.fixture
+def item(order, product, seller):
+    return OrderItem.objects.create(
+        order=order,
+        product=product,
+        seller=seller,
+        price_at_time=10,
+        quantity=3,
+        seller_payout_amount=Decimal("30.00"),
+    )
+
+
+def aggregated(seller, product):
+    payouts = seller.payouts.aggregate(total=Sum("amount"))["total"] or 0
+    items = (
+        seller.order_items.filter(product=product).aggregate(
+            total=Sum("seller_payout_amount"),
+        )["total"]
+        or 0
+    )
+    return payouts, items
+
+
+def ledger(seller, product):
+    return (
+        EarningsLedger.seller_total(seller),
+        EarningsLedger.product_total(seller, product.id),
+    )
+
+
+class TestEarningsLedger:
+    def test_tracks_order_items(self, item, seller, product):
+        assert ledger(seller, product) == (0, Decimal("30.00"))
+
+        item.seller_payout_amount = Decimal("25.50")
+        item.save()
+        assert ledger(seller, product) == aggregated(seller, product)
+
+        item.delete()
+        assert ledger(seller, product) == (0, 0)
+
+    def test_status_update_skips_ledger(self, item, django_assert_num_queries):
+        item.seller_status = "shipped"
+        with django_assert_num_queries(1):
+            item.save(update_fields=["seller_status"])
+
+    def test_tracks_payouts(self, item, seller, product):
+        payout = SellerPayout.objects.create(
+            seller=seller,
+            order_item=item,
+            amount=Decimal("30.00"),
+            status="succeeded",
+        )
+        SellerPayout.objects.create(
+            seller=seller,
+            order_item=item,
+            amount=Decimal("5.00"),
+            status="failed",
+        )
+        assert ledger(seller, product) == aggregated(seller, product)
+
+        payout.amount = Decimal("20.00")
+        payout.save()
+        assert ledger(seller, product) == aggregated(seller, product)
+
+        payout.delete()
+        assert EarningsLedger.seller_total(seller) == Decimal("5.00")
+
+    def test_seller_deletion_cascades(self, item, seller):
+        SellerPayout.objects.create(seller=seller, order_item=item, amount=30)
+        seller.delete()
+        assert not SellerEarnings.objects.exists()
+        assert not SellerProductEarnings.objects.exists()
+
+    def test_rebuild_command(self, item, seller, product):
+        SellerPayout.objects.create(seller=seller, order_item=item, amount=30)
+        SellerEarnings.objects.update(total=999)
+        SellerProductEarnings.objects.all().delete()
+
+        call_command("rebuild_earnings_ledger")
+
+        assert ledger(seller, product) == aggregated(seller, product)
+
+    def test_point_reads(self, item, seller, product, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            ledger(seller, product)
+
+
+class TestSalesDeltas:
+    def test_changes_are_queued_until_drained(self, item, seller, product):
+        assert not SellerProductEarnings.objects.exists()
+        assert SellerSalesDelta.objects.count() == 1
+        # Reads include the deltas not applied yet.
+        assert ledger(seller, product) == (0, Decimal("30.00"))
+
+        assert SalesDeltas.drain() == 1
+
+        assert not SellerSalesDelta.objects.exists()
+        assert SellerProductEarnings.objects.get().total == Decimal("30.00")
+        assert ledger(seller, product) == (0, Decimal("30.00"))
+
+    def test_deltas_of_deleted_products_are_dropped(self, item, seller, product):
+        SalesDeltas.drain()
+        product.delete()
+        SellerSalesDelta.objects.create(
+            seller=seller,
+            product_id=product.pk,
+            occurred_at=item.created_at,
+            earnings=5,
+        )
+
+        assert SalesDeltas.drain() == 2  # noqa: PLR2004
+        assert not SellerProductEarnings.objects.exists()
+
+    def test_drain_command(self, item, capsys):
+        call_command("drain_sales_deltas", "--once")
+        assert "Applied 1 deltas" in capsys.readouterr().out
+        assert not SellerSalesDelta.objects.exists()
+
+
+class TestProductEarningsEndpoint:
+    @pytest.fixture
+    def client(self, seller):
+        client = APIClient()
+        client.force_authenticate(user=seller.user)
+        return client
+
+    def test_product_total(self, client, item, product):
+        response = client.get(
+            reverse("api:seller-product-earnings"),
+            {"product_id": product.pk},
+        )
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.data["total_earnings"] == "30.00"
+
+    @pytest.mark.parametrize("params", [{}, {"product_id": "abc"}, {"product_id": "0"}])
+    def test_bad_product_id(self, client, params):
+        response = client.get(reverse("api:seller-product-earnings"), params)
+        assert response.status_code == 400  # noqa: PLR2004
@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerPayout
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def add_item(db):
+    user = User.objects.create_user(username="buyer")
+    customer = Customer.objects.create(user=user)
+    address = Address.objects.create(
+        user=user,
+        street="1 Rd",
+        city="Town",
+        country="Land",
+        postal_code="1",
+    )
+
+    def add_item(seller, status="pending"):
+        order = Order.objects.create(
+            customer=customer,
+            total_amount=20,
+            platform_commission=2,
+            shipping_address=address,
+        )
+        item = OrderItem.objects.create(
+            order=order,
+            product=Product.objects.create(
+                name="Lamp",
+                description="d",
+                price=10,
+                seller=seller,
+            ),
+            seller=seller,
+            quantity=2,
+            price_at_time=10,
+            seller_payout_amount=Decimal(18),
+            seller_status=status,
+        )
+        SellerPayout.objects.create(
+            seller=seller,
+            order_item=item,
+            amount=item.seller_payout_amount,
+            stripe_transfer_id="tr_1",
+        )
+        return item
+
+    return add_item
+
+
+@pytest.fixture
+def client(seller):
+    client = APIClient()
+    client.force_authenticate(user=seller.user)
+    return client
+
+
+def streamed(response):
+    assert response.status_code == 200  # noqa: PLR2004
+    return b"".join(response.streaming_content).decode()
+
+
+class TestSellerExports:
+    def test_order_items(self, client, seller, add_item):
+        item = add_item(seller)
+        add_item(Seller.objects.create(user=UserFactory(username="x")))
+
+        body = streamed(client.get(reverse("api:seller-export-orders")))
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(item.id)
+        assert rows[0]["order_number"] == item.order.order_number
+        assert rows[0]["price_at_time"] == "10.00"
+        assert rows[0]["seller_payout_amount"] == "18.00"
+
+    def test_order_items_take_filters(self, client, seller, add_item):
+        add_item(seller)
+        shipped = add_item(seller, status="shipped")
+
+        body = streamed(
+            client.get(
+                reverse("api:seller-export-orders"),
+                {"status": "shipped", "format": "ndjson"},
+            ),
+        )
+
+        assert [json.loads(line)["id"] for line in body.splitlines()] == [shipped.id]
+        response = client.get(reverse("api:seller-export-orders"), {"status": "?"})
+        assert response.status_code == 400  # noqa: PLR2004
+
+    def test_payouts(self, client, seller, add_item):
+        item = add_item(seller)
+
+        body = streamed(
+            client.get(reverse("api:seller-export-payouts"), {"format": "ndjson"}),
+        )
+
+        payout = json.loads(body)
+        assert payout["order_item"] == item.id
+        assert payout["amount"] == "18.00"
+        assert payout["processed_at"] is None
+
+    def test_customers_get_404(self, db):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username="nobody"))
+
+        for name in ("api:seller-export-orders", "api:seller-export-payouts"):
+            assert client.get(reverse(name)).status_code == 404  # noqa: PLR2004
+
+
+class TestExportDataCommand:
+    def test_exports_to_file(self, seller, add_item, tmp_path):
+        add_item(seller)
+        add_item(seller)
+        path = tmp_path / "payouts.ndjson"
+
+        call_command("export_data", "payouts", "--format=ndjson", f"--output={path}")
+
+        assert len(path.read_text().splitlines()) == 2  # noqa: PLR2004
+
+    def test_seller_filter(self, seller, add_item, tmp_path):
+        add_item(seller)
+        add_item(Seller.objects.create(user=UserFactory(username="x")))
+        path = tmp_path / "products.csv"
+
+        call_command("export_data", "products", "--seller=x", f"--output={path}")
+
+        rows = list(csv.DictReader(path.open()))
+        assert [row["seller"] for row in rows] == ["x"]
+
+    def test_unknown_seller(self, db, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("export_data", "order-items", "--seller=nobody")
@@ -0,0 +1,174 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from e_commerce.orders.api.readers import OrderItemReader
+from e_commerce.orders.api.readers import OrderReader
+from e_commerce.orders.api.serializers import OrderItemSerializer
+from e_commerce.orders.api.serializers import OrderSerializer
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import Payment
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import User
+from e_commerce.utils.renderers import OrjsonRenderer
+
+
+@pytest.fixture
+def customer(db):
+    return Customer.objects.create(user=User.objects.create_user(username="buyer"))
+
+
+@pytest.fixture
+def orders(customer, seller):
+    address = Address.objects.create(
+        user=customer.user,
+        street="1 Buyer Rd",
+        city="Buyville",
+        country="Testland",
+        postal_code="54321",
+    )
+    products = [
+        Product.objects.create(
+            name=f"Product {index}",
+            description="desc",
+            price=10,
+            seller=seller,
+        )
+        for index in range(2)
+    ]
+    paid = Order.objects.create(
+        customer=customer,
+        total_amount=Decimal("25.10"),
+        platform_commission=Decimal("0.99"),
+        shipping_address=address,
+        shipping_cost=Decimal("5.00"),
+    )
+    for product, price in zip(products, ("10.05", "0.00"), strict=True):
+        OrderItem.objects.create(
+            order=paid,
+            product=product,
+            seller=seller,
+            quantity=2,
+            price_at_time=Decimal(price),
+            seller_payout_amount=Decimal(price) * 2,
+            stripe_transfer_id="tr_1",
+        )
+    Payment.objects.create(
+        order=paid,
+        stripe_payment_intent_id="pi_1",
+        amount=Decimal("25.10"),
+        stripe_metadata={"order": str(paid.pk), "nested": {"a": [1, 2]}},
+    )
+    unpaid = Order.objects.create(
+        customer=customer,
+        total_amount=0,
+        platform_commission=0,
+        shipping_address=address,
+    )
+    return [paid, unpaid]
+
+
+def normalized(orders):
+    # OrderSerializer leaves the order of items to the database.
+    return [
+        {**order, "items": sorted(order["items"], key=lambda item: item["id"])}
+        for order in orders
+    ]
+
+
+def assert_same_output(data, expected):
+    if data and "items" in data[0]:
+        data, expected = normalized(data), normalized(expected)
+    assert data == expected
+    assert [list(row) for row in data] == [list(row) for row in expected]
+    renderer = OrjsonRenderer()
+    assert renderer.render(data) == renderer.render(expected)
+
+
+class TestOrderReader:
+    def test_matches_serializer(self, orders):
+        queryset = Order.objects.order_by("created_at")
+
+        expected = OrderSerializer(
+            OrderSerializer.setup_eager_loading(queryset),
+            many=True,
+        ).data
+        data = OrderReader().read(OrderReader.rows(queryset))
+
+        assert data[0]["payment"] is not None
+        assert data[1]["payment"] is None
+        assert data[1]["items"] == []
+        assert_same_output(data, expected)
+        assert [list(item) for item in data[0]["items"]] == [
+            list(item) for item in normalized(expected)[0]["items"]
+        ]
+
+    def test_matches_serializer_in_other_timezone(self, orders):
+        queryset = Order.objects.order_by("created_at")
+        with timezone.override("Asia/Tokyo"):
+            expected = OrderSerializer(queryset, many=True).data
+            data = OrderReader().read(OrderReader.rows(queryset))
+
+        assert_same_output(data, expected)
+
+    def test_fixed_query_count(self, orders, django_assert_num_queries):
+        rows = list(OrderReader.rows(Order.objects.all()))
+        # items
+        with django_assert_num_queries(1):
+            OrderReader().read(rows)
+
+
+class TestOrderItemReader:
+    def test_matches_serializer(self, orders):
+        queryset = OrderItem.objects.order_by("id")
+
+        expected = OrderItemSerializer(queryset, many=True).data
+        data = OrderItemReader().read(OrderItemReader.rows(queryset))
+
+        assert_same_output(data, expected)
+
+
+class TestListEndpoints:
+    def test_order_list(self, orders, customer):
+        client = APIClient()
+        client.force_authenticate(customer.user)
+
+        response = client.get(reverse("api:order-list"))
+
+        expected = OrderSerializer(Order.objects.order_by("-created_at"), many=True)
+        assert response.json()["next"] is None
+        assert OrjsonRenderer().render(
+            normalized(response.json()["results"]),
+        ) == OrjsonRenderer().render(normalized(expected.data))
+
+    def test_customer_orders(self, orders, customer):
+        client = APIClient()
+        client.force_authenticate(customer.user)
+
+        response = client.get(reverse("api:customer-my-orders"))
+
+        expected = OrderSerializer(Order.objects.order_by("-created_at"), many=True)
+        assert response.json()["next"] is None
+        assert OrjsonRenderer().render(
+            normalized(response.json()["results"]),
+        ) == OrjsonRenderer().render(normalized(expected.data))
+
+    def test_seller_orders(self, orders, seller):
+        client = APIClient()
+        client.force_authenticate(seller.user)
+
+        response = client.get(reverse("api:seller-orders"))
+
+        expected = OrderItemSerializer(
+            OrderItem.objects.order_by("-created_at", "-id"),
+            many=True,
+        )
+        assert response.content == OrjsonRenderer().render(
+            {"next": None, "previous": None, "results": expected.data},
+        )
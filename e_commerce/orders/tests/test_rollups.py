@@ -0,0 +1,228 @@
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.models import SellerSalesRollup
+from e_commerce.orders.services.deltas import SalesDeltas
+from e_commerce.orders.services.rollups import SalesRollups
+from e_commerce.orders.services.rollups import bucket_start
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import User
+
+ROLLUP_FIELDS = ("seller_id", "product_id", "bucket", "units", "revenue", "earnings")
+
+
+@pytest.fixture
+def product(seller):
+    return Product.objects.create(
+        name="Product",
+        description="desc",
+        price=10,
+        seller=seller,
+    )
+
+
+@pytest.fixture
+def order(db):
+    user = User.objects.create_user(username="buyer")
+    return Order.objects.create(
+        customer=Customer.objects.create(user=user),
+        total_amount=30,
+        platform_commission=0,
+        shipping_address=Address.objects.create(
+            user=user,
+            street="1 Buyer Rd",
+            city="Buyville",
+            country="Testland",
+            postal_code="54321",
+        ),
+    )
+
+
+@pytest.fixture
+def item(order, product, seller):
+    return OrderItem.objects.create(
+        order=order,
+        product=product,
+        seller=seller,
+        price_at_time=10,
+        quantity=3,
+        seller_payout_amount=Decimal("27.00"),
+    )
+
+
+def rollup_rows(granularity):
+    return sorted(
+        SellerSalesRollup.objects.filter(
+            granularity=granularity,
+            product__isnull=False,
+        ).values_list(*ROLLUP_FIELDS),
+    )
+
+
+def rebuild_window(item):
+    start = bucket_start(item.created_at, "day")
+    return start, start + timedelta(days=1)
+
+
+class TestSalesRollups:
+    def test_item_creates_hour_and_day_rows(self, item):
+        assert not SellerSalesRollup.objects.exists()
+        SalesDeltas.drain_all()
+        for granularity in ("hour", "day"):
+            row = SellerSalesRollup.objects.get(
+                granularity=granularity,
+                product=item.product,
+            )
+            assert row.bucket == bucket_start(item.created_at, granularity)
+            assert row.units == 3  # noqa: PLR2004
+            assert row.revenue == Decimal("30.00")
+            assert row.earnings == Decimal("27.00")
+
+    def test_update_and_delete_apply_deltas(self, item):
+        item.quantity = 5
+        item.save()
+        SalesDeltas.drain_all()
+        row = SellerSalesRollup.objects.get(granularity="day", product=item.product)
+        assert row.units == 5  # noqa: PLR2004
+
+        item.delete()
+        SalesDeltas.drain_all()
+        row = SellerSalesRollup.objects.get(granularity="day", product=item.product)
+        assert row.units == 0
+        assert row.revenue == 0
+
+    def test_payouts_are_product_less_rows(self, item, seller):
+        SellerPayout.objects.create(
+            seller=seller,
+            order_item=item,
+            amount=Decimal("27.00"),
+            stripe_transfer_id="tr_1",
+        )
+        SalesDeltas.drain_all()
+        row = SellerSalesRollup.objects.get(granularity="day", product__isnull=True)
+        assert row.payouts == Decimal("27.00")
+
+    def test_incremental_rows_match_rebuild(self, item, order, seller):
+        OrderItem.objects.create(
+            order=order,
+            product=Product.objects.create(
+                name="Other",
+                description="desc",
+                price=4,
+                seller=seller,
+            ),
+            seller=seller,
+            price_at_time=4,
+            quantity=2,
+            seller_payout_amount=Decimal("7.20"),
+        )
+        SalesDeltas.drain_all()
+        expected = {g: rollup_rows(g) for g in ("hour", "day")}
+        start, end = rebuild_window(item)
+        for granularity in ("hour", "day"):
+            SalesRollups.rebuild(granularity, start, end)
+            assert rollup_rows(granularity) == expected[granularity]
+
+    def test_series_sums_products_and_payouts(self, item, seller):
+        SellerPayout.objects.create(
+            seller=seller,
+            order_item=item,
+            amount=Decimal("27.00"),
+            stripe_transfer_id="tr_1",
+        )
+        SalesDeltas.drain_all()
+        start, end = rebuild_window(item)
+        (point,) = SalesRollups.series(seller, "day", start, end)
+        assert point["units"] == 3  # noqa: PLR2004
+        assert point["revenue"] == Decimal("30.00")
+        assert point["payouts"] == Decimal("27.00")
+
+
+class TestCompactSalesRollups:
+    def test_prunes_expired_hourly_rows(self, seller):
+        old = datetime(2020, 1, 1, 5, tzinfo=UTC)
+        SellerSalesRollup.objects.create(
+            seller=seller,
+            granularity="hour",
+            bucket=old,
+            units=1,
+        )
+        pruned, _ = SalesRollups.compact(
+            timezone.now(),
+            hourly_retention_days=35,
+            rebuild_days=2,
+        )
+        assert pruned == 1
+        assert not SellerSalesRollup.objects.filter(bucket=old).exists()
+
+    def test_command_repairs_drift(self, item, capsys):
+        OrderItem.objects.filter(pk=item.pk).update(quantity=4)
+        call_command("compact_sales_rollups")
+        row = SellerSalesRollup.objects.get(granularity="day", product=item.product)
+        assert row.units == 4  # noqa: PLR2004
+        assert "rebuilt" in capsys.readouterr().out
+
+
+class TestSellerAnalyticsEndpoint:
+    @pytest.fixture
+    def client(self, seller):
+        client = APIClient()
+        client.force_authenticate(user=seller.user)
+        return client
+
+    def test_url(self):
+        assert reverse("api:seller-analytics") == "/api/sellers/analytics/"
+
+    def test_daily_series(self, client, item):
+        SalesDeltas.drain_all()
+        response = client.get(
+            reverse("api:seller-analytics"),
+            {"granularity": "day"},
+        )
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.data["granularity"] == "day"
+        (point,) = response.data["results"]
+        assert point["units"] == 3  # noqa: PLR2004
+        assert point["revenue"] == "30.00"
+
+    def test_range_excludes_to(self, client, item):
+        day = bucket_start(item.created_at, "day").date()
+        response = client.get(
+            reverse("api:seller-analytics"),
+            {"from": (day - timedelta(days=3)).isoformat(), "to": day.isoformat()},
+        )
+        assert response.data["results"] == []
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"granularity": "week"},
+            {"from": "yesterday"},
+            {"from": "2024-02-01", "to": "2024-01-01"},
+            {"granularity": "hour", "from": "2020-01-01", "to": "2024-01-01"},
+            {"product_id": "abc"},
+            {"product_id": "0"},
+        ],
+    )
+    def test_bad_params(self, client, seller, params):
+        response = client.get(reverse("api:seller-analytics"), params)
+        assert response.status_code == 400  # noqa: PLR2004
+
+    def test_requires_seller(self, db):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username="plain"))
+        response = client.get(reverse("api:seller-analytics"))
+        assert response.status_code == 404  # noqa: PLR2004
@@ -0,0 +1,175 @@
+import re
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+
+@pytest.fixture
+def customer(db):
+    user = User.objects.create_user(username="buyer", password="pass")  # noqa: S106
+    return Customer.objects.create(user=user)
+
+
+@pytest.fixture
+def sellers(db):
+    return [
+        Seller.objects.create(
+            user=User.objects.create_user(username=f"seller{index}"),
+            shop_name=f"Shop {index}",
+        )
+        for index in range(2)
+    ]
+
+
+@pytest.fixture
+def address(customer):
+    return Address.objects.create(
+        user=customer.user,
+        street="1 Buyer Rd",
+        city="Buyville",
+        country="Testland",
+        postal_code="54321",
+    )
+
+
+@pytest.fixture
+def make_orders(customer, sellers, address):
+    def make(count):
+        orders = []
+        for index in range(count):
+            order = Order.objects.create(
+                customer=customer,
+                total_amount=20,
+                platform_commission=0,
+                shipping_address=address,
+            )
+            for seller in sellers:
+                product = Product.objects.create(
+                    name=f"Product {index} {seller.pk}",
+                    description="desc",
+                    price=10,
+                    seller=seller,
+                )
+                OrderItem.objects.create(
+                    order=order,
+                    product=product,
+                    seller=seller,
+                    price_at_time=10,
+                    seller_payout_amount=10,
+                )
+            orders.append(order)
+        return orders
+
+    return make
+
+
+@pytest.fixture
+def client(customer):
+    client = APIClient()
+    client.force_authenticate(user=customer.user)
+    return client
+
+
+class TestOrderViewSet:
+    def test_list_constant_queries(
+        self,
+        client,
+        make_orders,
+        django_assert_num_queries,
+    ):
+        url = reverse("api:order-list")
+        make_orders(1)
+        # savepoint, profile, orders page, items, release
+        with django_assert_num_queries(5):
+            client.get(url)
+        make_orders(9)
+        with django_assert_num_queries(4):
+            response = client.get(url)
+        assert len(response.data["results"]) == 10  # noqa: PLR2004
+
+    def test_list_shape(self, client, make_orders, customer):
+        make_orders(1)
+        response = client.get(reverse("api:order-list"))
+        order = response.data["results"][0]
+        assert order["customer_name"] == customer.user.username
+        assert len(order["items"]) == 2  # noqa: PLR2004
+        for item in order["items"]:
+            assert item["shipping_address"]["city"] == "Buyville"
+            assert list(item)[-1] == "shipping_address"
+        assert {item["seller_name"] for item in order["items"]} == {
+            "seller0",
+            "seller1",
+        }
+
+    def test_list_pagination(self, client, make_orders):
+        orders = make_orders(3)
+        response = client.get(reverse("api:order-list"), {"page_size": 2})
+        assert [row["id"] for row in response.data["results"]] == [
+            str(orders[2].id),
+            str(orders[1].id),
+        ]
+        response = client.get(response.data["next"])
+        assert [row["id"] for row in response.data["results"]] == [str(orders[0].id)]
+
+    def test_retrieve(self, client, make_orders):
+        order = make_orders(1)[0]
+        response = client.get(reverse("api:order-detail", kwargs={"pk": order.pk}))
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.data["order_number"] == order.order_number
+
+
+class TestOrderNumbers:
+    def test_allocated_by_the_insert(
+        self,
+        customer,
+        address,
+        django_assert_num_queries,
+    ):
+        with django_assert_num_queries(1):
+            order = Order.objects.create(
+                customer=customer,
+                total_amount=0,
+                platform_commission=0,
+                shipping_address=address,
+            )
+        assert re.fullmatch(r"ORD-\d{8}-\d{6,}", order.order_number)
+
+    def test_ascending_and_unique(self, make_orders):
+        numbers = [order.order_number for order in make_orders(3)]
+        sequence = [int(number.rsplit("-", 1)[1]) for number in numbers]
+        assert sequence == sorted(set(sequence))
+
+    def test_lookup(self, client, make_orders):
+        order = make_orders(1)[0]
+        url = reverse(
+            "api:order-by-number",
+            kwargs={"order_number": order.order_number},
+        )
+        response = client.get(url)
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.data["id"] == str(order.id)
+
+    def test_lookup_other_customer(self, make_orders):
+        order = make_orders(1)[0]
+        other = Customer.objects.create(user=User.objects.create_user(username="x"))
+        client = APIClient()
+        client.force_authenticate(user=other.user)
+        url = reverse(
+            "api:order-by-number",
+            kwargs={"order_number": order.order_number},
+        )
+        assert client.get(url).status_code == 404  # noqa: PLR2004
+
+    def test_time_ordered_ids(self, make_orders):
+        orders = make_orders(3)
+        assert all(order.id.version == 7 for order in orders)  # noqa: PLR2004
+        assert [order.id for order in orders] == sorted(order.id for order in orders)
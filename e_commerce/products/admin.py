@@ -1,5 +1,8 @@
 from django.contrib import admin
 
+from e_commerce.utils.admin import LargeTableAdmin
+from e_commerce.utils.admin import RelatedIdFilter
+
 from .models import Category
 from .models import Product
 from .models import ProductImage
@@ -15,19 +18,24 @@ class CategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(LargeTableAdmin):
     """Admin panel for products."""
 
     list_display = ["id", "name", "price", "seller", "created_at", "available_quantity"]
+    list_select_related = ["seller__user"]
     search_fields = ["name", "seller__user__username"]
     ordering = ["id"]
-    list_filter = ["categories"]
+    list_filter = ["categories", ("seller", RelatedIdFilter)]
+    autocomplete_fields = ["seller", "categories"]
 
 
 @admin.register(ProductImage)
-class ProductImageAdmin(admin.ModelAdmin):
+class ProductImageAdmin(LargeTableAdmin):
     """Admin panel for product images."""
 
-    list_display = ["id", "product", "image"]
+    list_display = ["id", "product", "image", "renditions_ready_at"]
+    list_select_related = ["product"]
     search_fields = ["product__name"]
     ordering = ["id"]
+    list_filter = [("product", RelatedIdFilter)]
+    autocomplete_fields = ["product"]
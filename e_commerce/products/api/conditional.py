@@ -0,0 +1,54 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+
+from e_commerce.products.services.catalog import CatalogVersion
+
+
+class ConditionalGetMixin:
+    """
+    Strong ETag support for read-only catalog actions. Views call
+    not_modified() with a cheap version key before touching any queryset; a
+    matching If-None-Match returns 304 right away, otherwise the ETag is
+    added to the full response. There is no Last-Modified: its one-second
+    resolution would answer 304 for changes made within the same second.
+    """
+
+    _etag = None
+
+    def not_modified(self, request, version):
+        """Return a 304 response for a fresh client cache, else None"""
+        # The body also depends on the renderer and, through absolute media
+        # URLs, on the host.
+        renderer = getattr(request, "accepted_renderer", None)
+        key = "|".join(
+            [
+                str(version),
+                renderer.format if renderer else "",
+                request.get_host(),
+                request.get_full_path(),
+            ],
+        )
+        etag = quote_etag(hashlib.sha256(key.encode()).hexdigest()[:32])
+        self._etag = etag
+        return get_conditional_response(
+            getattr(request, "_request", request),
+            etag=etag,
+        )
+
+    def catalog_not_modified(self, request):
+        return self.not_modified(request, CatalogVersion.current())
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self._etag and response.status_code in (200, 304):
+            response.headers["ETag"] = self._etag
+            # Revalidate on every use instead of heuristic freshness.
+            patch_cache_control(
+                response,
+                no_cache=True,
+                private=request.user.is_authenticated,
+            )
+        return response
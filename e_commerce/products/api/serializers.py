@@ -1,16 +1,44 @@
-from rest_framework import serializers  # noqa: I001
+from decimal import Decimal  # noqa: I001
+from pathlib import PurePath
 
-from e_commerce.products.models import Product, ProductImage, Category
+from django.db import transaction
+from rest_framework import serializers
+
+from e_commerce.products.models import Product, ProductImage, Category, ProductImport
+from e_commerce.products.services.uploads import MAX_PRODUCT_IMAGES
+from e_commerce.products.services.uploads import ProductImageUploads
+
+# Product.available_quantity is a Postgres integer; larger values would fail
+# the whole write with a DataError instead of a 400 for the row.
+MAX_AVAILABLE_QUANTITY = 2147483647
 
 
 class ProductImageSerializer(serializers.ModelSerializer):
+    # {"webp": "<url> 160w, <url> 320w", ...}; empty until the renditions
+    # worker has processed the upload, so clients fall back to `image`.
+    srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = ProductImage
-        fields = ["id", "product", "image"]
+        fields = ["id", "product", "image", "srcset"]
         extra_kwargs = {
             "image": {"required": True},
         }
 
+    def get_srcset(self, obj):
+        storage = obj.image.storage
+        request = self.context.get("request")
+        srcset = {}
+        for fmt, paths in obj.renditions.items():
+            candidates = []
+            for width, path in sorted(paths.items(), key=lambda item: int(item[0])):
+                url = storage.url(path)
+                if request is not None:
+                    url = request.build_absolute_uri(url)
+                candidates.append(f"{url} {width}w")
+            srcset[fmt] = ", ".join(candidates)
+        return srcset
+
     def create(self, validated_data):
         product = validated_data.get("product")
         return ProductImage.objects.create(product=product, **validated_data)
@@ -59,17 +87,25 @@ class ProductSerializer(serializers.ModelSerializer):
 
         if len(images_data) < 1:
             raise serializers.ValidationError("At least one image is required.")  # noqa: EM101, TRY003
-        if len(images_data) > 6:  # noqa: PLR2004
-            raise serializers.ValidationError("A maximum of 6 images is allowed.")  # noqa: EM101, TRY003
-
-        # Create the product instance without images first
-        product = Product.objects.create(seller=seller, **validated_data)
-
-        product.categories.set(categories)
-
-        # Create and associate images with the product
-        for image_data in images_data:
-            ProductImage.objects.create(product=product, image=image_data)
+        if len(images_data) > MAX_PRODUCT_IMAGES:
+            msg = f"A maximum of {MAX_PRODUCT_IMAGES} images is allowed."
+            raise serializers.ValidationError(msg)
+
+        # Check and write the files before opening the transaction, so it
+        # only spans the inserts below.
+        ProductImageUploads.validate(images_data)
+        image_names = ProductImageUploads.store(images_data)
+
+        try:
+            with transaction.atomic():
+                product = Product.objects.create(seller=seller, **validated_data)
+                product.categories.set(categories)
+                ProductImage.objects.bulk_create(
+                    ProductImage(product=product, image=name) for name in image_names
+                )
+        except Exception:
+            ProductImageUploads.discard(image_names)
+            raise
 
         return product
 
@@ -78,3 +114,102 @@ class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name"]
+
+
+class ProductImportRowSerializer(serializers.Serializer):
+    """
+    One row of a product import file. Categories are given by name and
+    resolved through context["category_ids"], a name to id map, so
+    validating a row does not touch the database.
+    """
+
+    name = serializers.CharField(max_length=100)
+    description = serializers.CharField(allow_blank=True, default="")
+    price = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        min_value=Decimal(0),
+    )
+    available_quantity = serializers.IntegerField(
+        min_value=0,
+        max_value=MAX_AVAILABLE_QUANTITY,
+        default=1,
+    )
+    categories = serializers.ListField(child=serializers.CharField(), default=list)
+
+    def validate_categories(self, names):
+        category_ids = self.context["category_ids"]
+        unknown = [name for name in names if name not in category_ids]
+        if unknown:
+            msg = f"Unknown categories: {', '.join(unknown)}."
+            raise serializers.ValidationError(msg)
+        return [category_ids[name] for name in dict.fromkeys(names)]
+
+
+class ProductBulkUpdateRowSerializer(serializers.Serializer):
+    """One row of a bulk price and stock update; either field may be left out"""
+
+    id = serializers.IntegerField(min_value=1)
+    price = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        min_value=Decimal(0),
+        required=False,
+    )
+    available_quantity = serializers.IntegerField(
+        min_value=0,
+        max_value=MAX_AVAILABLE_QUANTITY,
+        required=False,
+    )
+
+    def validate(self, attrs):
+        if "price" not in attrs and "available_quantity" not in attrs:
+            msg = "Give a price, an available_quantity or both."
+            raise serializers.ValidationError(msg)
+        return attrs
+
+
+class ProductImportSerializer(serializers.ModelSerializer):
+    # Inferred from the file extension when not given.
+    format = serializers.ChoiceField(
+        choices=ProductImport.FORMAT_CHOICES,
+        required=False,
+    )
+
+    class Meta:
+        model = ProductImport
+        fields = [
+            "id",
+            "file",
+            "format",
+            "status",
+            "rows",
+            "imported",
+            "failed",
+            "error",
+            "report",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = [
+            "status",
+            "rows",
+            "imported",
+            "failed",
+            "error",
+            "report",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        extra_kwargs = {"file": {"write_only": True}}
+
+    def validate(self, attrs):
+        if "format" not in attrs:
+            suffix = PurePath(attrs["file"].name).suffix.lower()
+            attrs["format"] = ProductImport.FORMAT_SUFFIXES.get(suffix)
+            if attrs["format"] is None:
+                msg = {"format": "Give the format of files not named .csv or .ndjson."}
+                raise serializers.ValidationError(msg)
+        return attrs
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler
+from django.template.defaultfilters import filesizeformat
+from rest_framework import serializers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from e_commerce.products.models import ProductImage
+from e_commerce.products.services.uploads import MAX_PRODUCT_IMAGES
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Uploaded file is too large."
+    default_code = "upload_too_large"
+
+
+class ProductImageUploadHandler(FileUploadHandler):
+    """
+    Streams product image uploads chunk by chunk into the media storage
+    (see StagedUpload), so a request holds at most one chunk in memory
+    however large it is. Too many or oversized files abort the request as
+    soon as they are noticed.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.storage = ProductImage._meta.get_field("image").storage  # noqa: SLF001
+        self.max_size = settings.PRODUCT_IMAGE_MAX_UPLOAD_SIZE
+        self.staged = []
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        if len(self.staged) >= MAX_PRODUCT_IMAGES:
+            self.upload_interrupted()
+            msg = f"A maximum of {MAX_PRODUCT_IMAGES} images is allowed."
+            raise serializers.ValidationError(msg)
+        if self.content_length and self.content_length > self.max_size:
+            self.too_large()
+        self.staged.append(
+            self.storage.stage(
+                self.file_name,
+                self.content_type,
+                self.charset,
+                self.content_type_extra,
+            ),
+        )
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > self.max_size:
+            self.too_large()
+        self.staged[-1].write(raw_data)
+
+    def file_complete(self, file_size):
+        upload = self.staged[-1]
+        upload.seek(0)
+        return upload
+
+    def upload_interrupted(self):
+        for upload in self.staged:
+            upload.close()
+
+    def too_large(self):
+        self.upload_interrupted()
+        msg = (
+            f"{self.file_name}: images may be at most {filesizeformat(self.max_size)}."
+        )
+        raise UploadTooLarge(msg)
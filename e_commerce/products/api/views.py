@@ -1,4 +1,7 @@
-from rest_framework import status  # noqa: I001
+from django.core.exceptions import ValidationError as DjangoValidationError  # noqa: I001
+from django.conf import settings
+from django.db import transaction
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.mixins import (
     ListModelMixin,
@@ -17,14 +20,22 @@ from rest_framework.permissions import (
 from rest_framework.exceptions import PermissionDenied
 import django_filters
 
-from e_commerce.products.models import Product, Category
+from e_commerce.products.models import Product, Category, ProductImport
+from e_commerce.products.api.conditional import ConditionalGetMixin
+from e_commerce.products.services.bulk import ProductBulkUpdate
+from e_commerce.products.services.catalog import CatalogVersion
+from e_commerce.products.services.exports import CatalogExports
+from e_commerce.users.profiles import get_seller
+from e_commerce.utils.exports import EXPORT_RENDERERS
 
-from .serializers import ProductSerializer, CategorySerializer
+from .readers import ProductCardReader, ProductReader
+from .serializers import ProductSerializer, CategorySerializer, ProductImportSerializer
+from .uploadhandlers import ProductImageUploadHandler
 
 
 class IsSeller(BasePermission):
     def has_permission(self, request, view):
-        return hasattr(request.user, "seller")
+        return get_seller(request) is not None
 
 
 class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
@@ -46,6 +57,7 @@ class ProductFilter(django_filters.FilterSet):
 
 
 class ProductViewSet(
+    ConditionalGetMixin,
     ListModelMixin,
     RetrieveModelMixin,
     CreateModelMixin,
@@ -59,6 +71,19 @@ class ProductViewSet(
     filter_backends = [django_filters.rest_framework.DjangoFilterBackend]
     filterset_class = ProductFilter
 
+    # Opt out of ATOMIC_REQUESTS: create writes image files before its own
+    # transaction, and the other writes are wrapped explicitly below.
+    @transaction.non_atomic_requests
+    def dispatch(self, request, *args, **kwargs):
+        return super().dispatch(request, *args, **kwargs)
+
+    def initialize_request(self, request, *args, **kwargs):
+        drf_request = super().initialize_request(request, *args, **kwargs)
+        if self.action in ("create", "update", "partial_update"):
+            # Stream image files into storage instead of memory/temp files.
+            request.upload_handlers = [ProductImageUploadHandler(request)]
+        return drf_request
+
     def get_permissions(self):
         """
         Return the permissions based on the request method.
@@ -69,45 +94,120 @@ class ProductViewSet(
         # For POST, PUT, DELETE, apply IsSeller
         return [IsSeller()]
 
+    def get_reader(self):
+        """
+        Row reader for list responses. ?view=card returns compact rows with
+        a description summary and only the first image.
+        """
+        if self.request.query_params.get("view") == "card":
+            return ProductCardReader(self.request)
+        return ProductReader(self.request)
+
     # override the list method to apply distinct filtering
     def list(self, request, *args, **kwargs):
+        not_modified = self.catalog_not_modified(request)
+        if not_modified:
+            return not_modified
+
         queryset = self.filter_queryset(self.get_queryset()).distinct()
+        reader = self.get_reader()
+        rows = reader.rows(queryset)
 
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(reader.read(page))
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(reader.read(rows))
 
     @action(detail=False, methods=["get"], permission_classes=[IsSeller])
     def my_products(self, request):
         """
         Custom action to get the current sellers's products.
         """
+        not_modified = self.not_modified(
+            request,
+            f"{CatalogVersion.current()}:{request.user.pk}",
+        )
+        if not_modified:
+            return not_modified
 
-        products = Product.objects.filter(seller=request.user.seller)
+        # Newest first unless ?ordering= says otherwise.
+        products = Product.objects.filter(seller=request.user.seller).order_by(
+            "-created_at",
+        )
 
         # Apply filtering
         filtered_products = self.filter_queryset(products).distinct()
 
+        reader = self.get_reader()
+        rows = reader.rows(filtered_products)
+
         # Apply pagination
-        page = self.paginate_queryset(filtered_products)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            serializer = ProductSerializer(
-                page,
-                many=True,
-                context={"request": request},
-            )
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(reader.read(page))
 
-        serializer = ProductSerializer(
-            products,
-            many=True,
-            context={"request": request},
-        )
-        return Response(serializer.data)
+        return Response(reader.read(rows))
+
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[IsSeller],
+        renderer_classes=EXPORT_RENDERERS,
+    )
+    def export(self, request):
+        """
+        Stream all of the current seller's products as CSV or NDJSON
+        (?format=csv|ndjson), narrowed by the list filters.
+        """
+        products = self.filter_queryset(
+            Product.objects.filter(seller=request.user.seller),
+        ).distinct()
+        export = CatalogExports.products(products)
+        return export.response(request.accepted_renderer.format)
+
+    @action(detail=False, methods=["post"], permission_classes=[IsSeller])
+    def bulk_update(self, request):
+        """
+        Change the price and/or available_quantity of many of the current
+        seller's products: the body is a list of {id, price,
+        available_quantity} rows. Valid rows are applied even when others
+        fail; the response has a result for every row.
+        """
+        rows = request.data
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"detail": "Expected a non-empty list of products."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > settings.PRODUCT_BULK_UPDATE_MAX_ROWS:
+            return Response(
+                {
+                    "detail": f"At most {settings.PRODUCT_BULK_UPDATE_MAX_ROWS} "
+                    "products can be updated at once.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        results = ProductBulkUpdate(get_seller(request)).apply(rows)
+        counts = dict.fromkeys(("updated", "unchanged", "failed"), 0)
+        for result in results:
+            counts[result["status"]] += 1
+        return Response({**counts, "results": results})
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            updated_at = (
+                Product.objects.filter(id=self.kwargs[self.lookup_field])
+                .values_list("updated_at", flat=True)
+                .first()
+            )
+        except (ValueError, DjangoValidationError):
+            updated_at = None  # Left to get_object() to answer 404.
+        if updated_at is not None:
+            not_modified = self.not_modified(request, updated_at.isoformat())
+            if not_modified:
+                return not_modified
+        return super().retrieve(request, *args, **kwargs)
 
     def create(self, request, *args, **kwargs):
         """Override create method to assign seller based on the authenticated user"""
@@ -134,6 +234,7 @@ class ProductViewSet(
             headers=headers,
         )
 
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         """Override update method to ensure seller can only update their own product"""
         product = self.get_object()
@@ -144,6 +245,7 @@ class ProductViewSet(
 
         return super().update(request, *args, **kwargs)
 
+    @transaction.atomic
     def destroy(self, request, *args, **kwargs):
         """Override destroy method to ensure seller can only delete their own product"""
         product = self.get_object()
@@ -155,7 +257,37 @@ class ProductViewSet(
         return super().destroy(request, *args, **kwargs)
 
 
+class ProductImportViewSet(
+    ListModelMixin,
+    RetrieveModelMixin,
+    CreateModelMixin,
+    GenericViewSet,
+):
+    """
+    Bulk product imports of the current seller. Uploading a CSV or NDJSON
+    file queues it for the run_product_imports worker and answers 202; poll
+    the import for its counts and the report of rejected rows.
+    """
+
+    serializer_class = ProductImportSerializer
+    permission_classes = [IsSeller]
+
+    def get_queryset(self):
+        return ProductImport.objects.filter(seller=get_seller(self.request)).order_by(
+            "-id",
+        )
+
+    def perform_create(self, serializer):
+        serializer.save(seller=get_seller(self.request))
+
+    def create(self, request, *args, **kwargs):
+        response = super().create(request, *args, **kwargs)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return response
+
+
 class CategoryViewSet(
+    ConditionalGetMixin,
     ListModelMixin,
     RetrieveModelMixin,
     CreateModelMixin,
@@ -173,3 +305,15 @@ class CategoryViewSet(
         else:
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
+
+    def list(self, request, *args, **kwargs):
+        not_modified = self.catalog_not_modified(request)
+        if not_modified:
+            return not_modified
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        not_modified = self.catalog_not_modified(request)
+        if not_modified:
+            return not_modified
+        return super().retrieve(request, *args, **kwargs)
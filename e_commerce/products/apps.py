@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProductsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "e_commerce.products"
+
+    def ready(self):
+        import e_commerce.products.signals  # noqa: F401
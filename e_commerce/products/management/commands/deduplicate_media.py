@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from e_commerce.products.models import ProductImage
+from e_commerce.users.models import User
+from e_commerce.utils.storages import BLOB_DIR
+
+MEDIA_FIELDS = [
+    (ProductImage, "image"),
+    (User, "profile_picture"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Move product images and profile pictures uploaded before the "
+        "content-addressed storage into the blob store, sharing duplicates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-originals",
+            action="store_true",
+            help="Leave the original files in place after moving them.",
+        )
+
+    def handle(self, *args, **options):
+        moved = missing = 0
+        for model, field_name in MEDIA_FIELDS:
+            field = model._meta.get_field(field_name)  # noqa: SLF001
+            storage = field.storage
+            names = (
+                model.objects.exclude(**{f"{field_name}__startswith": f"{BLOB_DIR}/"})
+                .exclude(**{f"{field_name}__in": ["", field.get_default()]})
+                .exclude(**{f"{field_name}__isnull": True})
+                .values(field_name)
+                .annotate(rows=Count("pk"))
+                .order_by(field_name)
+            )
+            for row in names.iterator():
+                name = row[field_name]
+                if not storage.exists(name):
+                    missing += 1
+                    continue
+                with transaction.atomic():
+                    blob = storage.adopt(name, references=row["rows"])
+                    model.objects.filter(**{field_name: name}).update(
+                        **{field_name: blob},
+                    )
+                if not options["keep_originals"]:
+                    storage.delete_unmanaged(name)
+                moved += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {moved} files into the blob store, {missing} missing.",
+            ),
+        )
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from e_commerce.products.services.renditions import ImageRenditions
+
+
+class Command(BaseCommand):
+    help = (
+        "Background worker that generates WebP/AVIF renditions of uploaded "
+        "product images. Runs until stopped unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5,
+            help="Seconds to sleep when there is nothing to process.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty.",
+        )
+        parser.add_argument(
+            "--regenerate",
+            action="store_true",
+            help="Queue every image again before processing.",
+        )
+
+    def handle(self, *args, **options):
+        if options["regenerate"]:
+            queued = ImageRenditions.reset()
+            self.stdout.write(f"Queued {queued} images for regeneration.")
+
+        processed = 0
+        while True:
+            count = ImageRenditions.process_pending(batch_size=options["batch_size"])
+            processed += count
+            if count:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+        self.stdout.write(self.style.SUCCESS(f"Rendered {processed} images."))
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from e_commerce.products.models import ProductImport
+from e_commerce.products.services.imports import ProductImporter
+from e_commerce.products.services.imports import ProductImportError
+from e_commerce.users.models import Seller
+
+
+class Command(BaseCommand):
+    help = (
+        "Import products for a seller from a CSV or NDJSON file with name, "
+        "description, price, available_quantity and categories columns. "
+        "Rejected rows are written to the report as NDJSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--seller", required=True, help="Seller username.")
+        parser.add_argument(
+            "--format",
+            choices=[fmt for fmt, _ in ProductImport.FORMAT_CHOICES],
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--report",
+            help="File to write rejected rows to. Defaults to stderr.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        fmt = options["format"] or ProductImport.FORMAT_SUFFIXES.get(
+            path.suffix.lower(),
+        )
+        if fmt is None:
+            msg = "Pass --format for files not named .csv or .ndjson."
+            raise CommandError(msg)
+        seller = Seller.objects.filter(user__username=options["seller"]).first()
+        if seller is None:
+            msg = f"No seller named {options['seller']}."
+            raise CommandError(msg)
+
+        report = (
+            Path(options["report"]).open("w")  # noqa: SIM115
+            if options["report"]
+            else self.stderr
+        )
+        importer = ProductImporter(seller, batch_size=options["batch_size"])
+        try:
+            with path.open("rb") as stream:
+                importer.run(
+                    stream,
+                    fmt,
+                    lambda entry: report.write(json.dumps(entry) + "\n"),
+                )
+        except ProductImportError as error:
+            raise CommandError(error) from error
+        finally:
+            if report is not self.stderr:
+                report.close()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {importer.imported} of {importer.rows} rows, "
+                f"{importer.failed} rejected.",
+            ),
+        )
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from e_commerce.products.services.imports import ProductImports
+
+
+class Command(BaseCommand):
+    help = (
+        "Background worker that runs product imports queued through the API. "
+        "Runs until stopped unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5,
+            help="Seconds to sleep when there is nothing to process.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+        while True:
+            if ProductImports.process_pending(batch_size=options["batch_size"]):
+                processed += 1
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+        self.stdout.write(self.style.SUCCESS(f"Ran {processed} imports."))
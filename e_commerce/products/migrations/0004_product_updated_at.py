@@ -0,0 +1,25 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_product_image_renditions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        # Existing products have not changed since they were created.
+        migrations.RunSQL(
+            'UPDATE products_product SET updated_at = created_at',
+            migrations.RunSQL.noop,
+        ),
+    ]
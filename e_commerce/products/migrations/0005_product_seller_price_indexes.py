@@ -0,0 +1,25 @@
+# Generated by Django 5.0.11 on 2026-10-19 18:29
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking writes on the products table.
+    atomic = False
+
+    dependencies = [
+        ('products', '0004_product_updated_at'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(fields=['seller', 'created_at'], name='product_seller_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(fields=['price'], name='product_price_idx'),
+        ),
+    ]
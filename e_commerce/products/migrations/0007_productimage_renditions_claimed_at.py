@@ -0,0 +1,18 @@
+# Generated by Django 5.0.11 on 2026-10-19 19:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_product_import'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productimage',
+            name='renditions_claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.11 on 2026-10-19 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_productimage_renditions_claimed_at'),
+        ('users', '0003_seller_stripe_account_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productimport',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='productimport',
+            index=models.Index(condition=models.Q(('status', 'running')), fields=['claimed_at'], name='productimport_running_idx'),
+        ),
+    ]
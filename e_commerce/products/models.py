@@ -6,8 +6,12 @@ from django.db.models import (  # noqa: I001
     TextField,
     DateTimeField,
     ImageField,
+    FileField,
     ForeignKey,
     ManyToManyField,
+    JSONField,
+    Index,
+    Q,
     CASCADE,
 )
 from django.core.exceptions import ValidationError
@@ -28,10 +32,20 @@ class Product(Model):
     description = TextField()
     price = DecimalField(max_digits=10, decimal_places=2)
     created_at = DateTimeField(auto_now_add=True)
+    # Also moved by image and category changes, see CatalogVersion.
+    updated_at = DateTimeField(auto_now=True)
     available_quantity = PositiveIntegerField(default=1)
     seller = ForeignKey(Seller, on_delete=CASCADE, related_name="products")
     categories = ManyToManyField(Category, related_name="products")
 
+    class Meta:
+        indexes = [
+            # Seller product lists, newest first.
+            Index(fields=["seller", "created_at"], name="product_seller_created_idx"),
+            # ?min_price= / ?max_price= filters and ?ordering=price.
+            Index(fields=["price"], name="product_price_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -43,6 +57,78 @@ class Product(Model):
 class ProductImage(Model):
     product = ForeignKey(Product, related_name="images", on_delete=CASCADE)
     image = ImageField(upload_to="product_images/")
+    # {"webp": {"320": "product_images/renditions/<id>/320w.webp", ...}, ...},
+    # filled in by the generate_image_renditions worker.
+    renditions = JSONField(default=dict, blank=True)
+    renditions_ready_at = DateTimeField(null=True, blank=True)
+    # Set while a worker renders the image; claims older than
+    # PRODUCT_IMAGE_RENDITION_CLAIM_TIMEOUT are taken over by other workers.
+    renditions_claimed_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            Index(
+                fields=["id"],
+                condition=Q(renditions_ready_at__isnull=True),
+                name="productimage_pending_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Image for {self.product.name}"
+
+
+class ProductImport(Model):
+    """
+    Bulk product import of a CSV or NDJSON file, queued through the API and
+    run by the run_product_imports worker (services.imports). Rows that
+    fail validation are skipped and listed in the NDJSON report. The staged
+    file is deleted once the job has finished.
+    """
+
+    FORMAT_CHOICES = [
+        ("csv", "CSV"),
+        ("ndjson", "NDJSON"),
+    ]
+    # Format of files whose format is not given.
+    FORMAT_SUFFIXES = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    seller = ForeignKey(Seller, on_delete=CASCADE, related_name="product_imports")
+    file = FileField(upload_to="product_imports/")
+    format = CharField(max_length=6, choices=FORMAT_CHOICES)
+    status = CharField(max_length=7, choices=STATUS_CHOICES, default="pending")
+    rows = PositiveIntegerField(default=0)
+    imported = PositiveIntegerField(default=0)
+    failed = PositiveIntegerField(default=0)
+    # Why the whole file was rejected, e.g. missing columns.
+    error = TextField(blank=True)
+    report = FileField(upload_to="product_imports/reports/", blank=True)
+    created_at = DateTimeField(auto_now_add=True)
+    started_at = DateTimeField(null=True, blank=True)
+    finished_at = DateTimeField(null=True, blank=True)
+    # Renewed by the running worker after every batch; claims older than
+    # PRODUCT_IMPORT_CLAIM_TIMEOUT are taken over by other workers.
+    claimed_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            Index(
+                fields=["id"],
+                condition=Q(status="pending"),
+                name="productimport_pending_idx",
+            ),
+            Index(
+                fields=["claimed_at"],
+                condition=Q(status="running"),
+                name="productimport_running_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Import {self.pk} of {self.seller_id} ({self.status})"
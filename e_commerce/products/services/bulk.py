@@ -0,0 +1,103 @@
+from django.db import connection
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from e_commerce.products.api.serializers import ProductBulkUpdateRowSerializer
+from e_commerce.products.models import Product
+from e_commerce.products.services.catalog import CatalogVersion
+from e_commerce.utils.prometheus import PRODUCT_BULK_UPDATE_ROWS
+
+
+class ProductBulkUpdate:
+    """
+    Price and stock changes to many products of one seller. Every row is
+    validated by one serializer, ownership is checked for all rows in one
+    query, and the changed rows are written by one UPDATE ... FROM (VALUES
+    ...) per batch_size rows. The catalog version moves once per call.
+    """
+
+    def __init__(self, seller, batch_size=1000):
+        self.seller = seller
+        self.batch_size = batch_size
+        self.validator = ProductBulkUpdateRowSerializer()
+
+    def apply(self, rows):
+        """
+        Apply rows of {id, price, available_quantity}; returns one result
+        per row, in order, with a status of updated, unchanged or failed.
+        """
+        results = []
+        changes = {}
+        for number, row in enumerate(rows, start=1):
+            result = {
+                "row": number,
+                "id": row.get("id") if isinstance(row, dict) else None,
+            }
+            results.append(result)
+            try:
+                data = self.validator.run_validation(row)
+            except serializers.ValidationError as invalid:
+                result.update(status="failed", errors=invalid.detail)
+                continue
+            if data["id"] in changes:
+                result.update(
+                    status="failed",
+                    errors={"id": ["Listed more than once."]},
+                )
+                continue
+            result["id"] = data["id"]
+            changes[data["id"]] = (result, data)
+
+        with transaction.atomic():
+            # Locked, so fields left out of a row are written back as read;
+            # in id order, so concurrent updates cannot deadlock.
+            current = {
+                pk: (price, quantity)
+                for pk, price, quantity in Product.objects.filter(
+                    seller=self.seller,
+                    pk__in=list(changes),
+                )
+                .select_for_update()
+                .order_by("pk")
+                .values_list("pk", "price", "available_quantity")
+            }
+            updates = []
+            for pk, (result, data) in changes.items():
+                if pk not in current:
+                    result.update(status="failed", errors={"id": ["Not found."]})
+                    continue
+                price, quantity = current[pk]
+                new = (
+                    data.get("price", price),
+                    data.get("available_quantity", quantity),
+                )
+                if new == (price, quantity):
+                    result["status"] = "unchanged"
+                    continue
+                result["status"] = "updated"
+                updates.append((pk, *new))
+            for start in range(0, len(updates), self.batch_size):
+                self.write(updates[start : start + self.batch_size])
+            if updates:
+                # Raw UPDATEs send no post_save signals.
+                CatalogVersion.bump()
+        for result in results:
+            PRODUCT_BULK_UPDATE_ROWS.labels(result["status"]).inc()
+        return results
+
+    def write(self, updates):
+        values = ", ".join(["(%s::bigint, %s::numeric, %s::integer)"] * len(updates))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {Product._meta.db_table} AS product "  # noqa: S608, SLF001
+                "SET price = v.price, available_quantity = v.available_quantity, "
+                "updated_at = %s "
+                f"FROM (VALUES {values}) AS v (id, price, available_quantity) "
+                "WHERE product.id = v.id AND product.seller_id = %s",
+                [
+                    timezone.now(),
+                    *(value for update in updates for value in update),
+                    self.seller.pk,
+                ],
+            )
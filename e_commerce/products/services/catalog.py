@@ -0,0 +1,53 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from e_commerce.products.models import Product
+from e_commerce.utils.prometheus import CATALOG_VERSION_BUMPS
+
+CATALOG_VERSION_KEY = "products:catalog-version"
+
+
+def _now_us():
+    return time.time_ns() // 1000
+
+
+class CatalogVersion:
+    """
+    Cache-held counter that moves forward on every catalog change (products,
+    their images and categories; see products.signals). Its value is the
+    microsecond timestamp of the last change, so it keeps moving forward
+    even if the key is evicted and restarts from the current time, which
+    only costs clients one full download.
+
+    Writes through queryset.update()/bulk_update() bypass the signals and
+    must call touch_products()/bump() themselves.
+    """
+
+    @staticmethod
+    def current():
+        version = cache.get(CATALOG_VERSION_KEY)
+        if version is None:
+            cache.add(CATALOG_VERSION_KEY, _now_us(), None)
+            version = cache.get(CATALOG_VERSION_KEY) or _now_us()
+        return version
+
+    @staticmethod
+    def bump():
+        def advance():
+            previous = cache.get(CATALOG_VERSION_KEY) or 0
+            cache.set(CATALOG_VERSION_KEY, max(_now_us(), previous + 1), None)
+
+        # Again after commit, so no reader caches pre-commit data under the
+        # new version.
+        advance()
+        transaction.on_commit(advance)
+        CATALOG_VERSION_BUMPS.inc()
+
+    @staticmethod
+    def touch_products(product_ids):
+        """Mark products changed through their images or categories"""
+        Product.objects.filter(pk__in=product_ids).update(updated_at=timezone.now())
+        CatalogVersion.bump()
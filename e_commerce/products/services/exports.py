@@ -0,0 +1,39 @@
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import OuterRef
+
+from e_commerce.products.models import Product
+from e_commerce.utils.exports import Export
+from e_commerce.utils.rows import decimal_string
+from e_commerce.utils.rows import iso_datetime
+
+
+class CatalogExports:
+    """
+    Full exports of catalog tables. Product exports carry the columns the
+    product import reads, so an exported CSV can be imported again.
+    """
+
+    @staticmethod
+    def products(queryset=None):
+        if queryset is None:
+            queryset = Product.objects.all()
+        categories = (
+            Product.categories.through.objects.filter(product_id=OuterRef("pk"))
+            .order_by("category__name")
+            .values("category__name")
+        )
+        return Export(
+            "products",
+            queryset.annotate(category_names=ArraySubquery(categories)).order_by("id"),
+            [
+                ("id", "id", None),
+                ("name", "name", None),
+                ("description", "description", None),
+                ("price", "price", decimal_string(2)),
+                ("available_quantity", "available_quantity", None),
+                ("categories", "category_names", None),
+                ("seller", "seller__user__username", None),
+                ("created_at", "created_at", iso_datetime()),
+                ("updated_at", "updated_at", iso_datetime()),
+            ],
+        )
@@ -0,0 +1,316 @@
+import csv
+import io
+import json
+import logging
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import DataError
+from django.db import IntegrityError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+
+from e_commerce.products.api.serializers import ProductImportRowSerializer
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImport
+from e_commerce.products.services.catalog import CatalogVersion
+from e_commerce.utils.prometheus import PRODUCT_IMPORT_ROWS
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ("name", "price")
+# CSV cells hold several category names separated by this.
+CATEGORY_SEPARATOR = "|"
+
+
+class ProductImportError(Exception):
+    """The file as a whole cannot be imported"""
+
+
+class ImportClaimLostError(Exception):
+    """The import was taken over by another worker"""
+
+
+def _csv_rows(text):
+    reader = csv.DictReader(text)
+    missing = [
+        column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or ())
+    ]
+    if missing:
+        msg = f"Missing columns: {', '.join(missing)}."
+        raise ProductImportError(msg)
+    for number, cells in enumerate(reader, start=1):
+        # Empty cells mean "use the default"; extra cells land under None.
+        row = {key: value for key, value in cells.items() if key and value}
+        if "categories" in row:
+            row["categories"] = [
+                name.strip()
+                for name in row["categories"].split(CATEGORY_SEPARATOR)
+                if name.strip()
+            ]
+        yield number, row, None
+
+
+def _ndjson_rows(text):
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            yield number, None, {"non_field_errors": [f"Invalid JSON: {error}."]}
+            continue
+        if not isinstance(row, dict):
+            yield number, None, {"non_field_errors": ["Expected a JSON object."]}
+            continue
+        yield number, row, None
+
+
+def read_rows(stream, fmt):
+    """
+    Yield (row number, row, error) for each record of a binary CSV or NDJSON
+    stream, reading it incrementally. Rows that cannot be parsed come with
+    an error dict instead of a row.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    rows = _csv_rows(text) if fmt == "csv" else _ndjson_rows(text)
+    try:
+        yield from rows
+    except UnicodeDecodeError as error:
+        msg = "The file is not UTF-8 encoded."
+        raise ProductImportError(msg) from error
+    except csv.Error as error:
+        msg = f"Malformed CSV: {error}."
+        raise ProductImportError(msg) from error
+    finally:
+        text.detach()
+
+
+class ProductImporter:
+    """
+    Streams rows of an import file into Product and Product.categories rows
+    of one seller. Valid rows are inserted batch_size at a time, each batch
+    in its own transaction; invalid rows are passed to report and skipped,
+    as are rows the database rejects. Memory use depends on the batch size,
+    not on the size of the file.
+    """
+
+    def __init__(self, seller, batch_size=1000, checkpoint=None):
+        self.seller = seller
+        self.batch_size = batch_size
+        # Called with the importer at the end of each batch's transaction.
+        self.checkpoint = checkpoint
+        # One serializer validates every row, so its fields are only built
+        # once; categories are resolved from a name to id map read up front.
+        self.validator = ProductImportRowSerializer(
+            context={"category_ids": dict(Category.objects.values_list("name", "id"))},
+        )
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+
+    def run(self, stream, fmt, report, skip=0):
+        """Import the rows of stream, passing over rows numbered up to skip"""
+        batch = []
+        for number, row, parse_error in read_rows(stream, fmt):
+            if number <= skip:
+                continue
+            self.rows += 1
+            error = parse_error
+            if error is None:
+                try:
+                    batch.append((number, self.validator.run_validation(row)))
+                except serializers.ValidationError as invalid:
+                    error = invalid.detail
+                else:
+                    if len(batch) >= self.batch_size:
+                        self.flush(batch, report)
+                        batch = []
+                    continue
+            self.reject(number, error, report)
+        if batch:
+            self.flush(batch, report)
+
+    def reject(self, number, errors, report):
+        self.failed += 1
+        PRODUCT_IMPORT_ROWS.labels("failed").inc()
+        report({"row": number, "errors": errors})
+
+    @transaction.atomic
+    def flush(self, batch, report):
+        """
+        Insert a batch of (row number, validated row) pairs. If the database
+        rejects the batch, retry it row by row, each in its own savepoint,
+        so only the offending rows are reported.
+        """
+        try:
+            self.insert([data for _, data in batch])
+        except (IntegrityError, DataError):
+            for number, data in batch:
+                try:
+                    self.insert([data])
+                except (IntegrityError, DataError) as error:
+                    message = f"{type(error).__name__}: {error}".strip()
+                    self.reject(number, {"non_field_errors": [message]}, report)
+        if self.checkpoint:
+            self.checkpoint(self)
+
+    @transaction.atomic
+    def insert(self, batch):
+        products = Product.objects.bulk_create(
+            Product(
+                seller=self.seller,
+                name=data["name"],
+                description=data["description"],
+                price=data["price"],
+                available_quantity=data["available_quantity"],
+            )
+            for data in batch
+        )
+        through = Product.categories.through
+        through.objects.bulk_create(
+            through(product_id=product.pk, category_id=category_id)
+            for product, data in zip(products, batch, strict=True)
+            for category_id in data["categories"]
+        )
+        self.imported += len(products)
+        PRODUCT_IMPORT_ROWS.labels("imported").inc(len(products))
+        # bulk_create sends no post_save signals.
+        CatalogVersion.bump()
+
+
+class ProductImports:
+    """Queue of ProductImport jobs, drained by run_product_imports"""
+
+    @staticmethod
+    def claim():
+        """
+        Mark the oldest pending import, or running import whose claim is
+        older than PRODUCT_IMPORT_CLAIM_TIMEOUT, as running and return it,
+        or None. SKIP LOCKED lets several workers claim jobs concurrently.
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.PRODUCT_IMPORT_CLAIM_TIMEOUT)
+        with transaction.atomic():
+            job = (
+                ProductImport.objects.filter(
+                    Q(status="pending")
+                    | Q(status="running", claimed_at__lt=stale)
+                    | Q(status="running", claimed_at__isnull=True),
+                )
+                .select_for_update(skip_locked=True)
+                .order_by("id")
+                .first()
+            )
+            if job is None:
+                return None
+            if job.status == "pending":
+                job.started_at = now
+            job.status = "running"
+            job.claimed_at = now
+            job.save(update_fields=["status", "started_at", "claimed_at"])
+        return job
+
+    @staticmethod
+    def checkpoint(job, importer):
+        """
+        Record the progress of a batch in its transaction and renew the
+        claim. Raises ImportClaimLostError, rolling the batch back, if
+        another worker has taken the job over.
+        """
+        now = timezone.now()
+        renewed = ProductImport.objects.filter(
+            pk=job.pk,
+            claimed_at=job.claimed_at,
+        ).update(
+            claimed_at=now,
+            rows=importer.rows,
+            imported=importer.imported,
+            failed=importer.failed,
+        )
+        if not renewed:
+            raise ImportClaimLostError
+        job.claimed_at = now
+
+    @staticmethod
+    def run(job, batch_size=1000):
+        """
+        Run a claimed import. A job taken over from a worker that died
+        resumes after its last committed batch; its report only lists the
+        rows read since.
+        """
+        importer = ProductImporter(
+            job.seller,
+            batch_size=batch_size,
+            checkpoint=lambda importer: ProductImports.checkpoint(job, importer),
+        )
+        importer.rows, importer.imported, importer.failed = (
+            job.rows,
+            job.imported,
+            job.failed,
+        )
+        with tempfile.TemporaryFile() as report:
+
+            def write(entry):
+                report.write(json.dumps(entry).encode() + b"\n")
+
+            try:
+                with job.file.open("rb") as stream:
+                    importer.run(stream, job.format, write, skip=job.rows)
+            except ImportClaimLostError:
+                logger.warning("Product import %s was taken over", job.pk)
+                return job
+            except ProductImportError as error:
+                job.status = "failed"
+                job.error = str(error)
+            except Exception as error:
+                # E.g. the database going away or the file gone missing:
+                # fail this job, keeping the batches committed so far, rather
+                # than leaving it running and stopping the worker.
+                logger.exception("Product import %s failed", job.pk)
+                job.status = "failed"
+                job.error = f"{type(error).__name__}: {error}"
+            else:
+                job.status = "done"
+            if report.tell():
+                report.seek(0)
+                job.report.save(f"{job.pk}.ndjson", File(report), save=False)
+        job.rows = importer.rows
+        job.imported = importer.imported
+        job.failed = importer.failed
+        job.finished_at = timezone.now()
+        storage, staged = job.file.storage, job.file.name
+        with transaction.atomic():
+            claimed = ProductImport.objects.select_for_update().filter(
+                pk=job.pk,
+                claimed_at=job.claimed_at,
+            )
+            if not claimed.exists():
+                logger.warning("Product import %s was taken over", job.pk)
+                job.report.delete(save=False)
+                return job
+            job.file = ""
+            job.claimed_at = None
+            job.save()
+        # The staged file is only needed while the job runs.
+        try:
+            storage.delete(staged)
+        except Exception:
+            logger.exception("Could not delete the file of product import %s", job.pk)
+        return job
+
+    @staticmethod
+    def process_pending(batch_size=1000):
+        """Run one pending import; returns whether there was one"""
+        job = ProductImports.claim()
+        if job is None:
+            return False
+        ProductImports.run(job, batch_size=batch_size)
+        return True
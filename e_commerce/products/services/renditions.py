@@ -0,0 +1,162 @@
+import logging
+from datetime import timedelta
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image
+from PIL import ImageOps
+
+from e_commerce.products.models import ProductImage
+
+logger = logging.getLogger(__name__)
+
+
+def rendition_formats():
+    """Configured rendition formats this Pillow build can encode, in order"""
+    Image.init()
+    return [
+        fmt
+        for fmt in settings.PRODUCT_IMAGE_RENDITION_FORMATS
+        if fmt.upper() in Image.SAVE
+    ]
+
+
+def rendition_widths(original_width):
+    """Configured widths that do not upscale; tiny originals get one rendition"""
+    widths = sorted(
+        width
+        for width in settings.PRODUCT_IMAGE_RENDITION_WIDTHS
+        if width <= original_width
+    )
+    return widths or [original_width]
+
+
+class ImageRenditions:
+    """
+    Downscaled WebP/AVIF copies of ProductImage uploads. Uploads are stored
+    as-is and picked up by the generate_image_renditions worker, so resizing
+    never happens inside a request.
+    """
+
+    @staticmethod
+    def render(product_image):
+        """Write all renditions of product_image and return the path map"""
+        storage = product_image.image.storage
+        with product_image.image.open("rb") as upload, Image.open(upload) as original:
+            picture = ImageOps.exif_transpose(original)
+            picture = picture.convert("RGBA" if "A" in picture.getbands() else "RGB")
+
+        renditions = {}
+        for width in rendition_widths(picture.width):
+            height = max(1, round(picture.height * width / picture.width))
+            resized = picture.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in rendition_formats():
+                buffer = BytesIO()
+                resized.save(
+                    buffer,
+                    format=fmt.upper(),
+                    quality=settings.PRODUCT_IMAGE_RENDITION_QUALITY,
+                )
+                path = f"product_images/renditions/{product_image.pk}/{width}w.{fmt}"
+                renditions.setdefault(fmt, {})[str(width)] = storage.save(
+                    path,
+                    ContentFile(buffer.getvalue()),
+                )
+        return renditions
+
+    @staticmethod
+    def claim(batch_size=20):
+        """
+        Claim a batch of images without renditions and commit the claim, so
+        no row lock is held while they are rendered. Rows are picked with
+        SKIP LOCKED so several workers can drain the queue concurrently;
+        claims older than PRODUCT_IMAGE_RENDITION_CLAIM_TIMEOUT are stale.
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.PRODUCT_IMAGE_RENDITION_CLAIM_TIMEOUT)
+        with transaction.atomic():
+            images = list(
+                ProductImage.objects.filter(renditions_ready_at__isnull=True)
+                .filter(
+                    Q(renditions_claimed_at__isnull=True)
+                    | Q(renditions_claimed_at__lt=stale),
+                )
+                .select_for_update(skip_locked=True)
+                .order_by("id")[:batch_size],
+            )
+            ProductImage.objects.filter(pk__in=[image.pk for image in images]).update(
+                renditions_claimed_at=now,
+            )
+        for product_image in images:
+            product_image.renditions_claimed_at = now
+        return images
+
+    @staticmethod
+    def process_pending(batch_size=20):
+        """
+        Claim and render one batch of images. An image that cannot be
+        rendered, for whatever reason, is marked ready without renditions so
+        the original keeps being served and the queue moves on. Returns the
+        number of images processed.
+        """
+        images = ImageRenditions.claim(batch_size)
+        for product_image in images:
+            try:
+                renditions = ImageRenditions.render(product_image)
+            except Exception:
+                logger.exception("Could not render ProductImage %s", product_image.pk)
+                renditions = {}
+            ImageRenditions.store(product_image, renditions)
+        return len(images)
+
+    @staticmethod
+    def store(product_image, renditions):
+        """
+        Save the renditions of a claimed image and release the ones they
+        replace. If the claim was lost meanwhile, to reset() or to another
+        worker taking over, the new files are dropped instead.
+        """
+        storage = product_image.image.storage
+        with transaction.atomic():
+            current = (
+                ProductImage.objects.select_for_update()
+                .filter(
+                    pk=product_image.pk,
+                    renditions_claimed_at=product_image.renditions_claimed_at,
+                )
+                .first()
+            )
+            if current is None:
+                ImageRenditions.release(storage, renditions)
+                return
+            previous = current.renditions
+            product_image.renditions = renditions
+            product_image.renditions_ready_at = timezone.now()
+            product_image.renditions_claimed_at = None
+            product_image.save(
+                update_fields=[
+                    "renditions",
+                    "renditions_ready_at",
+                    "renditions_claimed_at",
+                ],
+            )
+            ImageRenditions.release(storage, previous)
+
+    @staticmethod
+    def release(storage, renditions):
+        """Delete rendition files once the transaction dropping them commits"""
+        paths = [path for paths in renditions.values() for path in paths.values()]
+        transaction.on_commit(lambda: [storage.delete(path) for path in paths])
+
+    @staticmethod
+    def reset(queryset=None):
+        """
+        Queue images for (re)generation, e.g. after changing the widths. The
+        current renditions keep being served until they are replaced.
+        """
+        queryset = ProductImage.objects.all() if queryset is None else queryset
+        return queryset.update(renditions_ready_at=None, renditions_claimed_at=None)
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from django.conf import settings
+from PIL import Image
+from PIL import UnidentifiedImageError
+from rest_framework import serializers
+
+from e_commerce.products.models import ProductImage
+from e_commerce.utils.storages import StagedUpload
+
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+MAX_PRODUCT_IMAGES = 6
+
+
+@cache
+def _executor(workers):
+    # Shared across requests; Pillow releases the GIL while decoding.
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="product-images")
+
+
+def _map(func, items):
+    return list(_executor(settings.PRODUCT_IMAGE_UPLOAD_WORKERS).map(func, items))
+
+
+def _inspect(upload):
+    """Return an error message for upload, or None when it is a usable image"""
+    if not hasattr(upload, "read"):
+        return "Images must be uploaded as files."
+    name = getattr(upload, "name", "image")
+    limit = settings.PRODUCT_IMAGE_MAX_DIMENSION
+    try:
+        with Image.open(upload) as picture:
+            if picture.format not in ALLOWED_FORMATS:
+                return f"{name}: unsupported image format {picture.format}."
+            if max(picture.size) > limit:
+                return f"{name}: images may be at most {limit}px on each side."
+            # A full decode catches truncated and corrupt files.
+            picture.load()
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        return f"{name}: not a valid image."
+    finally:
+        upload.seek(0)
+    return None
+
+
+class ProductImageUploads:
+    """
+    Validation and storage of the image files sent with a new product.
+    Decoding and file writes run in a thread pool and happen before the
+    product rows are inserted, so the DB transaction only covers the inserts.
+    """
+
+    @staticmethod
+    def validate(uploads):
+        errors = [error for error in _map(_inspect, uploads) if error]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+    @staticmethod
+    def store(uploads):
+        """Write uploads to the ProductImage storage and return their names"""
+        field = ProductImage._meta.get_field("image")  # noqa: SLF001
+
+        def save(upload):
+            if isinstance(upload, StagedUpload):
+                # Already in storage, streamed by ProductImageUploadHandler.
+                return upload.commit()
+            name = field.generate_filename(None, upload.name)
+            return field.storage.save(name, upload, max_length=field.max_length)
+
+        return _map(save, uploads)
+
+    @staticmethod
+    def discard(names):
+        """Remove stored files whose rows were never committed"""
+        storage = ProductImage._meta.get_field("image").storage  # noqa: SLF001
+        _map(storage.delete, names)
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.products.services.catalog import CatalogVersion
+from e_commerce.products.services.renditions import ImageRenditions
+
+
+@receiver(post_delete, sender=ProductImage)
+def release_image_files(sender, instance, **kwargs):
+    # Files are shared by content, so the storage only removes them once
+    # no other upload references them.
+    storage = instance.image.storage
+    name = instance.image.name
+    transaction.on_commit(lambda: storage.delete(name))
+    ImageRenditions.release(storage, instance.renditions)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def product_changed(sender, **kwargs):
+    CatalogVersion.bump()
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def product_image_changed(sender, instance, **kwargs):
+    CatalogVersion.touch_products([instance.product_id])
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+def product_categories_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        CatalogVersion.touch_products([instance.pk])
+    elif pk_set:
+        CatalogVersion.touch_products(pk_set)
+    else:
+        CatalogVersion.bump()
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    # Product representations embed category names.
+    CatalogVersion.touch_products(instance.products.values("pk"))
@@ -0,0 +1,130 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.products.models import Product
+from e_commerce.products.services.catalog import CatalogVersion
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.users.tests.factories import UserFactory
+
+ROWS = 40
+URL = "api:product-bulk-update"
+
+
+@pytest.fixture
+def products(seller):
+    return Product.objects.bulk_create(
+        Product(name=f"P{i}", description="d", price=10, seller=seller)
+        for i in range(ROWS)
+    )
+
+
+@pytest.fixture
+def client(seller):
+    client = APIClient()
+    client.force_authenticate(user=seller.user)
+    return client
+
+
+def bulk_update(client, rows):
+    return client.post(reverse(URL), rows, format="json")
+
+
+class TestBulkUpdate:
+    def test_per_row_results(self, client, products):
+        other = Product.objects.create(
+            name="Theirs",
+            description="d",
+            price=5,
+            seller=Seller.objects.create(user=UserFactory()),
+        )
+        first, second, third = products[:3]
+
+        response = bulk_update(
+            client,
+            [
+                {"id": first.id, "price": "12.50"},
+                {"id": second.id, "available_quantity": 7, "price": "10"},
+                {"id": third.id, "price": "10.00"},
+                {"id": other.id, "price": "1"},
+                {"id": third.id, "available_quantity": 1},
+                {"id": first.id},
+                {"id": second.id, "price": "-1"},
+                "nonsense",
+                {"id": products[3].id, "available_quantity": 2147483648},
+            ],
+        )
+
+        assert response.status_code == 200  # noqa: PLR2004
+        body = response.json()
+        assert (body["updated"], body["unchanged"], body["failed"]) == (2, 1, 6)
+        assert [result["status"] for result in body["results"]] == [
+            "updated",
+            "updated",
+            "unchanged",
+            "failed",
+            "failed",
+            "failed",
+            "failed",
+            "failed",
+            "failed",
+        ]
+        assert body["results"][3]["errors"] == {"id": ["Not found."]}
+        assert "Listed more than once." in body["results"][4]["errors"]["id"]
+        assert "price" in body["results"][6]["errors"]
+        assert "available_quantity" in body["results"][8]["errors"]
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.price, first.available_quantity) == (Decimal("12.50"), 1)
+        assert (second.price, second.available_quantity) == (10, 7)
+        assert first.updated_at > products[3].created_at
+        other.refresh_from_db()
+        assert other.price == 5  # noqa: PLR2004
+
+    def test_queries_do_not_grow_with_rows(self, client, products):
+        rows = [{"id": p.id, "price": "11", "available_quantity": 3} for p in products]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = bulk_update(client, rows)
+
+        assert response.json()["updated"] == ROWS
+        statements = [q["sql"].split()[0] for q in queries]
+        # Profile lookup, ownership check and the update.
+        assert [s for s in statements if s in ("SELECT", "UPDATE")] == [
+            "SELECT",
+            "SELECT",
+            "UPDATE",
+        ]
+        assert set(Product.objects.values_list("price", "available_quantity")) == {
+            (Decimal(11), 3),
+        }
+
+    def test_bumps_catalog_version_once(self, client, products, monkeypatch):
+        bumps = []
+        monkeypatch.setattr(CatalogVersion, "bump", lambda: bumps.append(1))
+
+        bulk_update(client, [{"id": p.id, "price": "3"} for p in products[:5]])
+        assert bumps == [1]
+
+        bulk_update(client, [{"id": p.id, "price": "3"} for p in products[:5]])
+        assert bumps == [1]
+
+    def test_rejects_bad_payloads(self, client, products, settings):
+        settings.PRODUCT_BULK_UPDATE_MAX_ROWS = 2
+        rows = [{"id": p.id, "price": "3"} for p in products[:3]]
+
+        for payload in ({"id": products[0].id}, [], rows):
+            assert bulk_update(client, payload).status_code == 400  # noqa: PLR2004
+        assert not Product.objects.filter(price=3).exists()
+
+    def test_sellers_only(self, products):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username="buyer"))
+
+        response = bulk_update(client, [{"id": products[0].id, "price": "1"}])
+        assert response.status_code == 403  # noqa: PLR2004
@@ -0,0 +1,132 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+
+
+@pytest.fixture
+def category(db):
+    return Category.objects.create(name="Lamps")
+
+
+@pytest.fixture
+def product(category, seller):
+    product = Product.objects.create(
+        name="Lamp",
+        description="A lamp",
+        price=10,
+        seller=seller,
+    )
+    product.categories.add(category)
+    return product
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+def revalidate(client, url, response):
+    return client.get(url, headers={"if-none-match": response.headers["ETag"]})
+
+
+class TestProductListConditionalGet:
+    def test_validators_present(self, client, product):
+        response = client.get(reverse("api:product-list"))
+
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.headers["ETag"].startswith('"')
+        assert "Last-Modified" not in response.headers
+        assert "no-cache" in response.headers["Cache-Control"]
+
+    def test_not_modified_without_queries(
+        self,
+        client,
+        product,
+        django_assert_num_queries,
+    ):
+        url = reverse("api:product-list")
+        response = client.get(url)
+        with django_assert_num_queries(0):
+            cached = revalidate(client, url, response)
+
+        assert cached.status_code == 304  # noqa: PLR2004
+        assert cached.headers["ETag"] == response.headers["ETag"]
+        assert not cached.content
+
+    def test_etag_varies_with_query(self, client, product):
+        url = reverse("api:product-list")
+        response = client.get(url)
+        assert (
+            client.get(url, {"name": "lamp"}).headers["ETag"]
+            != response.headers["ETag"]
+        )
+
+    def test_catalog_change_invalidates(self, client, product):
+        url = reverse("api:product-list")
+        response = client.get(url)
+        product.price = 12
+        product.save()
+        assert revalidate(client, url, response).status_code == 200  # noqa: PLR2004
+
+    def test_if_modified_since_is_ignored(self, client, product):
+        # A one-second date cannot tell apart changes within that second.
+        response = client.get(
+            reverse("api:product-list"),
+            headers={"if-modified-since": http_date()},
+        )
+        assert response.status_code == 200  # noqa: PLR2004
+
+
+class TestProductDetailConditionalGet:
+    def url(self, product):
+        return reverse("api:product-detail", kwargs={"id": product.id})
+
+    def test_not_modified_with_one_query(
+        self,
+        client,
+        product,
+        django_assert_num_queries,
+    ):
+        response = client.get(self.url(product))
+        with django_assert_num_queries(1):
+            cached = revalidate(client, self.url(product), response)
+        assert cached.status_code == 304  # noqa: PLR2004
+
+    def test_image_change_invalidates(self, client, product):
+        response = client.get(self.url(product))
+        ProductImage.objects.create(
+            product=product,
+            image=ContentFile(b"img", name="a.png"),
+        )
+        product.refresh_from_db()
+        assert (
+            revalidate(client, self.url(product), response).status_code == 200  # noqa: PLR2004
+        )
+
+    def test_category_rename_invalidates(self, client, product, category):
+        response = client.get(self.url(product))
+        category.name = "Lights"
+        category.save()
+        cached = revalidate(client, self.url(product), response)
+        assert cached.status_code == 200  # noqa: PLR2004
+        assert cached.data["categories"] == ["Lights"]
+
+    def test_missing_product_is_404(self, client, db):
+        response = client.get(reverse("api:product-detail", kwargs={"id": 999}))
+        assert response.status_code == 404  # noqa: PLR2004
+
+
+class TestCategoryConditionalGet:
+    def test_not_modified(self, client, category):
+        url = reverse("api:category-list")
+        response = client.get(url)
+        assert revalidate(client, url, response).status_code == 304  # noqa: PLR2004
+
+        Category.objects.create(name="Chairs")
+        assert revalidate(client, url, response).status_code == 200  # noqa: PLR2004
@@ -0,0 +1,90 @@
+import csv
+import io
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.services.imports import ProductImporter
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def products(seller):
+    home, lighting = Category.objects.bulk_create(
+        Category(name=name) for name in ("Home", "Lighting")
+    )
+    lamp = Product.objects.create(
+        name="Lamp",
+        description="Bright, warm",
+        price=Decimal("12.50"),
+        available_quantity=3,
+        seller=seller,
+    )
+    # Linked in reverse, so the export has to sort the names itself.
+    lamp.categories.add(lighting)
+    lamp.categories.add(home)
+    desk = Product.objects.create(name="Desk", description="", price=99, seller=seller)
+    desk.categories.set([home])
+
+
+@pytest.fixture
+def client(seller, products):
+    client = APIClient()
+    client.force_authenticate(user=seller.user)
+    return client
+
+
+def export(client, **params):
+    response = client.get(reverse("api:product-export"), params)
+    assert response.status_code == 200  # noqa: PLR2004
+    return b"".join(response.streaming_content)
+
+
+class TestProductExport:
+    def test_csv(self, client, seller):
+        rows = list(csv.DictReader(io.StringIO(export(client).decode())))
+
+        assert [row["name"] for row in rows] == ["Lamp", "Desk"]
+        assert rows[0]["price"] == "12.50"
+        assert rows[0]["categories"] == "Home|Lighting"
+        assert rows[0]["description"] == "Bright, warm"
+        assert rows[1]["seller"] == seller.user.username
+
+    def test_ndjson_with_filters(self, client):
+        body = export(client, format="ndjson", categories="Lighting")
+
+        lines = body.decode().splitlines()
+        assert len(lines) == 1
+        assert '"categories":["Home","Lighting"]' in lines[0]
+
+    def test_only_own_products(self, client):
+        other = Seller.objects.create(user=UserFactory())
+        Product.objects.create(name="Rug", description="", price=1, seller=other)
+
+        assert b"Rug" not in export(client)
+
+    def test_export_can_be_imported_again(self, client, seller):
+        importer = ProductImporter(seller)
+        importer.run(io.BytesIO(export(client)), "csv", print)
+
+        assert (importer.imported, importer.failed) == (2, 0)
+        copy = Product.objects.filter(name="Lamp").order_by("id").last()
+        assert copy.price == Decimal("12.50")
+        assert sorted(copy.categories.values_list("name", flat=True)) == [
+            "Home",
+            "Lighting",
+        ]
+
+    def test_sellers_only(self, seller):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username="buyer"))
+
+        response = client.get(reverse("api:product-export"))
+        assert response.status_code == 403  # noqa: PLR2004
+        assert response.content.startswith(b'{"detail"')
@@ -0,0 +1,318 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImport
+from e_commerce.products.services.catalog import CatalogVersion
+from e_commerce.products.services.imports import ProductImporter
+from e_commerce.products.services.imports import ProductImportError
+from e_commerce.products.services.imports import ProductImports
+from e_commerce.users.models import Seller
+from e_commerce.users.tests.factories import UserFactory
+
+CSV = (
+    "name,description,price,available_quantity,categories\n"
+    "Lamp,Bright,12.50,3,Home|Lighting\n"
+    "Desk,,99,,Home\n"
+    ",No name,5,1,\n"
+    "Chair,Comfy,-1,2,Garden\n"
+)
+ROWS = 50
+
+
+@pytest.fixture(autouse=True)
+def _categories(db):
+    Category.objects.bulk_create(Category(name=name) for name in ("Home", "Lighting"))
+
+
+def run_import(seller, data, fmt, batch_size=1000):
+    report = []
+    importer = ProductImporter(seller, batch_size=batch_size)
+    importer.run(BytesIO(data.encode()), fmt, report.append)
+    return importer, report
+
+
+class TestProductImporter:
+    def test_csv(self, seller):
+        importer, report = run_import(seller, CSV, "csv")
+
+        assert (importer.rows, importer.imported, importer.failed) == (4, 2, 2)
+        lamp = Product.objects.get(name="Lamp")
+        assert lamp.seller == seller
+        assert lamp.price == Decimal("12.50")
+        assert lamp.available_quantity == 3  # noqa: PLR2004
+        assert sorted(lamp.categories.values_list("name", flat=True)) == [
+            "Home",
+            "Lighting",
+        ]
+        desk = Product.objects.get(name="Desk")
+        assert (desk.description, desk.available_quantity) == ("", 1)
+        assert [entry["row"] for entry in report] == [3, 4]
+        assert "name" in report[0]["errors"]
+        assert set(report[1]["errors"]) == {"price", "categories"}
+
+    def test_ndjson(self, seller):
+        lines = [
+            json.dumps({"name": "Lamp", "price": "3", "categories": ["Lighting"]}),
+            "",
+            "{not json",
+            json.dumps(["a list"]),
+            json.dumps({"name": "Rug", "price": 7}),
+        ]
+        importer, report = run_import(seller, "\n".join(lines), "ndjson")
+
+        assert (importer.rows, importer.imported, importer.failed) == (4, 2, 2)
+        assert [entry["row"] for entry in report] == [2, 3]
+        assert set(Product.objects.values_list("name", flat=True)) == {"Lamp", "Rug"}
+
+    def test_queries_grow_with_batches_not_rows(self, seller):
+        rows = "".join(f"Product {i},d,{i},1,Home\n" for i in range(ROWS))
+        data = "name,description,price,available_quantity,categories\n" + rows
+
+        with CaptureQueriesContext(connection) as queries:
+            importer, _ = run_import(seller, data, "csv", batch_size=20)
+
+        assert importer.imported == ROWS
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        # Products and category links of 3 batches.
+        assert len(inserts) == 6  # noqa: PLR2004
+        assert Product.categories.through.objects.count() == ROWS
+
+    def test_bumps_catalog_version(self, seller):
+        before = CatalogVersion.current()
+        run_import(seller, CSV, "csv")
+        assert CatalogVersion.current() > before
+
+    def test_rejects_quantities_beyond_integer_range(self, seller):
+        data = "name,price,available_quantity\nLamp,1,2147483648\n"
+        importer, report = run_import(seller, data, "csv")
+
+        assert (importer.imported, importer.failed) == (0, 1)
+        assert "available_quantity" in report[0]["errors"]
+
+    def test_database_errors_only_fail_their_rows(self, seller):
+        importer = ProductImporter(seller)
+        row = importer.validator.run_validation({"name": "Lamp", "price": "1"})
+        report = []
+
+        importer.flush(
+            [
+                (1, row),
+                (2, {**row, "available_quantity": 2**40}),
+                (3, {**row, "name": "Desk"}),
+            ],
+            report.append,
+        )
+
+        assert (importer.imported, importer.failed) == (2, 1)
+        assert sorted(Product.objects.values_list("name", flat=True)) == [
+            "Desk",
+            "Lamp",
+        ]
+        assert [entry["row"] for entry in report] == [2]
+        assert report[0]["errors"]["non_field_errors"][0].startswith("DataError")
+
+    def test_rejects_files_without_required_columns(self, seller):
+        with pytest.raises(ProductImportError, match="price"):
+            run_import(seller, "name,description\nLamp,Bright\n", "csv")
+
+    def test_rejects_files_that_are_not_utf8(self, seller):
+        importer = ProductImporter(seller)
+        with pytest.raises(ProductImportError, match="UTF-8"):
+            importer.run(BytesIO(b"name,price\n\xff\xfe,1\n"), "csv", print)
+
+
+class TestImportProductsCommand:
+    def test_imports_file(self, seller, tmp_path):
+        path = tmp_path / "products.csv"
+        path.write_text(CSV)
+        report = tmp_path / "report.ndjson"
+
+        call_command(
+            "import_products",
+            str(path),
+            f"--seller={seller.user.username}",
+            f"--report={report}",
+        )
+
+        assert Product.objects.count() == 2  # noqa: PLR2004
+        lines = report.read_text().splitlines()
+        assert [json.loads(line)["row"] for line in lines] == [3, 4]
+
+    def test_unknown_seller(self, seller, tmp_path):
+        path = tmp_path / "products.csv"
+        path.write_text(CSV)
+        with pytest.raises(CommandError):
+            call_command("import_products", str(path), "--seller", "nobody")
+
+
+class TestProductImportJobs:
+    @pytest.fixture
+    def client(self, seller):
+        client = APIClient()
+        client.force_authenticate(user=seller.user)
+        return client
+
+    def test_queued_job_runs_in_worker(self, client):
+        response = client.post(
+            reverse("api:product-import-list"),
+            {"file": SimpleUploadedFile("products.csv", CSV.encode())},
+            format="multipart",
+        )
+        assert response.status_code == 202  # noqa: PLR2004
+        assert response.json()["status"] == "pending"
+        assert response.json()["format"] == "csv"
+        assert not Product.objects.exists()
+
+        call_command("run_product_imports", "--once")
+
+        url = reverse("api:product-import-detail", kwargs={"pk": response.json()["id"]})
+        job = client.get(url).json()
+        assert job["status"] == "done"
+        assert (job["rows"], job["imported"], job["failed"]) == (4, 2, 2)
+        report = ProductImport.objects.get().report
+        with report.open("rb") as lines:
+            assert [json.loads(line)["row"] for line in lines] == [3, 4]
+
+    def test_failed_job(self, client):
+        client.post(
+            reverse("api:product-import-list"),
+            {"file": SimpleUploadedFile("products.csv", b"title\nLamp\n")},
+            format="multipart",
+        )
+        call_command("run_product_imports", "--once")
+
+        job = ProductImport.objects.get()
+        assert job.status == "failed"
+        assert "name" in job.error
+
+    def test_unexpected_errors_fail_the_job(self, client, monkeypatch):
+        client.post(
+            reverse("api:product-import-list"),
+            {"file": SimpleUploadedFile("products.csv", CSV.encode())},
+            format="multipart",
+        )
+        client.post(
+            reverse("api:product-import-list"),
+            {"file": SimpleUploadedFile("more.csv", CSV.encode())},
+            format="multipart",
+        )
+
+        def flush(self, batch, report):
+            msg = "duplicate key value"
+            raise IntegrityError(msg)
+
+        monkeypatch.setattr(ProductImporter, "flush", flush)
+        call_command("run_product_imports", "--once")
+
+        jobs = ProductImport.objects.order_by("id")
+        assert [job.status for job in jobs] == ["failed", "failed"]
+        assert jobs[0].error == "IntegrityError: duplicate key value"
+        assert jobs[0].finished_at is not None
+
+    def test_missing_file_fails_the_job(self, seller):
+        job = ProductImport.objects.create(seller=seller, file="gone.csv", format="csv")
+        assert ProductImports.process_pending()
+        job.refresh_from_db()
+        assert job.status == "failed"
+        assert job.error.startswith("FileNotFoundError")
+
+    def test_format_is_required_for_unknown_extensions(self, client):
+        response = client.post(
+            reverse("api:product-import-list"),
+            {"file": SimpleUploadedFile("products.txt", CSV.encode())},
+            format="multipart",
+        )
+        assert response.status_code == 400  # noqa: PLR2004
+        assert "format" in response.json()
+
+    def test_sellers_only_see_their_imports(self, client, seller):
+        other = Seller.objects.create(user=UserFactory())
+        ProductImport.objects.create(seller=other, file="x.csv", format="csv")
+
+        assert client.get(reverse("api:product-import-list")).json()["results"] == []
+
+
+class TestProductImportClaims:
+    @pytest.fixture
+    def job(self, seller):
+        return ProductImport.objects.create(
+            seller=seller,
+            file=SimpleUploadedFile("products.csv", CSV.encode()),
+            format="csv",
+        )
+
+    def test_staged_file_is_deleted_when_done(self, job):
+        storage, name = job.file.storage, job.file.name
+        assert storage.exists(name)
+
+        ProductImports.process_pending()
+
+        job.refresh_from_db()
+        assert job.status == "done"
+        assert not job.file
+        assert job.claimed_at is None
+        assert not storage.exists(name)
+
+    def test_staged_file_is_deleted_when_failed(self, seller):
+        job = ProductImport.objects.create(
+            seller=seller,
+            file=SimpleUploadedFile("products.csv", b"title\nLamp\n"),
+            format="csv",
+        )
+        storage, name = job.file.storage, job.file.name
+
+        ProductImports.process_pending()
+
+        job.refresh_from_db()
+        assert job.status == "failed"
+        assert not storage.exists(name)
+
+    def test_running_job_is_left_alone(self, job):
+        ProductImport.objects.filter(pk=job.pk).update(
+            status="running",
+            claimed_at=timezone.now(),
+        )
+        assert not ProductImports.process_pending()
+
+    def test_stale_job_is_resumed(self, job, settings):
+        settings.PRODUCT_IMPORT_CLAIM_TIMEOUT = 60
+        # The worker that died had committed the batch of the first row.
+        ProductImport.objects.filter(pk=job.pk).update(
+            status="running",
+            claimed_at=timezone.now() - timedelta(minutes=5),
+            rows=1,
+            imported=1,
+        )
+
+        assert ProductImports.process_pending()
+
+        job.refresh_from_db()
+        assert job.status == "done"
+        assert (job.rows, job.imported, job.failed) == (4, 2, 2)
+        assert list(Product.objects.values_list("name", flat=True)) == ["Desk"]
+
+    def test_lost_claim_rolls_back_the_batch(self, job):
+        job = ProductImports.claim()
+        ProductImport.objects.filter(pk=job.pk).update(claimed_at=timezone.now())
+
+        ProductImports.run(job)
+
+        job.refresh_from_db()
+        assert job.status == "running"
+        assert job.file
+        assert not Product.objects.exists()
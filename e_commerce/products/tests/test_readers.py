@@ -0,0 +1,154 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework.test import APIRequestFactory
+
+from e_commerce.products.api.readers import ProductCardReader
+from e_commerce.products.api.readers import ProductReader
+from e_commerce.products.api.serializers import ProductSerializer
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.utils.renderers import OrjsonRenderer
+
+
+@pytest.fixture
+def products(seller):
+    lamps = Category.objects.create(name="Lamps")
+    garden = Category.objects.create(name="Garden")
+    plain = Product.objects.create(
+        name="Plain",
+        description="",
+        price=Decimal("0.50"),
+        available_quantity=0,
+        seller=seller,
+    )
+    lamp = Product.objects.create(
+        name="Lamp",
+        description="A lamp\nwith ünïcode",
+        price=Decimal("1234.05"),
+        seller=seller,
+    )
+    lamp.categories.add(lamps, garden)
+    ProductImage.objects.create(product=lamp, image="product_images/lamp.jpg")
+    ProductImage.objects.create(
+        product=lamp,
+        image="product_images/lamp 2.jpg",
+        renditions={
+            "webp": {
+                "640": "product_images/renditions/2/640w.webp",
+                "160": "product_images/renditions/2/160w.webp",
+            },
+            "avif": {"160": "product_images/renditions/2/160w.avif"},
+        },
+    )
+    return [plain, lamp]
+
+
+def serialize(queryset, request=None):
+    return ProductSerializer(queryset, many=True, context={"request": request}).data
+
+
+def normalized(products):
+    # ProductSerializer leaves the order of categories to the database.
+    return [
+        {**product, "categories": sorted(product["categories"])} for product in products
+    ]
+
+
+class TestProductReader:
+    @pytest.mark.parametrize("with_request", [True, False])
+    def test_matches_serializer(self, products, with_request):
+        request = APIRequestFactory().get("/") if with_request else None
+        queryset = Product.objects.order_by("id")
+
+        expected = serialize(queryset, request)
+        data = ProductReader(request).read(ProductReader.rows(queryset))
+
+        assert normalized(data) == normalized(expected)
+        assert [list(row) for row in data] == [list(row) for row in expected]
+        renderer = OrjsonRenderer()
+        data, expected = normalized(data), normalized(expected)
+        assert renderer.render(data) == renderer.render(expected)
+
+    def test_matches_serializer_in_other_timezone(self, products):
+        queryset = Product.objects.order_by("id")
+        with timezone.override("America/New_York"):
+            expected = serialize(queryset)
+            data = ProductReader().read(ProductReader.rows(queryset))
+
+        assert normalized(data) == normalized(expected)
+        assert not data[0]["created_at"].endswith("Z")
+
+    def test_fixed_query_count(self, products, django_assert_num_queries):
+        rows = list(ProductReader.rows(Product.objects.all()))
+        # categories, images
+        with django_assert_num_queries(2):
+            ProductReader().read(rows)
+
+    def test_empty_page_skips_queries(self, db, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert ProductReader().read([]) == []
+
+
+class TestProductListEndpoints:
+    def test_list_matches_serializer(self, products):
+        response = APIClient().get(reverse("api:product-list"))
+
+        request = response.wsgi_request
+        expected = serialize(Product.objects.all(), request)
+        results = sorted(response.json()["results"], key=lambda row: row["id"])
+        assert normalized(results) == normalized(
+            sorted(expected, key=lambda row: row["id"]),
+        )
+
+    def test_my_products_matches_serializer(self, products):
+        client = APIClient()
+        client.force_authenticate(products[0].seller.user)
+
+        response = client.get(reverse("api:product-my-products"))
+
+        expected = serialize(Product.objects.all(), response.wsgi_request)
+        results = sorted(response.json()["results"], key=lambda row: row["id"])
+        assert normalized(results) == normalized(
+            sorted(expected, key=lambda row: row["id"]),
+        )
+
+
+class TestProductCardReader:
+    def test_single_query(self, products, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            ProductCardReader().read(ProductCardReader.rows(Product.objects.all()))
+
+    def test_matches_full_rows(self, products):
+        request = APIRequestFactory().get("/")
+        queryset = Product.objects.order_by("id")
+        full = ProductReader(request).read(ProductReader.rows(queryset))
+        cards = ProductCardReader(request).read(ProductCardReader.rows(queryset))
+
+        for card, product in zip(cards, full, strict=True):
+            assert card["summary"] == product.pop("description")
+            assert card["images"] == product.pop("images")[:1]
+            assert {key: card[key] for key in product} == product
+
+    def test_description_cut_in_sql(self, products):
+        Product.objects.filter(pk=products[1].pk).update(description="x" * 5000)
+
+        rows = ProductCardReader.rows(Product.objects.filter(pk=products[1].pk))
+
+        assert "description" not in rows[0]
+        assert rows[0]["summary"] == "x" * ProductCardReader.summary_length
+
+    def test_category_filter_keeps_all_names(self, products):
+        response = APIClient().get(
+            reverse("api:product-list"),
+            {"view": "card", "categories": "Lamps"},
+        )
+
+        [card] = response.json()["results"]
+        assert sorted(card["categories"]) == ["Garden", "Lamps"]
+        assert len(card["images"]) == 1
+        assert "description" not in card
@@ -0,0 +1,161 @@
+from datetime import timedelta
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from PIL import Image
+
+from e_commerce.products.api.serializers import ProductImageSerializer
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.products.services.renditions import ImageRenditions
+
+
+@pytest.fixture(autouse=True)
+def _rendition_settings(settings):
+    settings.PRODUCT_IMAGE_RENDITION_WIDTHS = [160, 320, 640]
+    settings.PRODUCT_IMAGE_RENDITION_FORMATS = ["webp", "bmp-nope"]
+
+
+@pytest.fixture
+def product(seller):
+    return Product.objects.create(
+        name="Product",
+        description="desc",
+        price=10,
+        seller=seller,
+    )
+
+
+def upload(width, height, name="photo.png"):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+@pytest.fixture
+def product_image(product):
+    return ProductImage.objects.create(product=product, image=upload(400, 200))
+
+
+class TestImageRenditions:
+    def test_uploads_are_queued(self, product_image):
+        assert product_image.renditions == {}
+        assert product_image.renditions_ready_at is None
+
+    def test_renders_without_upscaling(self, product_image):
+        assert ImageRenditions.process_pending() == 1
+
+        product_image.refresh_from_db()
+        assert product_image.renditions_ready_at is not None
+        # Unsupported formats are skipped, widths above the original are not made.
+        assert list(product_image.renditions) == ["webp"]
+        assert sorted(product_image.renditions["webp"]) == ["160", "320"]
+        path = product_image.renditions["webp"]["160"]
+        with (
+            product_image.image.storage.open(path) as rendition,
+            Image.open(
+                rendition,
+            ) as picture,
+        ):
+            assert picture.format == "WEBP"
+            assert picture.size == (160, 80)
+
+    def test_small_originals_get_one_rendition(self, product):
+        image = ProductImage.objects.create(product=product, image=upload(100, 100))
+        ImageRenditions.process_pending()
+        image.refresh_from_db()
+        assert list(image.renditions["webp"]) == ["100"]
+
+    def test_broken_upload_is_not_retried(self, product):
+        image = ProductImage.objects.create(
+            product=product,
+            image=SimpleUploadedFile("broken.png", b"not an image"),
+        )
+        assert ImageRenditions.process_pending() == 1
+        image.refresh_from_db()
+        assert image.renditions == {}
+        assert image.renditions_ready_at is not None
+        assert ImageRenditions.process_pending() == 0
+
+    def test_render_errors_do_not_block_the_batch(self, product, monkeypatch):
+        bomb = ProductImage.objects.create(product=product, image=upload(400, 200))
+        image = ProductImage.objects.create(product=product, image=upload(100, 100))
+        render = ImageRenditions.render
+
+        def render_or_bomb(product_image):
+            if product_image.pk == bomb.pk:
+                raise Image.DecompressionBombError(product_image.pk)
+            return render(product_image)
+
+        monkeypatch.setattr(ImageRenditions, "render", render_or_bomb)
+        assert ImageRenditions.process_pending() == 2  # noqa: PLR2004
+        bomb.refresh_from_db()
+        image.refresh_from_db()
+        assert bomb.renditions == {}
+        assert bomb.renditions_ready_at is not None
+        assert list(image.renditions["webp"]) == ["100"]
+
+    def test_renders_outside_the_claim_transaction(self, product_image, monkeypatch):
+        depth = len(connection.atomic_blocks)
+        render = ImageRenditions.render
+        depths = []
+
+        def spy(image):
+            depths.append(len(connection.atomic_blocks))
+            return render(image)
+
+        monkeypatch.setattr(ImageRenditions, "render", spy)
+        ImageRenditions.process_pending()
+        assert depths == [depth]
+
+    def test_lost_claim_is_dropped(self, product_image, monkeypatch):
+        render = ImageRenditions.render
+
+        def reset_meanwhile(image):
+            renditions = render(image)
+            ImageRenditions.reset()
+            return renditions
+
+        monkeypatch.setattr(ImageRenditions, "render", reset_meanwhile)
+        ImageRenditions.process_pending()
+        product_image.refresh_from_db()
+        assert product_image.renditions == {}
+        assert product_image.renditions_ready_at is None
+
+    def test_stale_claims_are_taken_over(self, product_image, settings):
+        settings.PRODUCT_IMAGE_RENDITION_CLAIM_TIMEOUT = 60
+        claimed = ProductImage.objects.filter(pk=product_image.pk)
+        claimed.update(renditions_claimed_at=timezone.now())
+        assert ImageRenditions.process_pending() == 0
+
+        claimed.update(renditions_claimed_at=timezone.now() - timedelta(minutes=2))
+        assert ImageRenditions.process_pending() == 1
+        product_image.refresh_from_db()
+        assert product_image.renditions_claimed_at is None
+        assert product_image.renditions_ready_at is not None
+
+    def test_command_drains_queue(self, product_image, capsys):
+        call_command("generate_image_renditions", "--once", "--batch-size", "1")
+        assert "Rendered 1 images" in capsys.readouterr().out
+
+        call_command("generate_image_renditions", "--once", "--regenerate")
+        assert "Rendered 1 images" in capsys.readouterr().out
+
+
+class TestProductImageSerializer:
+    def test_srcset_empty_until_rendered(self, product_image):
+        assert ProductImageSerializer(product_image).data["srcset"] == {}
+
+    def test_srcset_lists_widths(self, product_image):
+        ImageRenditions.process_pending()
+        product_image.refresh_from_db()
+        srcset = ProductImageSerializer(product_image).data["srcset"]
+        url = product_image.image.storage.url
+        paths = product_image.renditions["webp"]
+        assert srcset == {
+            "webp": f"{url(paths['160'])} 160w, {url(paths['320'])} 320w",
+        }
@@ -0,0 +1,158 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework.test import APIRequestFactory
+
+from e_commerce.products.api.uploadhandlers import ProductImageUploadHandler
+from e_commerce.products.api.views import ProductViewSet
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.utils.storages import StagedUpload
+
+
+@pytest.fixture(autouse=True)
+def _upload_limits(settings):
+    settings.PRODUCT_IMAGE_MAX_DIMENSION = 500
+    settings.PRODUCT_IMAGE_MAX_UPLOAD_SIZE = 64 * 1024
+
+
+@pytest.fixture
+def client(seller):
+    client = APIClient()
+    client.force_authenticate(user=seller.user)
+    return client
+
+
+def upload(name="photo.png", size=(50, 40), fmt="PNG"):
+    buffer = BytesIO()
+    Image.new("RGB", size, "blue").save(buffer, format=fmt)
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+def create(client, images):
+    return client.post(
+        reverse("api:product-list"),
+        {
+            "name": "Lamp",
+            "description": "A lamp",
+            "price": "12.50",
+            "images": images,
+        },
+        format="multipart",
+    )
+
+
+def stored_files(tmp_path):
+    return [
+        path
+        for path in tmp_path.rglob("*")
+        if path.is_file() and path.suffix != ".refs"
+    ]
+
+
+class TestProductCreateUploads:
+    def test_images_inserted_in_one_query(self, client, tmp_path):
+        with CaptureQueriesContext(connection) as queries:
+            response = create(client, [upload(f"{i}.png") for i in range(6)])
+
+        assert response.status_code == 201  # noqa: PLR2004
+        assert len(response.data["images"]) == 6  # noqa: PLR2004
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "products_productimage"')
+        ]
+        assert len(inserts) == 1
+        # Identical uploads share one content-addressed file.
+        assert len(stored_files(tmp_path)) == 1
+
+    # DRF marks the enclosing atomic block for rollback on errors, which
+    # would be the test transaction here.
+    @pytest.mark.django_db(transaction=True)
+    def test_invalid_images_rejected_before_writing(self, client, tmp_path):
+        response = create(
+            client,
+            [
+                upload("ok.png"),
+                SimpleUploadedFile("fake.png", b"not an image"),
+                upload("huge.png", size=(501, 10)),
+                upload("anim.bmp", fmt="BMP"),
+            ],
+        )
+
+        assert response.status_code == 400  # noqa: PLR2004
+        assert response.data == [
+            "fake.png: not a valid image.",
+            "huge.png: images may be at most 500px on each side.",
+            "anim.bmp: unsupported image format BMP.",
+        ]
+        assert not Product.objects.exists()
+        assert stored_files(tmp_path) == []
+
+    def test_files_discarded_when_insert_fails(self, client, tmp_path, monkeypatch):
+        def fail(*args, **kwargs):
+            raise DatabaseError
+
+        monkeypatch.setattr(ProductImage.objects, "bulk_create", fail)
+        with pytest.raises(DatabaseError):
+            create(client, [upload()])
+
+        assert not Product.objects.exists()
+        assert stored_files(tmp_path) == []
+
+    def test_product_views_opt_out_of_atomic_requests(self):
+        view = ProductViewSet.as_view({"post": "create"})
+        assert view._non_atomic_requests  # noqa: SLF001
+
+
+class TestProductImageUploadHandler:
+    def parse(self, files):
+        request = APIRequestFactory().post(
+            "/api/products/",
+            {"images": files},
+            format="multipart",
+        )
+        request.upload_handlers = [ProductImageUploadHandler(request)]
+        return request.FILES.getlist("images")
+
+    def test_streams_into_storage(self, tmp_path):
+        content = upload().read()
+        (staged,) = self.parse([SimpleUploadedFile("photo.PNG", content)])
+
+        assert isinstance(staged, StagedUpload)
+        assert staged.size == len(content)
+        assert staged.read() == content
+
+        name = staged.commit()
+        storage = ProductImage._meta.get_field("image").storage  # noqa: SLF001
+        assert name == storage.blob_name(storage.digest(staged), "photo.png")
+        assert storage.open(name).read() == content
+        staged.close()
+        assert stored_files(tmp_path) == [tmp_path / name]
+
+    def test_uncommitted_uploads_removed_on_close(self, tmp_path):
+        (staged,) = self.parse([upload()])
+        staged.close()
+        assert stored_files(tmp_path) == []
+
+    def test_oversize_upload_rejected(self, client, tmp_path):
+        big = SimpleUploadedFile("big.png", b"x" * (64 * 1024 + 1))
+        response = create(client, [upload("small.png"), big])
+
+        assert response.status_code == 413  # noqa: PLR2004
+        assert response.data["detail"].startswith("big.png: images may be at most 64")
+        assert stored_files(tmp_path) == []
+
+    def test_too_many_files_rejected(self, client, tmp_path):
+        response = create(client, [upload(f"{i}.png") for i in range(7)])
+
+        assert response.status_code == 400  # noqa: PLR2004
+        assert response.data == ["A maximum of 6 images is allowed."]
+        assert stored_files(tmp_path) == []
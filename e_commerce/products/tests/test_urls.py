@@ -4,7 +4,6 @@ from django.urls import reverse
 
 from e_commerce.products.models import Category
 from e_commerce.products.models import Product
-from e_commerce.users.models import Seller
 from e_commerce.users.models import User
 
 
@@ -17,11 +16,6 @@ def user(db):
     )
 
 
-@pytest.fixture
-def seller(user):
-    return Seller.objects.create(user=user, shop_name="Shop", shop_description="Desc")
-
-
 @pytest.fixture
 def category(db):
     return Category.objects.create(name="Electronics")
@@ -5,7 +5,6 @@ from e_commerce.products.api.views import CategoryViewSet
 from e_commerce.products.api.views import ProductViewSet
 from e_commerce.products.models import Category
 from e_commerce.products.models import Product
-from e_commerce.users.models import Seller
 from e_commerce.users.models import User
 
 
@@ -23,11 +22,6 @@ def user(db):
     )
 
 
-@pytest.fixture
-def seller(user):
-    return Seller.objects.create(user=user, shop_name="Shop", shop_description="Desc")
-
-
 @pytest.fixture
 def category(db):
     return Category.objects.create(name="Electronics")
@@ -46,6 +46,8 @@ class CustomerAdmin(admin.ModelAdmin):
 
     list_display = ["id", "user", "date_of_birth"]
     search_fields = ["user__username", "user__email"]
+    list_select_related = ["user"]
+    raw_id_fields = ["user"]
     ordering = ["id"]
 
 
@@ -55,6 +57,8 @@ class SellerAdmin(admin.ModelAdmin):
 
     list_display = ["id", "user", "shop_name", "shop_description"]
     search_fields = ["user__username", "shop_name"]
+    list_select_related = ["user"]
+    raw_id_fields = ["user"]
     ordering = ["id"]
 
 
@@ -64,4 +68,6 @@ class AddressAdmin(admin.ModelAdmin):
 
     list_display = ["id", "user", "street", "city", "country"]
     search_fields = ["user__username", "street", "city", "country"]
+    list_select_related = ["user"]
+    raw_id_fields = ["user"]
     ordering = ["id"]
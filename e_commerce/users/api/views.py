@@ -8,15 +8,35 @@ from rest_framework.mixins import DestroyModelMixin
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied, NotFound
+from rest_framework.exceptions import (
+    NotFound,
+    ParseError,
+    PermissionDenied,
+    ValidationError,
+)
 
-from django.db import models
 import stripe
+from datetime import UTC
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
 from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.dateparse import parse_datetime
 
 from e_commerce.users.models import User, Customer, Seller, Address
+from e_commerce.users.profiles import get_customer, get_seller, get_profile
 from e_commerce.orders.models import OrderItem
-from e_commerce.orders.api.serializers import OrderSerializer, OrderItemSerializer
+from e_commerce.orders.api.serializers import OrderItemSerializer
+from e_commerce.orders.api.readers import OrderItemReader, OrderReader
+from e_commerce.orders.api.serializers import SalesPointSerializer
+from e_commerce.orders.api.filters import OrderItemFilter
+from e_commerce.orders.api.pagination import NewestFirstCursorPagination
+from e_commerce.orders.services.earnings import EarningsLedger
+from e_commerce.orders.services.exports import OrderExports
+from e_commerce.orders.services.rollups import GRANULARITIES, SalesRollups
+from e_commerce.utils.exports import EXPORT_RENDERERS
 
 from .serializers import (
     UserSerializer,
@@ -25,6 +45,36 @@ from .serializers import (
     AddressSerializer,
 )
 
+DEFAULT_ANALYTICS_RANGE = {
+    "hour": timedelta(days=2),
+    "day": timedelta(days=30),
+}
+
+
+def parse_moment(value):
+    """Parse an ISO date or datetime query parameter into an aware datetime."""
+    if not value:
+        return None
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = moment.replace(tzinfo=UTC)
+    return moment
+
+
+def parse_positive_int(value):
+    """Parse an optional id query parameter; raises ValueError if invalid."""
+    if value is None:
+        return None
+    number = int(value)
+    if number < 1:
+        raise ValueError(value)
+    return number
+
 
 class UserViewSet(
     RetrieveModelMixin,
@@ -76,9 +126,8 @@ class CustomerViewSet(
         """
         Custom action to get the current user's customer profile.
         """
-        try:
-            customer = self.get_queryset().get(user=request.user)
-        except Customer.DoesNotExist:
+        customer = get_customer(request)
+        if customer is None:
             return Response(
                 {"detail": "Customer profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -97,27 +146,20 @@ class CustomerViewSet(
         methods=["get"],
         url_path="orders",
         permission_classes=[IsAuthenticated],
+        pagination_class=NewestFirstCursorPagination,
     )
     def my_orders(self, request):
         """
-        endpoint to get the current cursomers's orders.
+        endpoint to get the current cursomers's orders, newest first.
         """
-        try:
-            customer = self.get_queryset().get(user=request.user)
-        except Customer.DoesNotExist:
+        customer = get_customer(request)
+        if customer is None:
             return Response(
                 {"detail": "Customer profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        orders = customer.orders.all()
-        serializer = OrderSerializer(
-            orders,
-            many=True,
-            context={
-                "request": request,
-            },
-        )
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(OrderReader.rows(customer.orders.all()))
+        return self.get_paginated_response(OrderReader().read(page))
 
 
 class SellerViewSet(
@@ -147,9 +189,8 @@ class SellerViewSet(
         """
         Custom action to get the current user's seller profile.
         """
-        try:
-            seller = self.get_queryset().get(user=request.user)
-        except Seller.DoesNotExist:
+        seller = get_seller(request)
+        if seller is None:
             return Response(
                 {"detail": "Seller profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -168,27 +209,77 @@ class SellerViewSet(
         methods=["get"],
         url_path="orders",
         permission_classes=[IsAuthenticated],
+        pagination_class=NewestFirstCursorPagination,
     )
     def orders(self, request):
         """
-        Endpoint to get all orders (OrderItems) for the seller.
+        Endpoint to get the seller's orders (OrderItems), newest first.
+        Cursor paginated; filter with ?status=, ?created_after=, ?created_before=.
         """
-        try:
-            seller = self.get_queryset().get(user=request.user)
-        except Seller.DoesNotExist:
+        seller = get_seller(request)
+        if seller is None:
             return Response(
                 {"detail": "Seller profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        orders = seller.order_items.all()
-        serializer = OrderItemSerializer(
-            orders,
-            many=True,
-            context={
-                "request": request,
-            },
+        filterset = OrderItemFilter(
+            request.query_params,
+            queryset=seller.order_items.all(),
+            request=request,
         )
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        page = self.paginate_queryset(OrderItemReader.rows(filterset.qs))
+        return self.get_paginated_response(OrderItemReader().read(page))
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="orders/export",
+        permission_classes=[IsAuthenticated],
+        renderer_classes=EXPORT_RENDERERS,
+    )
+    def export_orders(self, request):
+        """
+        Stream all of the seller's order items as CSV or NDJSON
+        (?format=csv|ndjson). Takes the same filters as the orders endpoint.
+        """
+        seller = get_seller(request)
+        if seller is None:
+            return Response(
+                {"detail": "Seller profile not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        filterset = OrderItemFilter(
+            request.query_params,
+            queryset=seller.order_items.all(),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        export = OrderExports.order_items(filterset.qs)
+        return export.response(request.accepted_renderer.format)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="payouts/export",
+        permission_classes=[IsAuthenticated],
+        renderer_classes=EXPORT_RENDERERS,
+    )
+    def export_payouts(self, request):
+        """
+        Stream all of the seller's payouts as CSV or NDJSON
+        (?format=csv|ndjson).
+        """
+        seller = get_seller(request)
+        if seller is None:
+            return Response(
+                {"detail": "Seller profile not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        export = OrderExports.payouts(seller.payouts.all())
+        return export.response(request.accepted_renderer.format)
 
     @action(
         detail=False,
@@ -200,19 +291,13 @@ class SellerViewSet(
         """
         Endpoint to get the total earnings for the seller.
         """
-        try:
-            seller = self.get_queryset().get(user=request.user)
-        except Seller.DoesNotExist:
+        seller = get_seller(request)
+        if seller is None:
             return Response(
                 {"detail": "Seller profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        total_earnings = (
-            seller.payouts.aggregate(
-                total_earnings=models.Sum("amount"),
-            )["total_earnings"]
-            or 0
-        )
+        total_earnings = EarningsLedger.seller_total(seller)
         return Response(
             {"total_earnings": str(total_earnings)},
             status=status.HTTP_200_OK,
@@ -228,9 +313,8 @@ class SellerViewSet(
         """
         Endpoint to get the total earnings for a specific product.
         """
-        try:
-            seller = self.get_queryset().get(user=request.user)
-        except Seller.DoesNotExist:
+        seller = get_seller(request)
+        if seller is None:
             return Response(
                 {"detail": "Seller profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -244,12 +328,13 @@ class SellerViewSet(
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        total_earnings = (
-            seller.order_items.filter(product__id=product_id).aggregate(
-                total=models.Sum("seller_payout_amount"),
-            )["total"]
-            or 0
-        )
+        try:
+            product_id = parse_positive_int(product_id)
+        except ValueError as error:
+            msg = "product_id must be a positive integer."
+            raise ParseError(msg) from error
+
+        total_earnings = EarningsLedger.product_total(seller, product_id)
 
         return Response(
             {"product_id": product_id, "total_earnings": str(total_earnings)},
@@ -266,9 +351,8 @@ class SellerViewSet(
         """
         Endpoint for sellers to update the status of an order item they own.
         """
-        try:
-            seller = self.get_queryset().get(user=request.user)
-        except Seller.DoesNotExist:
+        seller = get_seller(request)
+        if seller is None:
             return Response(
                 {"detail": "Seller profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -294,6 +378,76 @@ class SellerViewSet(
         serializer = OrderItemSerializer(order_item, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="analytics",
+        permission_classes=[IsAuthenticated],
+    )
+    def analytics(self, request):
+        """
+        Endpoint to get the seller's sales time series from the rollup tables.
+        ?granularity=day|hour&from=&to= (ISO dates or datetimes, `to` exclusive)
+        and optionally &product_id=.
+        """
+        seller = get_seller(request)
+        if seller is None:
+            return Response(
+                {"detail": "Seller profile not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        granularity = request.query_params.get("granularity", "day")
+        if granularity not in GRANULARITIES:
+            return Response(
+                {"detail": "granularity must be one of: hour, day."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            end = parse_moment(request.query_params.get("to")) or timezone.now()
+            start = parse_moment(request.query_params.get("from")) or (
+                end - DEFAULT_ANALYTICS_RANGE[granularity]
+            )
+        except ValueError:
+            return Response(
+                {"detail": "from and to must be ISO 8601 dates or datetimes."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if start >= end:
+            return Response(
+                {"detail": "from must be before to."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        retention = timedelta(days=settings.SALES_ROLLUP_HOURLY_RETENTION_DAYS)
+        if granularity == "hour" and end - start > retention:
+            return Response(
+                {"detail": f"Hourly ranges are limited to {retention.days} days."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            product_id = parse_positive_int(request.query_params.get("product_id"))
+        except ValueError as error:
+            msg = "product_id must be a positive integer."
+            raise ParseError(msg) from error
+
+        series = SalesRollups.series(
+            seller,
+            granularity,
+            start,
+            end,
+            product_id=product_id,
+        )
+        return Response(
+            {
+                "granularity": granularity,
+                "from": start,
+                "to": end,
+                "results": SalesPointSerializer(series, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
     @action(
         detail=False,
         methods=["post"],
@@ -305,9 +459,8 @@ class SellerViewSet(
         Endpoint to initiate Stripe Connect onboarding for the seller.
         Returns a Stripe onboarding URL.
         """
-        try:
-            seller = self.get_queryset().get(user=request.user)
-        except Seller.DoesNotExist:
+        seller = get_seller(request)
+        if seller is None:
             return Response(
                 {"detail": "Seller profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -346,18 +499,31 @@ class AddressViewSet(
     serializer_class = AddressSerializer
     queryset = Address.objects.all()
 
-    def get_queryset(self):
+    # Router basename of each nested address route -> profile the URL names.
+    owner_roles = {
+        "customer-addresses": "customer",
+        "seller-addresses": "seller",
+    }
+
+    def check_address_owner(self):
+        """
+        Verify once per request that the nested URL names the requesting user
+        and that they have the profile the route is nested under.
+        """
+        if getattr(self, "_address_owner_checked", False):
+            return
         assert isinstance(self.request.user.id, int)
         username = self.kwargs.get("nested_1_user__username")
 
-        is_seller = Seller.objects.filter(user__username=username).exists()
-        is_customer = Customer.objects.filter(user__username=username).exists()
-
-        if "sellers" in self.request.path and not is_seller:
-            raise NotFound(f"no such seller {username}")  # noqa: EM102, TRY003
-        if "customers" in self.request.path and not is_customer:
-            raise NotFound(f"no such customer {username}")  # noqa: EM102, TRY003
-
         if self.request.user.username != username:
             raise PermissionDenied("You are not allowed to access other's addresses.")  # noqa: EM101, TRY003
+
+        role = self.owner_roles.get(getattr(self, "basename", None))
+        if role and get_profile(self.request, role) is None:
+            raise NotFound(f"no such {role} {username}")  # noqa: EM102, TRY003
+
+        self._address_owner_checked = True
+
+    def get_queryset(self):
+        self.check_address_owner()
         return self.queryset.filter(user=self.request.user)
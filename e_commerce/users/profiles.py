@@ -0,0 +1,89 @@
+"""Request-scoped and cache-backed resolution of Customer/Seller profiles.
+
+Views used to look up ``Customer``/``Seller`` from ``request.user`` several
+times per request. ``get_customer``/``get_seller`` resolve a profile at most
+once per request, keep it on ``request.customer``/``request.seller`` and back
+it with the default cache (Redis in production), so warm requests do not touch
+the database for profiles at all.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.db import transaction
+
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+
+PROFILE_MODELS = {
+    "customer": Customer,
+    "seller": Seller,
+}
+
+# Stored for users without the profile, so negative lookups are cached too.
+NO_PROFILE = ()
+
+
+def profile_cache_key(role, user_id):
+    return f"users:profile:{role}:{user_id}"
+
+
+def _http_request(request):
+    # DRF's Request proxies attribute reads to the wrapped HttpRequest, so
+    # storing the profile there makes it visible from both objects.
+    return getattr(request, "_request", request)
+
+
+def _load_profile(role, user):
+    model = PROFILE_MODELS[role]
+    key = profile_cache_key(role, user.pk)
+    names = [field.attname for field in model._meta.concrete_fields]  # noqa: SLF001
+
+    values = cache.get(key)
+    if values is None:
+        row = model.objects.filter(user_id=user.pk).values_list(*names).first()
+        values = row or NO_PROFILE
+        cache.set(key, values, settings.PROFILE_CACHE_TIMEOUT)
+
+    related = model._meta.get_field("user").remote_field  # noqa: SLF001
+    if values == NO_PROFILE:
+        # Prime the reverse accessor so ``hasattr(user, role)`` is query-free.
+        related.set_cached_value(user, None)
+        return None
+
+    profile = model.from_db(router.db_for_read(model), names, values)
+    # Reuse the authenticated user; this also primes ``user.<role>``.
+    profile.user = user
+    return profile
+
+
+def get_profile(request, role):
+    """Return the ``role`` profile of ``request.user`` or ``None``."""
+    user = request.user
+    if not user.is_authenticated:
+        return None
+
+    http_request = _http_request(request)
+    resolved = http_request.__dict__.setdefault("_resolved_profiles", {})
+    if (role, user.pk) not in resolved:
+        resolved[(role, user.pk)] = _load_profile(role, user)
+    profile = resolved[(role, user.pk)]
+    setattr(http_request, role, profile)
+    return profile
+
+
+def get_customer(request):
+    """Return the Customer profile of the requesting user, if any."""
+    return get_profile(request, "customer")
+
+
+def get_seller(request):
+    """Return the Seller profile of the requesting user, if any."""
+    return get_profile(request, "seller")
+
+
+def invalidate_profile(role, user_id):
+    """Drop the cached profile now and again once the transaction commits."""
+    key = profile_cache_key(role, user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.users.profiles import invalidate_profile
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def invalidate_customer_profile(sender, instance, **kwargs):
+    invalidate_profile("customer", instance.user_id)
+
+
+@receiver(post_save, sender=Seller)
+@receiver(post_delete, sender=Seller)
+def invalidate_seller_profile(sender, instance, **kwargs):
+    invalidate_profile("seller", instance.user_id)
+
+
+def release_profile_picture(instance, name):
+    storage = instance.profile_picture.storage
+    transaction.on_commit(lambda: storage.delete(name))
+
+
+@receiver(pre_save, sender=User)
+def remember_profile_picture(sender, instance, update_fields=None, **kwargs):
+    if instance._state.adding or (  # noqa: SLF001
+        update_fields is not None and "profile_picture" not in update_fields
+    ):
+        return
+    instance._stored_profile_picture = (  # noqa: SLF001
+        User.objects.filter(pk=instance.pk)
+        .values_list("profile_picture", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=User)
+def release_replaced_profile_picture(sender, instance, **kwargs):
+    previous = instance.__dict__.pop("_stored_profile_picture", None)
+    if previous and previous != instance.profile_picture.name:
+        release_profile_picture(instance, previous)
+
+
+@receiver(post_delete, sender=User)
+def release_deleted_profile_picture(sender, instance, **kwargs):
+    if instance.profile_picture:
+        release_profile_picture(instance, instance.profile_picture.name)
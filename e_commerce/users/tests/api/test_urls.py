@@ -4,7 +4,6 @@ from django.urls import reverse
 
 from e_commerce.users.models import Address
 from e_commerce.users.models import Customer
-from e_commerce.users.models import Seller
 from e_commerce.users.models import User
 
 
@@ -22,11 +21,6 @@ def customer(user):
     return Customer.objects.create(user=user)
 
 
-@pytest.fixture
-def seller(user):
-    return Seller.objects.create(user=user, shop_name="Shop", shop_description="Desc")
-
-
 @pytest.fixture
 def address(user):
     return Address.objects.create(
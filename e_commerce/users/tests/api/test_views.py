@@ -1,13 +1,18 @@
 import pytest
+from django.urls import reverse
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APIClient
 from rest_framework.test import APIRequestFactory
 
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.products.models import Product
 from e_commerce.users.api.views import AddressViewSet
 from e_commerce.users.api.views import CustomerViewSet
 from e_commerce.users.api.views import SellerViewSet
 from e_commerce.users.api.views import UserViewSet
 from e_commerce.users.models import Address
 from e_commerce.users.models import Customer
-from e_commerce.users.models import Seller
 from e_commerce.users.models import User
 
 
@@ -39,11 +44,6 @@ def customer(user):
     return Customer.objects.create(user=user)
 
 
-@pytest.fixture
-def seller(user):
-    return Seller.objects.create(user=user, shop_name="Shop", shop_description="Desc")
-
-
 @pytest.fixture
 def address(user):
     return Address.objects.create(
@@ -119,3 +119,198 @@ class TestAddressViewSet:
         view.request = request
         view.kwargs = {"nested_1_user__username": address.user.username}
         assert address in view.get_queryset()
+
+    def test_get_queryset_other_user(self, address, another_user, api_rf):
+        view = AddressViewSet()
+        request = api_rf.get("/fake-url/")
+        request.user = another_user
+        view.request = request
+        view.kwargs = {"nested_1_user__username": address.user.username}
+        with pytest.raises(PermissionDenied):
+            view.get_queryset()
+
+
+class TestAddressViewSetQueries:
+    """The owner/role check costs one profile query per request at most."""
+
+    @pytest.fixture
+    def client(self, customer):
+        client = APIClient()
+        client.force_authenticate(user=customer.user)
+        return client
+
+    def detail_url(self, address):
+        return reverse(
+            "api:customer-addresses-detail",
+            kwargs={
+                "nested_1_user__username": address.user.username,
+                "pk": address.pk,
+            },
+        )
+
+    def test_list(self, client, address, django_assert_num_queries):
+        url = reverse(
+            "api:customer-addresses-list",
+            kwargs={"nested_1_user__username": address.user.username},
+        )
+        # savepoint, profile, count, page, release
+        with django_assert_num_queries(5):
+            response = client.get(url)
+        assert response.status_code == 200  # noqa: PLR2004
+
+    def test_retrieve(self, client, address, django_assert_num_queries):
+        # savepoint, profile, address, release
+        with django_assert_num_queries(4):
+            response = client.get(self.detail_url(address))
+        assert response.status_code == 200  # noqa: PLR2004
+
+    def test_update(self, client, address, django_assert_num_queries):
+        # savepoint, profile, address, update, release
+        with django_assert_num_queries(5):
+            response = client.patch(self.detail_url(address), {"city": "Newtown"})
+        assert response.status_code == 200  # noqa: PLR2004
+
+    def test_delete(self, client, address, django_assert_num_queries):
+        # savepoint, profile, address, shipping orders (PROTECT), delete, release
+        with django_assert_num_queries(6):
+            response = client.delete(self.detail_url(address))
+        assert response.status_code == 204  # noqa: PLR2004
+
+    def test_warm_profile_cache(self, client, address, django_assert_num_queries):
+        client.get(self.detail_url(address))
+        with django_assert_num_queries(3):
+            response = client.get(self.detail_url(address))
+        assert response.status_code == 200  # noqa: PLR2004
+
+    def test_wrong_role(self, customer, address):
+        client = APIClient()
+        client.force_authenticate(user=customer.user)
+        url = reverse(
+            "api:seller-addresses-list",
+            kwargs={"nested_1_user__username": address.user.username},
+        )
+        response = client.get(url)
+        assert response.status_code == 404  # noqa: PLR2004
+
+
+class TestSellerOrders:
+    @pytest.fixture
+    def buyer(self, another_user):
+        return Customer.objects.create(user=another_user)
+
+    @pytest.fixture
+    def shipping_address(self, another_user):
+        return Address.objects.create(
+            user=another_user,
+            street="1 Buyer Rd",
+            city="Buyville",
+            country="Testland",
+            postal_code="54321",
+        )
+
+    @pytest.fixture
+    def make_items(self, seller, buyer, shipping_address):
+        def make(count, seller_status="pending"):
+            items = []
+            for index in range(count):
+                product = Product.objects.create(
+                    name=f"Product {index}",
+                    description="desc",
+                    price=10,
+                    seller=seller,
+                )
+                order = Order.objects.create(
+                    customer=buyer,
+                    total_amount=10,
+                    platform_commission=0,
+                    shipping_address=shipping_address,
+                )
+                items.append(
+                    OrderItem.objects.create(
+                        order=order,
+                        product=product,
+                        seller=seller,
+                        price_at_time=10,
+                        seller_status=seller_status,
+                        seller_payout_amount=10,
+                    ),
+                )
+            return items
+
+        return make
+
+    @pytest.fixture
+    def client(self, seller):
+        client = APIClient()
+        client.force_authenticate(user=seller.user)
+        return client
+
+    def test_constant_queries(self, client, make_items, django_assert_num_queries):
+        url = reverse("api:seller-orders")
+        make_items(1)
+        # savepoint, profile, page, release
+        with django_assert_num_queries(4):
+            client.get(url)
+        make_items(9)
+        with django_assert_num_queries(3):
+            response = client.get(url)
+        assert len(response.data["results"]) == 10  # noqa: PLR2004
+        item = response.data["results"][0]
+        assert item["seller_name"] == "testuser"
+        assert item["shipping_address"]["city"] == "Buyville"
+
+    def test_cursor_pagination(self, client, make_items):
+        items = make_items(3)
+        response = client.get(reverse("api:seller-orders"), {"page_size": 2})
+        assert [row["id"] for row in response.data["results"]] == [
+            items[2].id,
+            items[1].id,
+        ]
+        response = client.get(response.data["next"])
+        assert [row["id"] for row in response.data["results"]] == [items[0].id]
+        assert response.data["next"] is None
+
+    def test_filters(self, client, make_items):
+        make_items(2)
+        shipped = make_items(1, seller_status="shipped")
+        url = reverse("api:seller-orders")
+        response = client.get(url, {"status": "shipped"})
+        assert [row["id"] for row in response.data["results"]] == [shipped[0].id]
+
+        response = client.get(url, {"created_after": "2999-01-01"})
+        assert response.data["results"] == []
+
+        response = client.get(url, {"status": "bogus"})
+        assert response.status_code == 400  # noqa: PLR2004
+
+
+class TestCustomerOrders:
+    def test_paginated_history(self, customer, address, seller):
+        order = Order.objects.create(
+            customer=customer,
+            total_amount=10,
+            platform_commission=0,
+            shipping_address=address,
+        )
+        product = Product.objects.create(
+            name="Product",
+            description="desc",
+            price=10,
+            seller=seller,
+        )
+        OrderItem.objects.create(
+            order=order,
+            product=product,
+            seller=seller,
+            price_at_time=10,
+            seller_payout_amount=10,
+        )
+        client = APIClient()
+        client.force_authenticate(user=customer.user)
+
+        response = client.get(reverse("api:customer-my-orders"))
+
+        assert response.status_code == 200  # noqa: PLR2004
+        (row,) = response.data["results"]
+        assert row["id"] == str(order.id)
+        assert row["items"][0]["shipping_address"]["street"] == address.street
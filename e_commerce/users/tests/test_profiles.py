@@ -0,0 +1,70 @@
+import pytest
+from django.test import RequestFactory
+
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.users.profiles import get_customer
+from e_commerce.users.profiles import get_seller
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(
+        username="testuser",
+        password="pass",  # noqa: S106
+        name="Test User",
+    )
+
+
+@pytest.fixture
+def customer(user):
+    return Customer.objects.create(user=user)
+
+
+def make_request(user):
+    request = RequestFactory().get("/fake-url/")
+    request.user = user
+    return request
+
+
+class TestProfileResolution:
+    def test_resolves_once_per_request(self, customer, django_assert_num_queries):
+        request = make_request(customer.user)
+        with django_assert_num_queries(1):
+            assert get_customer(request) == customer
+            assert get_customer(request) == customer
+            assert request.customer == customer
+            # The reverse accessor is primed as well.
+            assert request.user.customer == customer
+
+    def test_warm_cache_skips_database(self, customer, django_assert_num_queries):
+        get_customer(make_request(customer.user))
+        request = make_request(customer.user)
+        with django_assert_num_queries(0):
+            resolved = get_customer(request)
+            assert resolved.user is request.user
+        assert resolved.pk == customer.pk
+
+    def test_missing_profile_is_cached(self, user, django_assert_num_queries):
+        get_seller(make_request(user))
+        request = make_request(user)
+        with django_assert_num_queries(0):
+            assert get_seller(request) is None
+            assert request.seller is None
+            assert not hasattr(request.user, "seller")
+
+    def test_invalidated_on_save(self, user):
+        assert get_seller(make_request(user)) is None
+        seller = Seller.objects.create(user=user, shop_name="Shop")
+        assert get_seller(make_request(user)) == seller
+
+        seller.shop_name = "Renamed"
+        seller.save()
+        assert get_seller(make_request(user)).shop_name == "Renamed"
+
+    def test_invalidated_on_delete(self, customer):
+        user = customer.user
+        assert get_customer(make_request(user)) == customer
+        customer.delete()
+        assert get_customer(make_request(user)) is None
@@ -1,6 +1,7 @@
 from django.contrib.auth.mixins import LoginRequiredMixin  # noqa: I001
 from django.contrib.messages.views import SuccessMessageMixin
 from django.db.models import QuerySet
+from django.http import Http404
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView
@@ -8,6 +9,7 @@ from django.views.generic import RedirectView
 from django.views.generic import UpdateView
 
 from e_commerce.users.models import User, Customer, Seller
+from e_commerce.users.profiles import get_customer, get_seller
 
 
 class UserDetailView(LoginRequiredMixin, DetailView):
@@ -52,7 +54,10 @@ class CustomerDetailView(LoginRequiredMixin, DetailView):
     slug_url_kwarg = "username"
 
     def get_object(self, queryset=None):
-        return Customer.objects.get(user=self.request.user)
+        customer = get_customer(self.request)
+        if customer is None:
+            raise Http404(_("Customer profile not found."))
+        return customer
 
 
 customer_detail_view = CustomerDetailView.as_view()
@@ -71,7 +76,10 @@ class CustomerUpdateView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
         )
 
     def get_object(self, queryset=None):
-        return Customer.objects.get(user=self.request.user)
+        customer = get_customer(self.request)
+        if customer is None:
+            raise Http404(_("Customer profile not found."))
+        return customer
 
 
 customer_update_view = CustomerUpdateView.as_view()
@@ -96,7 +104,10 @@ class SellerDetailView(LoginRequiredMixin, DetailView):
     slug_url_kwarg = "username"
 
     def get_object(self, queryset=None):
-        return Seller.objects.get(user=self.request.user)
+        seller = get_seller(self.request)
+        if seller is None:
+            raise Http404(_("Seller profile not found."))
+        return seller
 
 
 seller_detail_view = SellerDetailView.as_view()
@@ -115,7 +126,10 @@ class SellerUpdateView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
         )
 
     def get_object(self, queryset=None):
-        return Seller.objects.get(user=self.request.user)
+        seller = get_seller(self.request)
+        if seller is None:
+            raise Http404(_("Seller profile not found."))
+        return seller
 
 
 seller_update_view = SellerUpdateView.as_view()
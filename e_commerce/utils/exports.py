@@ -0,0 +1,174 @@
+"""
+Streaming CSV and NDJSON exports of whole tables.
+
+Rows are read with ``.values_list().iterator(chunk_size=...)``, which on
+PostgreSQL fetches through a server-side cursor, and are encoded and handed
+on one chunk at a time. Memory use depends on the chunk size, not on the
+number of rows exported.
+"""
+
+import csv
+import io
+import json
+
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from e_commerce.utils.renderers import ORJSON_OPTIONS
+from e_commerce.utils.renderers import OrjsonRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Rows fetched from the cursor, and encoded, per round trip.
+EXPORT_CHUNK_SIZE = 2000
+# CSV cells holding lists, as read back by the product import.
+CSV_LIST_SEPARATOR = "|"
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+_encoder = JSONEncoder()
+
+
+def _csv_cell(value):
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+
+if orjson is not None:
+
+    def _ndjson_line(record):
+        return orjson.dumps(record, default=_encoder.default, option=ORJSON_OPTIONS)
+
+else:  # pragma: no cover
+
+    def _ndjson_line(record):
+        return json.dumps(
+            record,
+            cls=JSONEncoder,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+
+class Export:
+    """
+    A named export of queryset. fields are (key, column, represent) triples
+    as taken by e_commerce.utils.rows.row_reader: column is read with
+    values_list() and written under key, through represent unless it is
+    None. The queryset should be ordered by an indexed column so the cursor
+    can stream without sorting the whole table first.
+    """
+
+    def __init__(self, name, queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+        self.name = name
+        self.queryset = queryset
+        self.fields = tuple(fields)
+        self.chunk_size = chunk_size
+
+    @property
+    def keys(self):
+        return [key for key, _, _ in self.fields]
+
+    def rows(self):
+        """Yield each row as a list of represented values, in key order"""
+        columns = [column for _, column, _ in self.fields]
+        represents = [represent for _, _, represent in self.fields]
+        # Without a transaction the cursor is declared WITH HOLD, which
+        # makes PostgreSQL materialize the whole result when the implicit
+        # transaction commits; inside one, rows are produced as fetched.
+        with transaction.atomic(using=self.queryset.db):
+            for row in self.queryset.values_list(*columns).iterator(
+                chunk_size=self.chunk_size,
+            ):
+                yield [
+                    value if represent is None else represent(value)
+                    for value, represent in zip(row, represents, strict=True)
+                ]
+
+    def chunks(self):
+        """Yield lists of at most chunk_size rows"""
+        chunk = []
+        for row in self.rows():
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def csv(self):
+        """Yield the export as UTF-8 CSV, a header line then chunks of rows"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.keys)
+        yield buffer.getvalue().encode()
+        for chunk in self.chunks():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_cell(value) for value in row] for row in chunk)
+            yield buffer.getvalue().encode()
+
+    def ndjson(self):
+        """Yield the export as one JSON object per line, in chunks of rows"""
+        keys = self.keys
+        for chunk in self.chunks():
+            yield b"".join(
+                _ndjson_line(dict(zip(keys, row, strict=True))) + b"\n" for row in chunk
+            )
+
+    def stream(self, fmt):
+        return self.csv() if fmt == "csv" else self.ndjson()
+
+    def filename(self, fmt):
+        return f"{self.name}-{timezone.now():%Y%m%d}.{fmt}"
+
+    def response(self, fmt):
+        """StreamingHttpResponse downloading the export as an attachment"""
+        response = StreamingHttpResponse(
+            self.stream(fmt),
+            content_type=CONTENT_TYPES[fmt],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{self.filename(fmt)}"'
+        return response
+
+    def write(self, fmt, out):
+        """Write the export to a binary file; returns the number of bytes"""
+        written = 0
+        for chunk in self.stream(fmt):
+            written += out.write(chunk)
+        return written
+
+
+class ExportRenderer(BaseRenderer):
+    """
+    Renderer selecting an export format through ?format= or Accept. Export
+    views return a StreamingHttpResponse, so only error responses are ever
+    rendered, and those are rendered as JSON.
+    """
+
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return OrjsonRenderer().render(data)
+
+
+class CSVRenderer(ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+EXPORT_RENDERERS = [CSVRenderer, NDJSONRenderer]
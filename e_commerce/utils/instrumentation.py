@@ -0,0 +1,223 @@
+"""
+Per-request instrumentation: database queries and time, cache hits and
+misses, Stripe API calls and time, and total latency, tagged with the
+resolved view name.
+
+RequestMetricsMiddleware measures a sample of requests, set by
+REQUEST_METRICS_SAMPLE_RATE, and reports each one as a Server-Timing header
+and a JSON log line on the e_commerce.request_metrics logger. With
+PROMETHEUS_METRICS_ENABLED it measures every request and also records it in
+the Prometheus histograms of e_commerce.utils.prometheus. Requests that are
+not measured only pay for one random() call; the cache and Stripe hooks
+installed at startup return straight away when no request is measured.
+"""
+
+import functools
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import stripe
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import connections
+
+from e_commerce.utils.prometheus import observe_request
+
+logger = logging.getLogger("e_commerce.request_metrics")
+
+_current = ContextVar("request_metrics", default=None)
+# Passed to cache.get() as the default, to tell misses from stored values.
+_MISS = object()
+
+
+class RequestMetrics:
+    """Counters of one measured request; times are in seconds"""
+
+    __slots__ = (
+        "cache_hits",
+        "cache_misses",
+        "db_queries",
+        "db_time",
+        "duration",
+        "started",
+        "stripe_calls",
+        "stripe_time",
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.stripe_calls = 0
+        self.stripe_time = 0.0
+
+    def execute(self, execute, sql, params, many, context):
+        """connection.execute_wrapper() hook counting and timing queries"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.db_queries += 1
+
+    def server_timing(self):
+        """Server-Timing header value, durations in milliseconds"""
+        return ", ".join(
+            [
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.db_queries} queries"',
+                f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+                f"stripe;dur={self.stripe_time * 1000:.1f}"
+                f';desc="{self.stripe_calls} calls"',
+                f"total;dur={self.duration * 1000:.1f}",
+            ],
+        )
+
+    def as_dict(self):
+        return {
+            "duration_ms": round(self.duration * 1000, 1),
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_time * 1000, 1),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "stripe_calls": self.stripe_calls,
+            "stripe_ms": round(self.stripe_time * 1000, 1),
+        }
+
+
+def current_metrics():
+    """Metrics of the request being measured, or None"""
+    return _current.get()
+
+
+@contextmanager
+def measure():
+    """Measure the enclosed block, yielding its RequestMetrics"""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics.execute))
+            yield metrics
+    finally:
+        _current.reset(token)
+        metrics.duration = time.perf_counter() - metrics.started
+
+
+def _instrument_get(get):
+    @functools.wraps(get)
+    def instrumented(self, key, default=None, *args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return get(self, key, default, *args, **kwargs)
+        value = get(self, key, _MISS, *args, **kwargs)
+        if value is _MISS:
+            metrics.cache_misses += 1
+            return default
+        metrics.cache_hits += 1
+        return value
+
+    instrumented.request_metrics = True
+    return instrumented
+
+
+def _instrument_get_many(get_many):
+    @functools.wraps(get_many)
+    def instrumented(self, keys, *args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return get_many(self, keys, *args, **kwargs)
+        keys = list(keys)
+        found = get_many(self, keys, *args, **kwargs)
+        metrics.cache_hits += len(found)
+        metrics.cache_misses += len(keys) - len(found)
+        return found
+
+    instrumented.request_metrics = True
+    return instrumented
+
+
+def _instrument_stripe(request_with_retries):
+    @functools.wraps(request_with_retries)
+    def instrumented(*args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return request_with_retries(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return request_with_retries(*args, **kwargs)
+        finally:
+            metrics.stripe_time += time.perf_counter() - started
+            metrics.stripe_calls += 1
+
+    instrumented.request_metrics = True
+    return instrumented
+
+
+def install():
+    """
+    Hook the configured cache backends and the Stripe HTTP client into the
+    measured request's metrics. Safe to call more than once.
+    """
+    for alias in settings.CACHES:
+        backend = type(caches[alias])
+        if not getattr(backend.get, "request_metrics", False):
+            backend.get = _instrument_get(backend.get)
+        # The base get_many() calls get() for each key, which counts already.
+        if backend.get_many is not BaseCache.get_many and not getattr(
+            backend.get_many,
+            "request_metrics",
+            False,
+        ):
+            backend.get_many = _instrument_get_many(backend.get_many)
+    client = stripe.HTTPClient
+    if not getattr(client.request_with_retries, "request_metrics", False):
+        client.request_with_retries = _instrument_stripe(client.request_with_retries)
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures every request for Prometheus when PROMETHEUS_METRICS_ENABLED,
+    and logs a REQUEST_METRICS_SAMPLE_RATE share of them. Place it first, so
+    the total covers the other middleware too. Streaming response bodies
+    are produced after it returns and are not included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install()
+
+    def __call__(self, request):
+        rate = settings.REQUEST_METRICS_SAMPLE_RATE
+        sampled = rate > 0 and (rate >= 1 or random.random() < rate)  # noqa: S311
+        if not sampled and not settings.PROMETHEUS_METRICS_ENABLED:
+            return self.get_response(request)
+
+        with measure() as metrics:
+            response = self.get_response(request)
+        match = request.resolver_match
+        view = match.view_name if match else None
+        if settings.PROMETHEUS_METRICS_ENABLED:
+            observe_request(view, request.method, metrics)
+        if not sampled:
+            return response
+        record = {
+            "view": view,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **metrics.as_dict(),
+        }
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing()
+        logger.info(json.dumps(record), extra={"request_metrics": record})
+        return response
@@ -0,0 +1,41 @@
+import codecs
+from io import BytesIO
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from e_commerce.utils.renderers import OrjsonRenderer
+from e_commerce.utils.renderers import orjson
+
+# orjson reads integers beyond 64 bits as floats, so bodies with a run of
+# 20+ digits go to the stdlib parser. Mapping digits to "0" and everything
+# else to " " makes that a plain substring search (a regex is much slower).
+DIGIT_MASK = bytes(
+    ord("0") if byte in b"0123456789" else ord(" ") for byte in range(256)
+)
+LONG_NUMBER = b"0" * 20
+
+
+class OrjsonParser(JSONParser):
+    """
+    JSONParser that decodes UTF-8 bodies with orjson. Bodies orjson would
+    read differently or rejects (big integers, invalid JSON, lone
+    surrogates) are handed to JSONParser, so results and error messages stay
+    the same.
+    """
+
+    renderer_class = OrjsonRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if LONG_NUMBER in body.translate(DIGIT_MASK):
+            return super().parse(BytesIO(body), media_type, parser_context)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(BytesIO(body), media_type, parser_context)
@@ -0,0 +1,159 @@
+"""
+Prometheus metrics and the /metrics endpoint.
+
+With PROMETHEUS_MULTIPROC_DIR set in the environment before the process
+starts, prometheus_client keeps every value in memory-mapped files in that
+directory, and /metrics aggregates the files of all worker processes; the
+gunicorn config marks the files of exited workers dead. Background workers
+in other containers (image renditions, product imports) write to their own
+subdirectory of it, since process ids repeat across containers, and are
+aggregated too. Without it, values live in the process and /metrics only
+reports its own.
+"""
+
+import os
+import secrets
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.http import Http404
+from django.http import HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import REGISTRY
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client import generate_latest
+from prometheus_client import multiprocess
+
+NAMESPACE = "ecommerce"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by resolved view name.",
+    ["view", "method"],
+    namespace=NAMESPACE,
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries per request by resolved view name.",
+    ["view"],
+    namespace=NAMESPACE,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100, 250),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds",
+    "Database time per request by resolved view name.",
+    ["view"],
+    namespace=NAMESPACE,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups",
+    "Cache get() keys by result, hit or miss.",
+    ["result"],
+    namespace=NAMESPACE,
+)
+DB_CONNECTIONS = Gauge(
+    "db_connections_open",
+    "Open database connections, summed over live worker processes.",
+    ["alias"],
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+STRIPE_WEBHOOK_LAG = Histogram(
+    "stripe_webhook_lag_seconds",
+    "Time from a Stripe event being created to its webhook being handled.",
+    ["event_type"],
+    namespace=NAMESPACE,
+    buckets=(0.5, 1, 2.5, 5, 15, 30, 60, 300, 900, 3600, 86400),
+)
+SELLER_PAYOUTS = Counter(
+    "seller_payouts",
+    "Seller payout transfers by status, succeeded or failed.",
+    ["status"],
+    namespace=NAMESPACE,
+)
+ORDERS_CREATED = Counter(
+    "orders_created",
+    "Orders checked out from carts.",
+    namespace=NAMESPACE,
+)
+PAYMENT_INTENTS = Counter(
+    "payment_intents",
+    "Stripe payment intents requested at checkout, by result.",
+    ["result"],
+    namespace=NAMESPACE,
+)
+CART_UPDATES = Counter(
+    "cart_updates",
+    "Cart changes by action: add, update or remove.",
+    ["action"],
+    namespace=NAMESPACE,
+)
+CATALOG_VERSION_BUMPS = Counter(
+    "catalog_version_bumps",
+    "Catalog version changes, each invalidating cached product lists.",
+    namespace=NAMESPACE,
+)
+PRODUCT_IMPORT_ROWS = Counter(
+    "product_import_rows",
+    "Product import rows by result, imported or failed.",
+    ["result"],
+    namespace=NAMESPACE,
+)
+PRODUCT_BULK_UPDATE_ROWS = Counter(
+    "product_bulk_update_rows",
+    "Bulk price and stock update rows by status.",
+    ["status"],
+    namespace=NAMESPACE,
+)
+
+
+class MultiProcessTreeCollector(multiprocess.MultiProcessCollector):
+    """Aggregates the files of the directory and of its subdirectories"""
+
+    def collect(self):
+        root = Path(self._path)
+        files = [*root.glob("*.db"), *root.glob("*/*.db")]
+        return self.merge([str(path) for path in files], accumulate=True)
+
+
+def observe_request(view, method, metrics):
+    """Record the RequestMetrics of one request handled by view"""
+    view = view or "<unresolved>"
+    REQUEST_LATENCY.labels(view, method).observe(metrics.duration)
+    REQUEST_DB_QUERIES.labels(view).observe(metrics.db_queries)
+    REQUEST_DB_TIME.labels(view).observe(metrics.db_time)
+    if metrics.cache_hits:
+        CACHE_LOOKUPS.labels("hit").inc(metrics.cache_hits)
+    if metrics.cache_misses:
+        CACHE_LOOKUPS.labels("miss").inc(metrics.cache_misses)
+    for connection in connections.all():
+        DB_CONNECTIONS.labels(connection.alias).set(
+            int(connection.connection is not None),
+        )
+
+
+def metrics_view(request):
+    """
+    Metrics in the Prometheus text format, for requests bearing
+    PROMETHEUS_METRICS_TOKEN. Answers 404 unless PROMETHEUS_METRICS_ENABLED
+    and a token is set, so the metrics are never public.
+    """
+    token = settings.PROMETHEUS_METRICS_TOKEN
+    if not settings.PROMETHEUS_METRICS_ENABLED or not token:
+        raise Http404
+    if not secrets.compare_digest(
+        request.headers.get("Authorization", ""),
+        f"Bearer {token}",
+    ):
+        return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessTreeCollector(registry)
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
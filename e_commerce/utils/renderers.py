@@ -0,0 +1,47 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_encoder = JSONEncoder()
+
+# Dates, times and Decimals go through DRF's own encoder so the output
+# matches JSONRenderer; serializer output rarely contains them anyway.
+ORJSON_OPTIONS = (
+    (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+)
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson, producing the same bytes as DRF's
+    compact, unicode JSON output. Indented output (the browsable API), and
+    anything orjson cannot encode, such as integers beyond 64 bits, fall
+    back to JSONRenderer. Non-finite floats render as null instead of
+    raising. Without orjson installed it is a plain JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.get_indent(accepted_media_type or "", renderer_context or {})
+            or not self.compact
+            or self.ensure_ascii
+            or not self.strict
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping as JSONRenderer, for JavaScript string literals.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9",
+                b"\\u2029",
+            )
+        return ret
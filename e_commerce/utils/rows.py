@@ -0,0 +1,66 @@
+"""
+Building blocks for serializing ``.values()`` rows on hot read endpoints.
+
+Each ``represent`` function returns exactly what the matching DRF field's
+to_representation() would for the model value, so readers built from them
+can stand in for a ModelSerializer without instantiating models, bound
+fields or nested serializers per object.
+"""
+
+from django.utils import timezone
+
+
+def decimal_string(decimal_places):
+    """DecimalField output for values already stored at decimal_places"""
+    spec = f".{decimal_places}f"
+
+    def represent(value):
+        return "" if value is None else format(value, spec)
+
+    return represent
+
+
+def iso_datetime():
+    """DateTimeField output: ISO 8601 in the current timezone, Z for UTC"""
+    tz = timezone.get_current_timezone()
+
+    def represent(value):
+        if not value:
+            return None
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            return value[:-6] + "Z"
+        return value
+
+    return represent
+
+
+def file_url(storage, request=None):
+    """FileField/ImageField output for a stored file name"""
+
+    def represent(name):
+        if not name:
+            return None
+        url = storage.url(name)
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+    return represent
+
+
+def row_reader(fields):
+    """
+    Compile (key, column, represent) triples into a function turning one
+    ``.values()`` row into a dict. represent is None for columns that are
+    returned as they are.
+    """
+    fields = tuple(fields)
+
+    def read(row):
+        return {
+            key: row[column] if represent is None else represent(row[column])
+            for key, column, represent in fields
+        }
+
+    return read
@@ -0,0 +1,174 @@
+import fcntl
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from pathlib import PurePosixPath
+from uuid import uuid4
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import UploadedFile
+
+BLOB_DIR = "blobs"
+STAGING_DIR = f"{BLOB_DIR}/.staging"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage that stores each distinct file once, named after the
+    SHA-256 of its content (``blobs/ab/<digest>.jpg``), whatever name it was
+    saved under. Saving content that already exists only bumps its reference
+    count; delete() drops a reference and removes the blob with the last one.
+
+    Counts live next to each blob in a ``.refs`` file guarded by flock, so
+    several workers can share the media volume. Names outside ``blobs/``
+    (uploads from before this storage, field defaults) are never deleted.
+    """
+
+    @staticmethod
+    def is_blob(name):
+        return PurePosixPath(name).parts[:1] == (BLOB_DIR,)
+
+    @staticmethod
+    def digest(content):
+        sha = hashlib.sha256()
+        if hasattr(content, "seek"):
+            content.seek(0)
+        for chunk in content.chunks():
+            sha.update(chunk)
+        if hasattr(content, "seek"):
+            content.seek(0)
+        return sha.hexdigest()
+
+    def blob_name(self, digest, name):
+        suffix = PurePosixPath(name).suffix.lower()
+        return f"{BLOB_DIR}/{digest[:2]}/{digest}{suffix}"
+
+    @contextmanager
+    def _references(self, name):
+        """Lock the blob's reference file and yield [count]; writes it back"""
+        path = Path(self.path(name) + ".refs")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # A concurrent delete may have unlinked the file we just locked.
+            if os.fstat(fd).st_nlink:
+                break
+            os.close(fd)
+        try:
+            count = [int(os.read(fd, 32) or 0)]
+            yield count
+            if count[0] > 0:
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, str(count[0]).encode())
+            else:
+                path.unlink()
+        finally:
+            os.close(fd)
+
+    def references(self, name):
+        if not self.is_blob(name):
+            return None
+        with self._references(name) as count:
+            return count[0]
+
+    def save(self, name, content, max_length=None, references=1):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        name = self.blob_name(self.digest(content), name)
+        with self._references(name) as count:
+            if not self.exists(name):
+                super()._save(name, content)
+            count[0] += references
+        return name
+
+    def stage(self, name, content_type=None, charset=None, content_type_extra=None):
+        """Start a StagedUpload that is written into this storage as it arrives"""
+        return StagedUpload(self, name, content_type, charset, content_type_extra)
+
+    def commit_staged(self, path, digest, name, references=1):
+        """Move a fully written staging file into the blob store"""
+        name = self.blob_name(digest, name)
+        with self._references(name) as count:
+            if not self.exists(name):
+                target = Path(self.path(name))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                path.replace(target)
+                if self.file_permissions_mode is not None:
+                    target.chmod(self.file_permissions_mode)
+            count[0] += references
+        return name
+
+    def adopt(self, name, references=1):
+        """
+        Copy a file stored under a plain name into the blob store, counting
+        references for each row that uses it, and return the blob name.
+        The original stays until delete_unmanaged() is called for it.
+        """
+        with self.open(name) as content:
+            return self.save(name, content, references=references)
+
+    def delete_unmanaged(self, name):
+        """Delete a file outside the blob store, which delete() leaves alone"""
+        if not self.is_blob(name):
+            super().delete(name)
+
+    def delete(self, name):
+        if not name or not self.is_blob(name):
+            return
+        with self._references(name) as count:
+            count[0] = max(count[0] - 1, 0)
+            if not count[0]:
+                super().delete(name)
+
+
+class StagedUpload(UploadedFile):
+    """
+    Upload streamed straight into a ContentAddressedStorage staging file,
+    hashed and sized chunk by chunk as it is written. commit() renames it into
+    the blob store without reading it again; close() removes the staging file
+    if it was never committed.
+    """
+
+    def __init__(self, storage, name, content_type, charset, content_type_extra):
+        self.storage = storage
+        self.staging_path = Path(storage.path(f"{STAGING_DIR}/{uuid4().hex}"))
+        self.staging_path.parent.mkdir(parents=True, exist_ok=True)
+        self._sha = hashlib.sha256()
+        super().__init__(
+            self.staging_path.open("w+b"),
+            name,
+            content_type,
+            0,
+            charset,
+            content_type_extra,
+        )
+
+    def write(self, data):
+        self._sha.update(data)
+        self.size += len(data)
+        return self.file.write(data)
+
+    def temporary_file_path(self):
+        return str(self.staging_path)
+
+    def commit(self, references=1):
+        """Add the upload to the blob store and return its blob name"""
+        self.file.flush()
+        return self.storage.commit_staged(
+            self.staging_path,
+            self._sha.hexdigest(),
+            self.name,
+            references=references,
+        )
+
+    def close(self):
+        try:
+            return self.file.close()
+        finally:
+            self.staging_path.unlink(missing_ok=True)
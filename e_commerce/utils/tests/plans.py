@@ -0,0 +1,79 @@
+"""
+Query plan checks for tests: capture the queries a block runs and EXPLAIN
+each one with sequential scans disabled, so the planner falls back to a
+sequential scan only where no index can serve the query.
+"""
+
+import json
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+SCANS = {"Seq Scan", "Index Scan", "Index Only Scan"}
+EXPLAINED = ("SELECT", "UPDATE", "DELETE")
+
+
+def explain(sql):
+    """JSON plan of sql, with enable_seqscan off for this statement only"""
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+        try:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.execute("RESET enable_seqscan")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def nodes(plan):
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from nodes(child)
+
+
+def full_scans(plan):
+    """
+    Nodes that read a whole table: sequential scans, and index scans that
+    only filter rows without an index condition.
+    """
+    return [
+        node
+        for node in nodes(plan)
+        if node["Node Type"] in SCANS
+        and (
+            node["Node Type"] == "Seq Scan"
+            or ("Filter" in node and "Index Cond" not in node)
+        )
+    ]
+
+
+@contextmanager
+def assert_indexed_queries():
+    """Fail if a query run inside the block has to scan a whole table"""
+    with CaptureQueriesContext(connection) as context:
+        yield context
+    failures = []
+    for query in context.captured_queries:
+        sql = query["sql"]
+        if not sql.lstrip().upper().startswith(EXPLAINED):
+            continue
+        for node in full_scans(explain(sql)):
+            failures.append(  # noqa: PERF401
+                f"{node['Node Type']} on {node.get('Relation Name')}"
+                f" ({node.get('Filter', 'no filter')}):\n  {sql}",
+            )
+    assert not failures, "Unindexed queries:\n" + "\n".join(failures)
+
+
+def used_indexes(queries):
+    """Names of the indexes the plans of the captured queries use"""
+    return {
+        node["Index Name"]
+        for query in queries.captured_queries
+        if query["sql"].lstrip().upper().startswith(EXPLAINED)
+        for node in nodes(explain(query["sql"]))
+        if "Index Name" in node
+    }
@@ -0,0 +1,43 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from e_commerce.users.models import User
+from e_commerce.utils import admin as admin_utils
+from e_commerce.utils.admin import EstimatedCountPaginator
+from e_commerce.utils.admin import estimated_count
+
+ROWS = 50
+
+
+@pytest.fixture
+def users(db):
+    User.objects.bulk_create(User(username=f"user{i}") for i in range(ROWS))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users_user")
+
+
+class TestEstimatedCount:
+    def test_whole_table_from_reltuples(self, users):
+        with CaptureQueriesContext(connection) as queries:
+            assert estimated_count(User.objects.all()) == ROWS
+        assert "reltuples" in queries[0]["sql"]
+
+    def test_filtered_from_explain(self, users):
+        estimate = estimated_count(User.objects.filter(username__startswith="user1"))
+        assert 0 < estimate <= ROWS
+
+    def test_small_counts_are_exact(self, users):
+        paginator = EstimatedCountPaginator(User.objects.order_by("id"), 10)
+        with CaptureQueriesContext(connection) as queries:
+            assert paginator.count == ROWS
+        assert "COUNT(" in queries[-1]["sql"]
+
+    def test_large_counts_are_estimated(self, users, monkeypatch):
+        monkeypatch.setattr(admin_utils, "EXACT_COUNT_LIMIT", 10)
+        User.objects.bulk_create(User(username=f"new{i}") for i in range(5))
+        paginator = EstimatedCountPaginator(User.objects.order_by("id"), 10)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert paginator.count == ROWS  # as of the last ANALYZE
+        assert not any("COUNT(" in query["sql"] for query in queries)
@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+import pytest
+from django.db import connection
+
+from e_commerce.users.models import User
+from e_commerce.utils.exports import Export
+from e_commerce.utils.exports import ExportRenderer
+
+ROWS = 5
+
+
+@pytest.fixture
+def users(db):
+    User.objects.bulk_create(
+        User(username=f"user{i}", name="" if i else 'Zoë, "the" first')
+        for i in range(ROWS)
+    )
+
+
+def user_export(chunk_size=2):
+    return Export(
+        "users",
+        User.objects.order_by("id"),
+        [
+            ("username", "username", None),
+            ("name", "name", str.upper),
+            ("tags", "username", lambda username: [username, "x"]),
+            ("last_login", "last_login", None),
+        ],
+        chunk_size=chunk_size,
+    )
+
+
+class TestExport:
+    def test_csv(self, users):
+        chunks = list(user_export().csv())
+
+        # Header, then chunks of two rows.
+        assert len(chunks) == 4  # noqa: PLR2004
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows[0] == ["username", "name", "tags", "last_login"]
+        assert rows[1] == ["user0", 'ZOË, "THE" FIRST', "user0|x", ""]
+        assert [row[0] for row in rows[1:]] == [f"user{i}" for i in range(ROWS)]
+
+    def test_ndjson(self, users):
+        chunks = list(user_export().ndjson())
+
+        assert len(chunks) == 3  # noqa: PLR2004
+        lines = b"".join(chunks).decode().splitlines()
+        assert json.loads(lines[1]) == {
+            "username": "user1",
+            "name": "",
+            "tags": ["user1", "x"],
+            "last_login": None,
+        }
+        assert len(lines) == ROWS
+
+    def test_reads_through_a_server_side_cursor(self, users):
+        chunks = user_export().ndjson()
+        next(chunks)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT is_holdable FROM pg_cursors")
+            assert cursor.fetchall() == [(False,)]
+        assert len(list(chunks)) == 2  # noqa: PLR2004
+
+    def test_response(self, users):
+        response = user_export().response("ndjson")
+
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert response["Content-Disposition"].startswith(
+            'attachment; filename="users-',
+        )
+        assert len(b"".join(response.streaming_content).splitlines()) == ROWS
+
+
+def test_errors_render_as_json():
+    assert ExportRenderer().render({"detail": "No."}) == b'{"detail":"No."}'
@@ -0,0 +1,34 @@
+import time
+import uuid
+
+from e_commerce.utils import ids
+from e_commerce.utils.ids import uuid7
+
+
+class TestUUID7:
+    def test_layout(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert value.version == 7  # noqa: PLR2004
+        assert value.variant == uuid.RFC_4122
+        assert before <= value.int >> 80 <= after + 1
+
+    def test_strictly_increasing(self):
+        values = [uuid7() for _ in range(10_000)]
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+        # Postgres compares uuids bytewise, like the string form.
+        assert [str(value) for value in values] == sorted(map(str, values))
+
+    def test_sequence_overflow_borrows_next_millisecond(self, monkeypatch):
+        frozen = time.time_ns() + 10**12
+        monkeypatch.setattr(ids.time, "time_ns", lambda: frozen)
+        monkeypatch.setattr(ids, "_last", [0, 0])
+
+        values = [uuid7() for _ in range(5000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+        assert values[-1].int >> 80 > frozen // 1_000_000
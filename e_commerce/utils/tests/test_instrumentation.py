@@ -0,0 +1,96 @@
+import json
+import logging
+
+import pytest
+import stripe
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.products.models import Product
+from e_commerce.users.models import User
+from e_commerce.utils.instrumentation import current_metrics
+from e_commerce.utils.instrumentation import install
+from e_commerce.utils.instrumentation import measure
+
+
+@pytest.fixture
+def products(seller):
+    Product.objects.bulk_create(
+        Product(name=f"P{i}", description="d", price=1, seller=seller) for i in range(3)
+    )
+
+
+class OfflineStripeClient(stripe.HTTPClient):
+    name = "offline"
+
+    def request(self, method, url, headers, post_data=None):
+        return "{}", 200, {}
+
+
+class TestMeasure:
+    def test_counts_queries_and_cache_lookups(self, db):
+        install()
+        cache.set("a", 1)
+        cache.set("none", None)
+
+        with measure() as metrics:
+            assert current_metrics() is metrics
+            list(User.objects.all())
+            assert cache.get("a") == 1
+            assert cache.get("none") is None
+            assert cache.get("missing", "fallback") == "fallback"
+            assert cache.get_many(["a", "missing"]) == {"a": 1}
+
+        assert current_metrics() is None
+        assert metrics.db_queries == 1
+        assert metrics.db_time > 0
+        assert (metrics.cache_hits, metrics.cache_misses) == (3, 2)
+        assert metrics.duration >= metrics.db_time
+
+    def test_times_stripe_calls(self):
+        install()
+        client = OfflineStripeClient()
+
+        with measure() as metrics:
+            client.request_with_retries("get", "https://api.stripe.com/v1/x", {})
+
+        assert metrics.stripe_calls == 1
+        assert metrics.stripe_time > 0
+        assert "stripe;dur=" in metrics.server_timing()
+
+
+class TestRequestMetricsMiddleware:
+    def test_sampled_requests(self, products, settings, caplog):
+        settings.REQUEST_METRICS_SAMPLE_RATE = 1
+
+        with caplog.at_level(logging.INFO, logger="e_commerce.request_metrics"):
+            response = APIClient().get(reverse("api:product-list"))
+
+        timing = response["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert "total;dur=" in timing
+        (log,) = caplog.records
+        record = json.loads(log.getMessage())
+        assert record == log.request_metrics
+        assert record["view"] == "api:product-list"
+        assert record["status"] == 200  # noqa: PLR2004
+        assert record["db_queries"] > 0
+        assert record["cache_misses"] > 0
+
+    def test_off(self, products, settings, caplog):
+        settings.REQUEST_METRICS_SAMPLE_RATE = 0
+
+        with caplog.at_level(logging.INFO, logger="e_commerce.request_metrics"):
+            response = APIClient().get(reverse("api:product-list"))
+
+        assert "Server-Timing" not in response
+        assert not caplog.records
+
+    def test_without_header(self, products, settings):
+        settings.REQUEST_METRICS_SAMPLE_RATE = 1
+        settings.REQUEST_METRICS_SERVER_TIMING = False
+
+        response = APIClient().get(reverse("api:product-list"))
+
+        assert "Server-Timing" not in response
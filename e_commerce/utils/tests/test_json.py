@@ -0,0 +1,83 @@
+import datetime
+import uuid
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnList
+
+from e_commerce.utils.parsers import OrjsonParser
+from e_commerce.utils.renderers import OrjsonRenderer
+
+UTC = datetime.UTC
+PAYLOADS = [
+    {"price": "10.50", "id": 1, "name": "Lamp", "tags": ["a", "b"], "none": None},
+    {"total": Decimal("30.10"), "count": Decimal(3)},
+    {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)},
+    {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)},
+    {"at": datetime.datetime(2024, 1, 2, 3, 4, 5)},  # noqa: DTZ001
+    {
+        "at": datetime.datetime(
+            2024,
+            1,
+            2,
+            tzinfo=datetime.timezone(datetime.timedelta(hours=4)),
+        ),
+    },
+    {"day": datetime.date(2024, 1, 2), "time": datetime.time(3, 4, 5, 6)},
+    {"took": datetime.timedelta(seconds=90)},
+    {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    {"text": 'Gr\u00fc\u00dfe \u2013 \u4fa1\u683c \u2028 \u2029 "quoted" \\ \n'},
+    {1: "int key", "nested": {2: [1.5, 0.1, -3, True, False]}},
+    {"detail": ErrorDetail("Not found.", code="not_found"), "lazy": _("Name")},
+    ReturnList([{"id": 1}, {"id": 2}], serializer=None),
+    {"big": 2**70, "tuple": (1, 2)},
+    [],
+    "plain",
+]
+
+
+class TestOrjsonRenderer:
+    @pytest.mark.parametrize("data", PAYLOADS)
+    def test_matches_json_renderer(self, data):
+        assert OrjsonRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_output_falls_back(self):
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=4"
+        assert OrjsonRenderer().render(data, media_type) == JSONRenderer().render(
+            data,
+            media_type,
+        )
+
+    def test_none_renders_empty(self):
+        assert OrjsonRenderer().render(None) == b""
+
+
+class TestOrjsonParser:
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"price": "10.50", "qty": 3, "ratio": 0.1, "items": [null, true]}',
+            '{"text": "Grüße \\u2028"}'.encode(),
+            b'{"big": 123456789012345678901234567890}',
+            b'"\\ud800"',
+        ],
+    )
+    def test_matches_json_parser(self, body):
+        assert OrjsonParser().parse(BytesIO(body)) == JSONParser().parse(
+            BytesIO(body),
+        )
+
+    @pytest.mark.parametrize("body", [b"{bad", b'{"a": NaN}'])
+    def test_errors_match_json_parser(self, body):
+        with pytest.raises(ParseError) as expected:
+            JSONParser().parse(BytesIO(body))
+        with pytest.raises(ParseError) as error:
+            OrjsonParser().parse(BytesIO(body))
+        assert str(error.value) == str(expected.value)
@@ -0,0 +1,177 @@
+import hashlib
+import hmac
+import json
+import os
+import subprocess
+import sys
+import time
+from decimal import Decimal
+
+import pytest
+from django.conf import settings as django_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from e_commerce.orders.api.views import StripeWebhookView
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.products.models import Product
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import User
+
+WEBHOOK_SECRET = "whsec_test"  # noqa: S105
+METRICS_TOKEN = "secret"  # noqa: S105
+
+
+@pytest.fixture
+def enabled(settings):
+    settings.PROMETHEUS_METRICS_ENABLED = True
+    settings.PROMETHEUS_METRICS_TOKEN = METRICS_TOKEN
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(f"ecommerce_{name}", labels) or 0
+
+
+def scrape(client=None, **headers):
+    headers = {"Authorization": f"Bearer {METRICS_TOKEN}", **headers}
+    response = (client or APIClient()).get("/metrics", headers=headers)
+    return response, response.content.decode()
+
+
+class TestMetricsEndpoint:
+    def test_disabled(self, db):
+        assert scrape()[0].status_code == 404  # noqa: PLR2004
+
+    def test_request_histograms(self, db, enabled):
+        before = sample(
+            "http_request_duration_seconds_count",
+            view="api:product-list",
+            method="GET",
+        )
+
+        APIClient().get(reverse("api:product-list"))
+
+        assert (
+            sample(
+                "http_request_duration_seconds_count",
+                view="api:product-list",
+                method="GET",
+            )
+            == before + 1
+        )
+        response, text = scrape()
+        assert response.status_code == 200  # noqa: PLR2004
+        assert 'ecommerce_http_request_db_queries_bucket{le="0.0",view=' in text
+        assert "ecommerce_cache_lookups_total" in text
+        assert 'ecommerce_db_connections_open{alias="default"}' in text
+
+    def test_token(self, db, enabled):
+        assert scrape(Authorization="")[0].status_code == 401  # noqa: PLR2004
+        assert scrape(Authorization="Bearer wrong")[0].status_code == 401  # noqa: PLR2004
+        assert scrape()[0].status_code == 200  # noqa: PLR2004
+
+    def test_not_served_without_token(self, db, enabled, settings):
+        settings.PROMETHEUS_METRICS_TOKEN = ""
+        assert scrape()[0].status_code == 404  # noqa: PLR2004
+
+    @pytest.mark.parametrize("worker_dir", ["", "importworker"])
+    def test_aggregates_worker_processes(
+        self,
+        db,
+        enabled,
+        tmp_path,
+        monkeypatch,
+        worker_dir,
+    ):
+        script = (
+            "import django; django.setup(); "
+            "from e_commerce.utils.prometheus import SELLER_PAYOUTS; "
+            "SELLER_PAYOUTS.labels('failed').inc(2)"
+        )
+        # A web worker, and one writing where the workers would be put.
+        for directory in (tmp_path, tmp_path / worker_dir):
+            directory.mkdir(exist_ok=True)
+            env = {
+                **os.environ,
+                "PROMETHEUS_MULTIPROC_DIR": str(directory),
+                "PYTHONPATH": os.pathsep.join(
+                    [str(django_settings.BASE_DIR), *sys.path],
+                ),
+            }
+            subprocess.run([sys.executable, "-c", script], env=env, check=True)  # noqa: S603
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        text = scrape()[1]
+
+        assert 'ecommerce_seller_payouts_total{status="failed"} 4.0' in text
+
+
+class TestHotPathCounters:
+    def test_failed_payouts(self, seller, settings):
+        settings.STRIPE_SECRET_KEY = ""
+        seller.stripe_account_id = "acct_1"
+        seller.save()
+        user = User.objects.create_user(username="buyer")
+        order = Order.objects.create(
+            customer=Customer.objects.create(user=user),
+            total_amount=10,
+            platform_commission=0,
+            shipping_address=Address.objects.create(
+                user=user,
+                street="1 Rd",
+                city="Town",
+                country="Land",
+                postal_code="1",
+            ),
+        )
+        OrderItem.objects.create(
+            order=order,
+            product=Product.objects.create(
+                name="Lamp",
+                description="d",
+                price=10,
+                seller=seller,
+            ),
+            seller=seller,
+            price_at_time=10,
+            seller_payout_amount=Decimal(9),
+        )
+        before = sample("seller_payouts_total", status="failed")
+
+        StripeWebhookView().process_seller_payouts(order)
+
+        assert sample("seller_payouts_total", status="failed") == before + 1
+
+    def test_webhook_lag(self, db, settings):
+        settings.STRIPE_WEBHOOK_SECRET = WEBHOOK_SECRET
+        labels = {"event_type": "payment_intent.canceled"}
+        before = sample("stripe_webhook_lag_seconds_count", **labels)
+        now = int(time.time())
+        payload = json.dumps(
+            {
+                "id": "evt_1",
+                "object": "event",
+                "type": "payment_intent.canceled",
+                "created": now - 30,
+                "data": {"object": {"id": "pi_missing"}},
+            },
+        )
+        signature = hmac.new(
+            WEBHOOK_SECRET.encode(),
+            f"{now}.{payload}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        response = APIClient().post(
+            reverse("stripe-webhook"),
+            payload,
+            content_type="application/json",
+            headers={"Stripe-Signature": f"t={now},v1={signature}"},
+        )
+
+        assert response.status_code == 200  # noqa: PLR2004
+        assert sample("stripe_webhook_lag_seconds_count", **labels) == before + 1
+        assert sample("stripe_webhook_lag_seconds_sum", **labels) >= 30  # noqa: PLR2004
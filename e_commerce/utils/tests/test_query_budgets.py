@@ -0,0 +1,465 @@
+"""
+Query budgets of the API endpoints in config/api_router.py and
+orders/api/urls.py.
+
+Every endpoint is called against realistic data seeded at page sizes 1, 10
+and 100: sellers with multi-image, multi-category products, and orders
+with items from several sellers. The number of queries it runs must not
+grow with the page size, and must stay within its budget in BUDGETS.
+Requests are authenticated with force_authenticate, so the budgets leave
+out the user lookup of JWT authentication; savepoints are not counted.
+Lower a budget when a change makes an endpoint cheaper.
+"""
+
+import uuid
+from datetime import timedelta
+from http import HTTPStatus
+from types import SimpleNamespace
+from typing import Any
+from typing import NamedTuple
+
+import pytest
+import stripe
+from django.core.cache import cache
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.pagination import CursorPagination
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIClient
+
+from config import api_router
+from e_commerce.cart.models import Cart
+from e_commerce.cart.models import CartItem
+from e_commerce.orders.api import urls as payment_urls
+from e_commerce.orders.models import ArchivedOrder
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.orders.models import Payment
+from e_commerce.orders.models import SellerPayout
+from e_commerce.orders.services.archive import OrderArchive
+from e_commerce.orders.services.earnings import EarningsLedger
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.products.models import ProductImport
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+
+PAGE_SIZES = (1, 10, 100)
+SELLERS = 3
+IMAGES_PER_PRODUCT = 2
+CATEGORIES_PER_PRODUCT = 2
+UNCOUNTED = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class Budget(NamedTuple):
+    route: str
+    method: str
+    # buyer (a customer), seller, or None for anonymous requests.
+    user: str | None
+    queries: int
+    # (seed, page size) -> reverse() kwargs, query params and request body.
+    request: Any = None
+    # Expected response status, so budgets are never taken on error paths.
+    status: int = HTTPStatus.OK
+
+
+def call(kwargs=None, params=None, data=None):
+    return {"kwargs": kwargs or {}, "params": params or {}, "data": data}
+
+
+BUDGETS = [
+    # users
+    Budget("api:user-list", "get", "buyer", 2),
+    Budget("api:user-me", "get", "buyer", 0),
+    Budget(
+        "api:user-detail",
+        "get",
+        "buyer",
+        1,
+        lambda seed, size: call({"username": "buyer"}),
+    ),
+    Budget("api:customer-list", "get", "buyer", 3),
+    Budget("api:customer-me", "get", "buyer", 1),
+    Budget("api:customer-my-orders", "get", "buyer", 3),
+    Budget(
+        "api:customer-detail",
+        "get",
+        "buyer",
+        2,
+        lambda seed, size: call({"user__username": "buyer"}),
+    ),
+    Budget("api:seller-list", "get", "seller", 3),
+    Budget("api:seller-me", "get", "seller", 1),
+    Budget(
+        "api:seller-detail",
+        "get",
+        "seller",
+        2,
+        lambda seed, size: call({"user__username": "seller"}),
+    ),
+    Budget("api:seller-orders", "get", "seller", 2),
+    Budget("api:seller-analytics", "get", "seller", 2),
+    Budget("api:seller-total-earnings", "get", "seller", 2),
+    Budget(
+        "api:seller-product-earnings",
+        "get",
+        "seller",
+        2,
+        lambda seed, size: call(params={"product_id": seed.product.pk}),
+    ),
+    Budget(
+        "api:seller-update-order-item-status",
+        "patch",
+        "seller",
+        9,
+        lambda seed, size: call(
+            params={"order_item_id": seed.order_item.pk},
+            data={"seller_status": "shipped"},
+        ),
+    ),
+    Budget("api:seller-export-orders", "get", "seller", 2),
+    Budget("api:seller-export-payouts", "get", "seller", 2),
+    Budget(
+        "api:customer-addresses-list",
+        "get",
+        "buyer",
+        3,
+        lambda seed, size: call({"nested_1_user__username": "buyer"}),
+    ),
+    Budget(
+        "api:customer-addresses-detail",
+        "get",
+        "buyer",
+        2,
+        lambda seed, size: call(
+            {"nested_1_user__username": "buyer", "pk": seed.buyer_address.pk},
+        ),
+    ),
+    Budget(
+        "api:seller-addresses-list",
+        "get",
+        "seller",
+        3,
+        lambda seed, size: call({"nested_1_user__username": "seller"}),
+    ),
+    Budget(
+        "api:seller-addresses-detail",
+        "get",
+        "seller",
+        2,
+        lambda seed, size: call(
+            {"nested_1_user__username": "seller", "pk": seed.seller_address.pk},
+        ),
+    ),
+    # products
+    Budget("api:product-list", "get", None, 4),
+    Budget(
+        "api:product-detail",
+        "get",
+        None,
+        6,
+        lambda seed, size: call({"id": seed.product.pk}),
+    ),
+    Budget(
+        "api:product-detail",
+        "patch",
+        "seller",
+        9,
+        lambda seed, size: call({"id": seed.product.pk}, data={"name": "Renamed"}),
+    ),
+    Budget("api:product-my-products", "get", "seller", 5),
+    Budget("api:product-export", "get", "seller", 2),
+    Budget(
+        "api:product-bulk-update",
+        "post",
+        "seller",
+        3,
+        lambda seed, size: call(
+            data=[
+                {"id": product.pk, "price": "1.99", "available_quantity": 4}
+                for product in seed.products[:size]
+            ],
+        ),
+    ),
+    Budget("api:product-import-list", "get", "seller", 3),
+    Budget(
+        "api:product-import-detail",
+        "get",
+        "seller",
+        2,
+        lambda seed, size: call({"pk": seed.product_import.pk}),
+    ),
+    Budget("api:category-list", "get", None, 2),
+    Budget(
+        "api:category-detail",
+        "get",
+        None,
+        1,
+        lambda seed, size: call({"id": seed.category.pk}),
+    ),
+    # cart
+    Budget("api:cart-list", "get", "buyer", 5),
+    Budget(
+        "api:cart-add-to-cart",
+        "post",
+        "buyer",
+        5,
+        lambda seed, size: call(data={"product_id": seed.product.pk}),
+    ),
+    Budget(
+        "api:cart-update-quantity",
+        "patch",
+        "buyer",
+        4,
+        lambda seed, size: call(data={"product_id": seed.product.pk, "quantity": 3}),
+    ),
+    Budget(
+        "api:cart-remove-item",
+        "delete",
+        "buyer",
+        4,
+        lambda seed, size: call(data={"product_id": seed.product.pk}),
+    ),
+    # orders
+    Budget("api:order-list", "get", "buyer", 3),
+    Budget(
+        "api:order-list",
+        "post",
+        "buyer",
+        23,
+        lambda seed, size: call(data={"shipping_address": seed.buyer_address.pk}),
+        status=HTTPStatus.CREATED,
+    ),
+    Budget(
+        "api:order-detail",
+        "get",
+        "buyer",
+        3,
+        lambda seed, size: call({"pk": seed.order.pk}),
+    ),
+    Budget(
+        "api:order-by-number",
+        "get",
+        "buyer",
+        3,
+        lambda seed, size: call({"order_number": seed.order.order_number}),
+    ),
+    Budget("api:order-archived", "get", "buyer", 2),
+]
+
+# Routes without a budget, and why.
+UNBUDGETED = {
+    "api:seller-connect-stripe": "needs the Stripe API",
+    "api:order-checkout": "needs the Stripe API",
+    "orders:confirm_payment": "needs the Stripe API",
+    # These compare Order.customer with request.user, a User rather than a
+    # Customer, so they turn every buyer away before doing any work.
+    "orders:create_payment_intent": "rejects every buyer, then needs Stripe",
+    "orders:get_order_payment_status": "rejects every buyer",
+    "orders:process_refund": "rejects every buyer, then needs Stripe",
+}
+
+
+def seed_data(size):
+    """
+    Sellers with size products each, every product with images and
+    categories; a customer with size orders spanning all sellers, their
+    payments and payouts, a cart, addresses and archived orders.
+    """
+    buyer = User.objects.create_user(username="buyer")
+    customer = Customer.objects.create(user=buyer)
+    sellers = [
+        Seller.objects.create(
+            user=User.objects.create_user(username="seller" if i == 0 else f"s{i}"),
+        )
+        for i in range(SELLERS)
+    ]
+    addresses = Address.objects.bulk_create(
+        Address(
+            user=user,
+            street=f"{i} Rd",
+            city="Town",
+            country="Land",
+            postal_code="1",
+        )
+        for user in (buyer, sellers[0].user)
+        for i in range(size)
+    )
+    categories = Category.objects.bulk_create(
+        Category(name=f"Category {i}") for i in range(max(size, CATEGORIES_PER_PRODUCT))
+    )
+    products = Product.objects.bulk_create(
+        Product(
+            name=f"Product {i}",
+            description="A realistic product description.",
+            price=10 + i,
+            available_quantity=50,
+            seller=seller,
+        )
+        for seller in sellers
+        for i in range(size)
+    )
+    ProductImage.objects.bulk_create(
+        ProductImage(product=product, image=f"product_images/{product.pk}-{i}.jpg")
+        for product in products
+        for i in range(IMAGES_PER_PRODUCT)
+    )
+    Product.categories.through.objects.bulk_create(
+        Product.categories.through(product=product, category=category)
+        for product in products
+        for category in categories[:CATEGORIES_PER_PRODUCT]
+    )
+    by_seller = [products[i * size : (i + 1) * size] for i in range(SELLERS)]
+
+    orders = Order.objects.bulk_create(
+        Order(
+            customer=customer,
+            total_amount=60,
+            platform_commission=6,
+            shipping_address=addresses[0],
+            payment_status="succeeded",
+        )
+        for _ in range(size)
+    )
+    items = OrderItem.objects.bulk_create(
+        OrderItem(
+            order=order,
+            product=by_seller[s][i],
+            seller=sellers[s],
+            quantity=2,
+            price_at_time=by_seller[s][i].price,
+            seller_payout_amount=by_seller[s][i].price * 2 - 2,
+        )
+        for i, order in enumerate(orders)
+        for s in range(SELLERS)
+    )
+    SellerPayout.objects.bulk_create(
+        SellerPayout(
+            seller=item.seller,
+            order_item=item,
+            amount=item.seller_payout_amount,
+            stripe_transfer_id=f"tr_{item.pk}",
+            status="succeeded",
+        )
+        for item in items
+    )
+    Payment.objects.bulk_create(
+        Payment(order=order, stripe_payment_intent_id=f"pi_{order.pk}", amount=60)
+        for order in orders
+    )
+    EarningsLedger.rebuild()
+
+    archived_at = timezone.now() - timedelta(days=400)
+    OrderArchive.ensure_partition(archived_at)
+    ArchivedOrder.objects.bulk_create(
+        ArchivedOrder(
+            id=uuid.uuid4(),
+            order_number=f"ARCHIVED-{i}",
+            customer=customer,
+            created_at=archived_at - timedelta(minutes=i),
+            archived_at=archived_at,
+            document={"order_number": f"ARCHIVED-{i}", "items": []},
+        )
+        for i in range(size)
+    )
+    cart = Cart.objects.create(customer=customer)
+    CartItem.objects.bulk_create(
+        CartItem(cart=cart, product=seller_products[0], quantity=1)
+        for seller_products in by_seller
+    )
+    imports = ProductImport.objects.bulk_create(
+        ProductImport(seller=sellers[0], file=f"product_imports/{i}.csv", format="csv")
+        for i in range(size)
+    )
+
+    order = Order.objects.get(pk=orders[0].pk)
+    return SimpleNamespace(
+        users={"buyer": buyer, "seller": sellers[0].user},
+        order=order,
+        order_item=OrderItem.objects.get(order=order, seller=sellers[0]),
+        product=by_seller[0][0],
+        products=by_seller[0],
+        category=categories[0],
+        buyer_address=addresses[0],
+        seller_address=addresses[size],
+        product_import=imports[0],
+    )
+
+
+def count_queries(budget, size, monkeypatch):
+    """Seed at size, call the endpoint with that page size and count"""
+    cache.clear()
+    seed = seed_data(size)
+    request = (budget.request or (lambda seed, size: call()))(seed, size)
+    client = APIClient()
+    if budget.user:
+        client.force_authenticate(user=seed.users[budget.user])
+    url = reverse(budget.route, kwargs=request["kwargs"])
+    if request["params"]:
+        url = f"{url}?{'&'.join(f'{k}={v}' for k, v in request['params'].items())}"
+
+    with monkeypatch.context() as patch:
+        patch.setattr(PageNumberPagination, "page_size", size)
+        patch.setattr(CursorPagination, "page_size", size)
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(client, budget.method)(
+                url,
+                request["data"],
+                format="json",
+            )
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+    assert response.status_code == budget.status, response.content
+    return sum(1 for query in queries if not query["sql"].startswith(UNCOUNTED))
+
+
+def routes():
+    """Names of the routes registered by both URL modules"""
+    return {
+        f"{namespace}:{pattern.name}"
+        for namespace, patterns in (
+            ("api", api_router.urlpatterns),
+            ("orders", payment_urls.urlpatterns),
+        )
+        for pattern in patterns
+        if isinstance(pattern, URLPattern) and pattern.name
+    }
+
+
+def test_every_route_has_a_budget():
+    budgeted = {budget.route for budget in BUDGETS}
+    missing = routes() - budgeted - set(UNBUDGETED)
+    assert not missing, f"Add these routes to BUDGETS: {sorted(missing)}"
+    assert not budgeted & set(UNBUDGETED)
+
+
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.parametrize(
+    "budget",
+    BUDGETS,
+    ids=[f"{budget.method.upper()} {budget.route}" for budget in BUDGETS],
+)
+def test_query_budget(budget, monkeypatch):
+    # An endpoint that starts calling Stripe fails instead of going online.
+    monkeypatch.setattr(stripe, "api_key", None)
+    counts = {}
+    for size in PAGE_SIZES:
+        with transaction.atomic():
+            counts[size] = count_queries(budget, size, monkeypatch)
+            transaction.set_rollback(True)
+
+    assert len(set(counts.values())) == 1, (
+        f"{budget.route} queries grow with the page size: {counts}"
+    )
+    assert counts[PAGE_SIZES[0]] <= budget.queries, (
+        f"{budget.route} ran {counts[PAGE_SIZES[0]]} queries, "
+        f"its budget is {budget.queries}"
+    )
@@ -0,0 +1,151 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from e_commerce.orders.api.views import StripeWebhookView
+from e_commerce.orders.models import Order
+from e_commerce.orders.models import OrderItem
+from e_commerce.products.models import Category
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.users.models import Address
+from e_commerce.users.models import Customer
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.utils.tests.plans import assert_indexed_queries
+from e_commerce.utils.tests.plans import used_indexes
+
+PRODUCTS = 2000
+ORDERS = 400
+PEOPLE = 20
+
+
+@pytest.fixture
+def seeded(db):
+    """
+    Enough rows, with fresh statistics, that the planner picks an index
+    whenever a selective one exists rather than scanning a tiny table.
+    """
+    sellers = [
+        Seller.objects.create(user=User.objects.create_user(username=f"seller{i}"))
+        for i in range(PEOPLE)
+    ]
+    customers = [
+        Customer.objects.create(user=User.objects.create_user(username=f"buyer{i}"))
+        for i in range(PEOPLE)
+    ]
+    addresses = [
+        Address.objects.create(
+            user=customer.user,
+            street="1 Rd",
+            city="Town",
+            country="Land",
+            postal_code="1",
+        )
+        for customer in customers
+    ]
+    category = Category.objects.create(name="Lamps")
+    products = Product.objects.bulk_create(
+        Product(
+            name=f"Product {i}",
+            description="desc",
+            price=i,
+            seller=sellers[i % PEOPLE],
+        )
+        for i in range(PRODUCTS)
+    )
+    ProductImage.objects.bulk_create(
+        ProductImage(product=product, image=f"product_images/{product.pk}.jpg")
+        for product in products
+    )
+    Product.categories.through.objects.bulk_create(
+        Product.categories.through(product=product, category=category)
+        for product in products
+    )
+    orders = Order.objects.bulk_create(
+        Order(
+            customer=customers[i % PEOPLE],
+            total_amount=10,
+            platform_commission=0,
+            shipping_address=addresses[i % PEOPLE],
+            stripe_payment_intent_id=f"pi_{i}",
+        )
+        for i in range(ORDERS)
+    )
+    OrderItem.objects.bulk_create(
+        OrderItem(
+            order=order,
+            product=product,
+            seller=product.seller,
+            price_at_time=5,
+            seller_payout_amount=5,
+        )
+        for i, order in enumerate(orders)
+        for product in products[i * 2 : i * 2 + 2]
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return {"sellers": sellers, "customers": customers}
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+class TestIndexedAccessPaths:
+    def test_webhook_lookup(self, seeded):
+        with assert_indexed_queries() as queries:
+            StripeWebhookView().handle_payment_failed({"id": "pi_3"})
+        assert "order_payment_intent_idx" in used_indexes(queries)
+
+    @pytest.mark.parametrize(
+        "url_name",
+        ["api:order-list", "api:customer-my-orders"],
+    )
+    def test_customer_orders(self, seeded, url_name):
+        client = client_for(seeded["customers"][0].user)
+        with assert_indexed_queries() as queries:
+            response = client.get(reverse(url_name), {"page_size": 5})
+        assert response.status_code == 200  # noqa: PLR2004
+        assert "order_customer_created_idx" in used_indexes(queries)
+
+    def test_order_by_number(self, seeded):
+        order = Order.objects.filter(customer=seeded["customers"][0]).first()
+        client = client_for(seeded["customers"][0].user)
+        url = reverse(
+            "api:order-by-number",
+            kwargs={"order_number": order.order_number},
+        )
+        with assert_indexed_queries():
+            assert client.get(url).status_code == 200  # noqa: PLR2004
+
+    def test_seller_order_feed(self, seeded):
+        client = client_for(seeded["sellers"][0].user)
+        with assert_indexed_queries() as queries:
+            response = client.get(reverse("api:seller-orders"), {"page_size": 5})
+        assert response.status_code == 200  # noqa: PLR2004
+        assert "orderitem_seller_created_idx" in used_indexes(queries)
+
+    def test_seller_products(self, seeded):
+        client = client_for(seeded["sellers"][0].user)
+        with assert_indexed_queries() as queries:
+            response = client.get(reverse("api:product-my-products"))
+        assert response.status_code == 200  # noqa: PLR2004
+        assert "product_seller_created_idx" in used_indexes(queries)
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"min_price": 10, "max_price": 20},
+            {"min_price": PRODUCTS - 50, "ordering": "price"},
+            {"max_price": 5, "view": "card"},
+        ],
+    )
+    def test_product_price_filters(self, seeded, params):
+        with assert_indexed_queries() as queries:
+            response = APIClient().get(reverse("api:product-list"), params)
+        assert response.status_code == 200  # noqa: PLR2004
+        assert "product_price_idx" in used_indexes(queries)
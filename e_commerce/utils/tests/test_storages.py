@@ -0,0 +1,104 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+
+from e_commerce.products.models import Product
+from e_commerce.products.models import ProductImage
+from e_commerce.users.models import Seller
+from e_commerce.users.models import User
+from e_commerce.utils.storages import ContentAddressedStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return ContentAddressedStorage(location=tmp_path)
+
+
+class TestContentAddressedStorage:
+    def test_identical_content_is_stored_once(self, storage):
+        first = storage.save("product_images/a.JPG", ContentFile(b"photo"))
+        second = storage.save("profile_pictures/b.jpg", ContentFile(b"photo"))
+
+        assert first == second
+        assert first.startswith("blobs/")
+        assert first.endswith(".jpg")
+        assert storage.references(first) == 2  # noqa: PLR2004
+        assert storage.open(first).read() == b"photo"
+
+    def test_different_content_gets_different_names(self, storage):
+        first = storage.save("a.jpg", ContentFile(b"one"))
+        second = storage.save("a.jpg", ContentFile(b"two"))
+        assert first != second
+
+    def test_delete_removes_blob_with_last_reference(self, storage):
+        name = storage.save("a.jpg", ContentFile(b"photo"))
+        storage.save("b.jpg", ContentFile(b"photo"))
+
+        storage.delete(name)
+        assert storage.exists(name)
+        assert storage.references(name) == 1
+
+        storage.delete(name)
+        assert not storage.exists(name)
+        assert storage.references(name) == 0
+
+        # Saving again after removal starts from scratch.
+        assert storage.save("c.jpg", ContentFile(b"photo")) == name
+        assert storage.references(name) == 1
+
+    def test_plain_names_are_never_deleted(self, storage):
+        FileSystemStorage(location=storage.location).save(
+            "profile_pictures/default.jpg",
+            ContentFile(b"default"),
+        )
+        storage.delete("profile_pictures/default.jpg")
+        assert storage.exists("profile_pictures/default.jpg")
+
+
+class TestMediaLifecycle:
+    @pytest.fixture
+    def product(self, db):
+        seller = Seller.objects.create(user=User.objects.create_user(username="s"))
+        return Product.objects.create(
+            name="Product",
+            description="desc",
+            price=10,
+            seller=seller,
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_deleting_images_releases_shared_blob(self, product):
+        first = ProductImage.objects.create(
+            product=product,
+            image=ContentFile(b"photo", name="a.jpg"),
+        )
+        second = ProductImage.objects.create(
+            product=product,
+            image=ContentFile(b"photo", name="b.jpg"),
+        )
+        storage = first.image.storage
+        name = first.image.name
+        assert second.image.name == name
+
+        first.delete()
+        assert storage.exists(name)
+        second.delete()
+        assert not storage.exists(name)
+
+    def test_deduplicate_media_moves_legacy_files(self, product):
+        plain = FileSystemStorage()
+        for legacy in ("product_images/a.jpg", "product_images/b.jpg"):
+            plain.save(legacy, ContentFile(b"photo"))
+            ProductImage.objects.create(product=product, image=legacy)
+
+        call_command("deduplicate_media")
+
+        names = set(ProductImage.objects.values_list("image", flat=True))
+        assert len(names) == 1
+        (name,) = names
+        storage = ProductImage._meta.get_field("image").storage  # noqa: SLF001
+        assert storage.references(name) == 2  # noqa: PLR2004
+        assert not plain.exists("product_images/a.jpg")
+        # The profile picture default is left where it is.
+        assert User.objects.get().profile_picture.name == "profile_pictures/default.jpg"
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import FilterBar from './components/FilterBar';
+import ProductPicture from './components/ProductPicture';
 import { getProducts } from './services/api';
 import './styles/common.css';
 import './styles/ProductList.css';
@@ -51,7 +52,7 @@ function ProductList() {
         <div className="products-grid">
           {products.map((product) => (
             <Link to={`/product/${product.id}`} key={product.id} className="product-card">
-              <img src={product.images[0]?.image} alt={product.name} className="product-image" />
+              <ProductPicture image={product.images[0]} alt={product.name} className="product-image" />
               <div className="product-info">
                 <h3 className="product-name">{product.name}</h3>
                 <p className="product-price">${Number(product.price).toFixed(2)}</p>
@@ -18,10 +18,10 @@ function CustomerOrders() {
           headers: { 'Authorization': `Bearer ${token}` }
         });
         if (!response.ok) throw new Error('Failed to fetch orders');
-        const data = await response.json();
-        setOrders(data);
+        const { results } = await response.json();
+        setOrders(results);
         // After orders are fetched, get unique product IDs
-        const productIds = Array.from(new Set(data.flatMap(order => order.items.map(item => item.product))));
+        const productIds = Array.from(new Set(results.flatMap(order => order.items.map(item => item.product))));
         // Fetch product details in parallel
         const productFetches = productIds.map(async (id) => {
           try {
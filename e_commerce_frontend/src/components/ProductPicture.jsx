@@ -0,0 +1,24 @@
+const SOURCE_TYPES = {
+  avif: 'image/avif',
+  webp: 'image/webp',
+};
+
+// Renders the first product image, preferring the precomputed renditions
+// (`srcset` map from the API) and falling back to the original upload.
+function ProductPicture({ image, alt, className, sizes = '(max-width: 600px) 50vw, 300px' }) {
+  if (!image) return null;
+  const srcset = image.srcset || {};
+
+  return (
+    <picture>
+      {Object.entries(SOURCE_TYPES).map(([format, type]) =>
+        srcset[format] ? (
+          <source key={format} type={type} srcSet={srcset[format]} sizes={sizes} />
+        ) : null
+      )}
+      <img src={image.image} alt={alt} className={className} loading="lazy" />
+    </picture>
+  );
+}
+
+export default ProductPicture;
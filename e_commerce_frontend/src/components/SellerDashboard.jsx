@@ -29,7 +29,7 @@ function SellerDashboard() {
         });
         if (!response.ok) throw new Error('Failed to fetch orders');
         const data = await response.json();
-        setOrders(data);
+        setOrders(data.results);
       } catch (err) {
         setError(err.message || 'Failed to fetch orders');
       } finally {
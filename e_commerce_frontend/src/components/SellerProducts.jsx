@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { getMyProducts } from '../services/api';
+import ProductPicture from './ProductPicture';
 import '../styles/ProductList.css';
 
 function SellerProducts() {
@@ -35,7 +36,7 @@ function SellerProducts() {
         ) : (
           products.map((product) => (
             <Link to={`/seller/product-details/${product.id}`} key={product.id} className="product-card">
-              <img src={product.images[0]?.image} alt={product.name} className="product-image" />
+              <ProductPicture image={product.images[0]} alt={product.name} className="product-image" />
               <div className="product-info">
                 <h3 className="product-name">{product.name}</h3>
                 <p className="product-price">${Number(product.price).toFixed(2)}</p>
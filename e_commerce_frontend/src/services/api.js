@@ -1,7 +1,8 @@
 const API_URL = 'http://localhost:8000/api';
 
 export const getProducts = async (filters = {}) => {
-  const queryParams = new URLSearchParams();
+  // Card rows: description summary and first image only.
+  const queryParams = new URLSearchParams({ view: 'card' });
 
   // Add filters to query parameters
   Object.entries(filters).forEach(([key, value]) => {
@@ -311,7 +312,7 @@ export const createProduct = async (productData, allCategories) => {
 export const getMyProducts = async () => {
   const token = localStorage.getItem('token');
   if (!token) throw new Error('No authentication token found');
-  const response = await fetch(`${API_URL}/products/my_products/`, {
+  const response = await fetch(`${API_URL}/products/my_products/?view=card`, {
     headers: {
       'Authorization': `Bearer ${token}`
     }